@@ -1,17 +1,87 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException
-from app.core.db import save_meeting_summary, init_database
-from app.services.ai_service import process_audio_and_generate_summary 
-from app.models import MeetingResponse
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Request, Query
+from fastapi.responses import JSONResponse, StreamingResponse
+from app.core.db import (
+    save_meeting_summary, get_meeting_summary, get_meeting_utterances, run_db, search_meetings,
+    get_action_items, get_action_item_assignees, update_action_item_status, get_decisions
+)
+from app.core.action_items import ACTION_ITEM_STATUSES
+from app.core.cache import get_cache_stats
+from app.services.ai_service import process_audio_and_generate_summary_async, meeting_response
+from app.services.transcription_service import TranscriptionCancelledError, TranscriptionTimeoutError, ASR_SERVICE_NAME
+from app.services.upload_service import spool_upload, UploadTooLargeError, UPLOAD_TEMP_DIR
+from app.services.job_service import get_job, JobQueueFullError
+from app.services.pipeline_service import submit_pipeline_job, retry_pipeline_job, get_pipeline_job_status, PipelineJobNotRetryableError
+from app.services.chat_service import answer_meeting_question
+from app.services.rate_limiter import get_rate_limiter_stats
+from app.services.batch_service import summarize_batch, resolve_import_path, BatchPathError, BATCH_MAX_FILES
+from app.services.live_session_service import (
+    create_session, get_session, add_chunk, finish_session,
+    LiveSessionLimitError, LiveSessionNotFoundError, LiveChunkError
+)
+from app.core.metrics import UPLOAD_SECONDS, UPLOAD_BYTES, ERRORS, REQUESTS_IN_PROGRESS
+from app.models import (
+    MeetingResponse, JobResponse, JobStatusResponse, SearchResponse, ChatRequest, ChatResponse, BatchResponse, UtterancesResponse,
+    LiveSessionResponse, ActionItemsResponse, ActionItemRecord, ActionItemUpdate, AssigneeCount, DecisionsResponse
+)
+import asyncio
+import json
 import uuid
 import os
+import time
+import logging
+from typing import List
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
+SSE_KEEPALIVE_SECONDS = 15
+
 router = APIRouter()
-init_database()
 
-@router.post("/summarize", response_model=MeetingResponse)
-async def summarize_meeting(audio: UploadFile = File(...)):
+def _cleanup(file_path: str):
+    if os.path.exists(file_path):
+        os.remove(file_path)
+        logger.debug("Temp file cleaned up: %s", file_path)
 
+def _finish_meeting(filename: str, result: dict, progress=None) -> dict:
+    """Persist a pipeline result and build the MeetingResponse payload"""
+    transcript = result["transcript"]
+    summary_data = result["summary"]
+    
+    if result.get("transcript_cached"):
+        logger.info("Transcript served from cache - transcription skipped")
+    elif "[FALLBACK]" in transcript:
+        logger.warning("Transcription service unavailable - using fallback")
+    else:
+        logger.info("Transcription completed: %d characters", len(transcript))
+    
+    if progress is not None:
+        progress("saving")
+    meeting_id = save_meeting_summary(filename, transcript, summary_data, ASR_SERVICE_NAME, result.get("utterances"))
+    if progress is not None:
+        progress("saved", meeting_id=meeting_id)
+    
+    return meeting_response(meeting_id, filename, transcript, summary_data, result.get("metadata"))
+
+async def _process_meeting_async(file_path: str, filename: str, audio_hash: str = None, is_disconnected=None, progress=None, on_token=None) -> dict:
+    """Transcribe, summarize and save an upload, then delete it; transcription stops if the client disconnects"""
+    try:
+        logger.info("Starting transcription and summary generation for %s", filename)
+        result = await process_audio_and_generate_summary_async(
+            file_path, audio_hash=audio_hash, progress=progress, is_disconnected=is_disconnected, on_token=on_token
+        )
+        return await run_db(_finish_meeting, filename, result, progress)
+    finally:
+        _cleanup(file_path)
+
+def _job_urls(job_id: str) -> dict:
+    return {
+        "status_url": f"/meeting/jobs/{job_id}",
+        "result_url": f"/meeting/jobs/{job_id}/result"
+    }
+
+async def _save_upload(audio: UploadFile) -> tuple:
+    """Validate the extension and spool an upload to a temp file; return (path, size, sha256)"""
     allowed_extensions = {'.mp3', '.wav', '.m4a', '.ogg', '.flac', '.mpeg'}
     file_extension = os.path.splitext(audio.filename.lower())[1]
     
@@ -21,51 +91,343 @@ async def summarize_meeting(audio: UploadFile = File(...)):
             detail=f"File type {file_extension} not supported. Use: {', '.join(allowed_extensions)}"
         )
 
-    file_path = f"temp_{uuid.uuid4()}{file_extension}"
+    os.makedirs(UPLOAD_TEMP_DIR, exist_ok=True)
+    file_path = os.path.join(UPLOAD_TEMP_DIR, f"temp_{uuid.uuid4()}{file_extension}")
     
     try:
-        print(f"Saving uploaded file to: {file_path}")
-
-        with open(file_path, "wb") as buffer:
-            content = await audio.read()
-            buffer.write(content)
+        with UPLOAD_SECONDS.time():
+            file_size, audio_hash = await spool_upload(audio, file_path)
+        UPLOAD_BYTES.inc(file_size)
+        logger.info("Upload %s saved to %s (%d bytes)", audio.filename, file_path, file_size, extra={"upload_bytes": file_size})
         
-        file_size = os.path.getsize(file_path)
-        print(f"File saved. Size: {file_size} bytes ({file_size/1024/1024:.2f} MB)")
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    
+    return file_path, file_size, audio_hash
 
-        print("Starting transcription and summary generation...")
-        result = process_audio_and_generate_summary(file_path)
-        
-        transcript = result["transcript"]
-        summary_data = result["summary"]
-        
-        if "[FALLBACK]" in transcript:
-            print("Transcription Service unavailable - using fallback")
-        else:
-            print(f"REAL transcription completed. Length: {len(transcript)} characters")
+def _sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
 
-        print("Summary generation completed")
-        
-        meeting_id = save_meeting_summary(audio.filename, transcript, summary_data)
-        print(f"Saved to database with ID: {meeting_id}")
+@router.post("/summarize", response_model=MeetingResponse, responses={
+    202: {"model": JobResponse, "description": "background=true: the job was queued"},
+    503: {"description": "background=true: the job queue is full"},
+    504: {"description": "Transcription missed its deadline and ASR_FALLBACK_ENABLED is false"}
+})
+async def summarize_meeting(request: Request, audio: UploadFile = File(...), background: bool = False):
+    """Process a meeting upload; with background=true, return a job id immediately"""
+
+    file_path, file_size, audio_hash = await _save_upload(audio)
+
+    if background:
+        try:
+            job = await run_db(submit_pipeline_job, file_path, audio.filename, audio_hash)
+        except JobQueueFullError as e:
+            raise HTTPException(status_code=503, detail=str(e))
         
-        return MeetingResponse(
-            id=meeting_id,
-            filename=audio.filename,
-            message="Meeting processed successfully with AssemblyAI ASR!" if "[FALLBACK]" not in transcript else "Meeting processed with fallback (ASR service unavailable)",
-            summary=summary_data,
-            transcript_preview=transcript[:200] + "..." if len(transcript) > 200 else transcript,
-            created_at=datetime.now().isoformat()
+        return JSONResponse(
+            status_code=202,
+            content=JobResponse(job_id=job["job_id"], status=job["status"], **_job_urls(job["job_id"])).model_dump()
         )
+
+    try:
+        with REQUESTS_IN_PROGRESS.track_in_progress(endpoint="summarize"):
+            return await _process_meeting_async(file_path, audio.filename, audio_hash, request.is_disconnected)
+        
+    except TranscriptionCancelledError as e:
+        logger.info("summarize_meeting cancelled: %s", e)
+        raise HTTPException(status_code=499, detail="Client disconnected")
+    
+    except TranscriptionTimeoutError as e:
+        ERRORS.inc(stage="summarize")
+        raise HTTPException(status_code=504, detail=str(e))
         
     except Exception as e:
-        print(f"Error in summarize_meeting: {str(e)}")
+        ERRORS.inc(stage="summarize")
+        logger.exception("Error in summarize_meeting")
         raise HTTPException(status_code=500, detail=f"Processing failed: {str(e)}")
-        
+
+@router.post("/summarize/stream")
+async def summarize_meeting_stream(request: Request, audio: UploadFile = File(...)):
+    """Process a meeting upload and stream progress as server-sent events
+
+    Emits upload_received, transcript_cached or asr_* stage events, summarizing,
+    summary_token (raw model text as Gemini streams it), saved, and finally either
+    result (the MeetingResponse) or error.
+    """
+    file_path, file_size, audio_hash = await _save_upload(audio)
+    
+    loop = asyncio.get_running_loop()
+    events = asyncio.Queue()
+
+    def emit(event: str, **data):
+        # Called from the event loop and from worker threads alike
+        loop.call_soon_threadsafe(events.put_nowait, (event, data))
+
+    def on_token(text: str):
+        emit("summary_token", text=text)
+
+    async def run_pipeline():
+        try:
+            with REQUESTS_IN_PROGRESS.track_in_progress(endpoint="summarize_stream"):
+                result = await _process_meeting_async(
+                    file_path, audio.filename, audio_hash, request.is_disconnected, progress=emit, on_token=on_token
+                )
+            emit("result", **result)
+        except TranscriptionCancelledError as e:
+            logger.info("summarize_meeting_stream cancelled: %s", e)
+            emit("error", detail="Client disconnected")
+        except Exception as e:
+            ERRORS.inc(stage="summarize_stream")
+            logger.exception("Error in summarize_meeting_stream")
+            emit("error", detail=f"Processing failed: {str(e)}")
+
+    async def event_stream():
+        task = asyncio.create_task(run_pipeline())
+        try:
+            yield _sse("upload_received", {"filename": audio.filename, "size": file_size})
+            while True:
+                try:
+                    event, data = await asyncio.wait_for(events.get(), timeout=SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield _sse(event, data)
+                if event in ("result", "error"):
+                    break
+        finally:
+            if not task.done():
+                task.cancel()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.post("/summarize/batch", response_model=BatchResponse)
+async def summarize_meeting_batch(files: List[UploadFile] = File(None), paths: List[str] = Form(None)):
+    """Summarize many uploads and/or server-side paths (below BATCH_IMPORT_ROOT) in one request
+
+    Files are processed concurrently within the per-provider limits, all successes are
+    saved in a single transaction and a per-file manifest is returned.
+    """
+    files = files or []
+    paths = paths or []
+    total = len(files) + len(paths)
+    if total == 0:
+        raise HTTPException(status_code=400, detail="Provide at least one file or path")
+    if total > BATCH_MAX_FILES:
+        raise HTTPException(status_code=400, detail=f"Batch of {total} recordings exceeds the limit of {BATCH_MAX_FILES}")
+
+    start_time = time.time()
+    items = []
+    try:
+        for audio in files:
+            try:
+                file_path, file_size, audio_hash = await _save_upload(audio)
+                items.append({"filename": audio.filename, "source": "upload", "path": file_path, "audio_hash": audio_hash})
+            except HTTPException as e:
+                items.append({"filename": audio.filename, "source": "upload", "error": e.detail})
+
+        for path in paths:
+            try:
+                resolved = resolve_import_path(path)
+                items.append({"filename": os.path.basename(resolved), "source": "path", "path": resolved})
+            except BatchPathError as e:
+                items.append({"filename": os.path.basename(path), "source": "path", "error": str(e)})
+
+        logger.info("Batch of %d recordings received", len(items))
+        with REQUESTS_IN_PROGRESS.track_in_progress(endpoint="summarize_batch"):
+            manifest = await summarize_batch(items)
     finally:
-        if os.path.exists(file_path):
-            os.remove(file_path)
-            print(f"Temp file cleaned up: {file_path}")
+        for item in items:
+            if item["source"] == "upload" and item.get("path"):
+                _cleanup(item["path"])
+
+    succeeded = sum(1 for entry in manifest if entry["status"] == "completed")
+    return BatchResponse(
+        total=len(manifest),
+        succeeded=succeeded,
+        failed=len(manifest) - succeeded,
+        elapsed_seconds=round(time.time() - start_time, 3),
+        items=manifest
+    )
+
+@router.post("/live", response_model=LiveSessionResponse, status_code=201)
+async def start_live_session(filename: str = None):
+    """Open a live session for a meeting in progress; send audio to /live/{session_id}/chunks"""
+    try:
+        return create_session(filename)
+    except LiveSessionLimitError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+@router.post("/live/{session_id}/chunks", response_model=LiveSessionResponse)
+async def add_live_chunk(session_id: str, audio: UploadFile = File(...), offset_ms: int = Form(None)):
+    """Transcribe the next audio chunk and update the rolling summary from it"""
+    if get_session(session_id) is None:
+        raise HTTPException(status_code=404, detail=f"Live session {session_id} not found")
+    
+    file_path, _, _ = await _save_upload(audio)
+    try:
+        with REQUESTS_IN_PROGRESS.track_in_progress(endpoint="live_chunk"):
+            return await add_chunk(session_id, file_path, offset_ms)
+    except LiveSessionNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except LiveChunkError as e:
+        ERRORS.inc(stage="live_chunk")
+        raise HTTPException(status_code=502, detail=str(e))
+    finally:
+        _cleanup(file_path)
+
+@router.get("/live/{session_id}", response_model=LiveSessionResponse)
+async def live_session_status(session_id: str):
+    """Current rolling summary and progress of a live session"""
+    session = get_session(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail=f"Live session {session_id} not found")
+    return session
+
+@router.post("/live/{session_id}/finish", response_model=MeetingResponse)
+async def finish_live_session(session_id: str):
+    """Close a live session and store it as a meeting"""
+    try:
+        result = await finish_session(session_id)
+    except LiveSessionNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return await run_db(_finish_meeting, result["filename"], result)
+
+@router.get("/jobs/{job_id}", response_model=JobStatusResponse)
+async def get_job_status(job_id: str):
+    """Report the current stage of a background summarization job"""
+    job = get_job(job_id) or await run_db(get_pipeline_job_status, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return JobStatusResponse(**job)
+
+@router.post("/jobs/{job_id}/retry", response_model=JobResponse, status_code=202)
+async def retry_job(job_id: str):
+    """Re-queue a background job that failed on the transcription deadline; it re-attaches to its transcript"""
+    try:
+        job = await run_db(retry_pipeline_job, job_id)
+    except PipelineJobNotRetryableError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return JobResponse(job_id=job["job_id"], status=job["status"], **_job_urls(job["job_id"]))
+
+@router.get("/jobs/{job_id}/result", response_model=MeetingResponse)
+async def get_job_result(job_id: str):
+    """Return the finished meeting for a background summarization job"""
+    job = get_job(job_id) or await run_db(get_pipeline_job_status, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    if job["status"] == "failed":
+        raise HTTPException(status_code=500, detail=f"Processing failed: {job['error']}")
+    if job["status"] != "completed":
+        raise HTTPException(status_code=409, detail=f"Job {job_id} is still {job['status']} ({job['stage']})")
+    return job["result"]
+
+@router.get("/search", response_model=SearchResponse)
+async def search(q: str = Query(..., min_length=1), limit: int = Query(20, ge=1, le=100), offset: int = Query(0, ge=0)):
+    """Ranked full-text search over past meetings with highlighted snippets"""
+    results = await run_db(search_meetings, q, limit, offset)
+    return SearchResponse(query=q, results=results)
+
+def _check_status(status: str):
+    if status is not None and status not in ACTION_ITEM_STATUSES:
+        raise HTTPException(status_code=400, detail=f"Unknown status {status!r}; use one of {', '.join(ACTION_ITEM_STATUSES)}")
+
+def _date_bound(value: str):
+    """ISO date or datetime query parameter -> the 'YYYY-MM-DD HH:MM:SS' form timestamps are stored in"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).strftime("%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid date {value!r}; use YYYY-MM-DD or an ISO datetime")
+
+@router.get("/action-items", response_model=ActionItemsResponse)
+async def list_action_items(
+    assignee: str = None,
+    status: str = None,
+    due_before: str = None,
+    meeting_id: int = None,
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0)
+):
+    """Action items across all meetings, e.g. ?assignee=Sarah&status=open or ?status=open&due_before=2026-11-01"""
+    _check_status(status)
+    due = _date_bound(due_before)
+    items = await run_db(get_action_items, assignee, status, due[:10] if due else None, meeting_id, limit, offset)
+    return ActionItemsResponse(items=items)
+
+@router.get("/action-items/assignees", response_model=List[AssigneeCount])
+async def list_action_item_assignees(status: str = "open"):
+    """Assignees and how many action items they have in a status (default open)"""
+    _check_status(status)
+    return await run_db(get_action_item_assignees, status)
+
+@router.patch("/action-items/{item_id}", response_model=ActionItemRecord)
+async def set_action_item_status(item_id: int, update: ActionItemUpdate):
+    """Mark an action item open, in_progress, done or cancelled"""
+    _check_status(update.status)
+    item = await run_db(update_action_item_status, item_id, update.status)
+    if item is None:
+        raise HTTPException(status_code=404, detail=f"Action item {item_id} not found")
+    return item
+
+@router.get("/decisions", response_model=DecisionsResponse)
+async def list_decisions(
+    meeting_id: int = None,
+    since: str = None,
+    until: str = None,
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0)
+):
+    """Key decisions across all meetings (newest first), optionally for one meeting or a created_at range"""
+    decisions = await run_db(get_decisions, meeting_id, _date_bound(since), _date_bound(until), limit, offset)
+    return DecisionsResponse(decisions=decisions)
+
+@router.post("/chat", response_model=ChatResponse)
+async def chat(request: ChatRequest):
+    """Answer a question about a stored meeting using the passages of its transcript that match"""
+    meeting = await run_db(get_meeting_summary, request.meeting_id)
+    if meeting is None:
+        raise HTTPException(status_code=404, detail=f"Meeting {request.meeting_id} not found")
+    
+    try:
+        result = await answer_meeting_question(meeting, request.question)
+    except Exception as e:
+        ERRORS.inc(stage="chat")
+        logger.exception("Error in chat")
+        raise HTTPException(status_code=502, detail=f"Chat failed: {str(e)}")
+    
+    return ChatResponse(meeting_id=request.meeting_id, **result)
+
+@router.get("/{meeting_id}/utterances", response_model=UtterancesResponse)
+async def meeting_utterances(
+    meeting_id: int,
+    speaker: str = None,
+    start_ms: int = Query(None, ge=0),
+    end_ms: int = Query(None, ge=0)
+):
+    """Speaker-labelled, timestamped utterances of a stored meeting, optionally for one speaker or time window"""
+    utterances = await run_db(get_meeting_utterances, meeting_id, speaker, start_ms, end_ms)
+    if utterances is None:
+        raise HTTPException(status_code=404, detail=f"Meeting {meeting_id} not found")
+    return UtterancesResponse(meeting_id=meeting_id, utterances=utterances)
+
+@router.get("/cache/stats")
+async def cache_stats():
+    """Hit/miss counters and sizes of the transcript and summary caches"""
+    return await run_db(get_cache_stats)
+
+@router.get("/providers/stats")
+async def provider_stats():
+    """Concurrency, queue depth and rate-limit retry counters per provider"""
+    return get_rate_limiter_stats()
 
 @router.get("/test")
 async def test_endpoint():
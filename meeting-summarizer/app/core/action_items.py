@@ -0,0 +1,119 @@
+import re
+from datetime import datetime, date, timedelta
+
+ACTION_ITEM_STATUSES = ("open", "in_progress", "done", "cancelled")
+
+# Placeholders the summarizer writes when no assignee or deadline was mentioned
+_UNSET = {"", "tbd", "tba", "n/a", "na", "none", "unassigned", "unknown", "not specified", "not mentioned", "-"}
+_WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+_MONTHS = ["january", "february", "march", "april", "may", "june", "july", "august", "september", "october", "november", "december"]
+_MONTH_NAMES = "|".join(sorted({name for month in _MONTHS for name in (month, month[:3])} | {"sept"}, key=len, reverse=True))
+_MONTH_DAY = re.compile(r"\b(" + _MONTH_NAMES + r")\.?\s+(\d{1,2})(?:st|nd|rd|th)?(?:,?\s+(\d{4}))?\b")
+_DAY_MONTH = re.compile(r"\b(\d{1,2})(?:st|nd|rd|th)?\s+(?:of\s+)?(" + _MONTH_NAMES + r")\b\.?(?:,?\s+(\d{4}))?")
+_ISO_DATE = re.compile(r"\b(\d{4})-(\d{2})-(\d{2})\b")
+
+def _clean(value) -> str:
+    text = " ".join(str(value or "").split())
+    return "" if text.lower().strip(" .") in _UNSET else text
+
+def normalize_assignee(assignee) -> tuple:
+    """(display name, lookup key) of an assignee; both None for TBD-style placeholders"""
+    name = _clean(assignee)
+    return (name, name.lower()) if name else (None, None)
+
+def _meeting_date(created_at: str) -> date:
+    try:
+        return datetime.fromisoformat(str(created_at)).date()
+    except ValueError:
+        return datetime.utcnow().date()
+
+def _month_date(month: str, day: str, year: str, reference: date):
+    try:
+        due = date(int(year) if year else reference.year, [m[:3] for m in _MONTHS].index(month[:3]) + 1, int(day))
+    except ValueError:
+        return None
+    # "March 3" said in December means next year's March
+    if not year and due < reference - timedelta(days=31):
+        due = due.replace(year=due.year + 1)
+    return due
+
+def resolve_due_date(deadline, created_at: str):
+    """Best-effort ISO due date for a free-text deadline, relative to the meeting's date; None if unclear
+
+    Understands ISO dates, "March 3" / "3rd of March", weekdays (the next one after the meeting),
+    today, tomorrow, end of week/month and next week. Anything else (ASAP, Q3, ...) stays None.
+    """
+    text = _clean(deadline).lower()
+    if not text:
+        return None
+    reference = _meeting_date(created_at)
+
+    match = _ISO_DATE.search(text)
+    if match:
+        try:
+            return date(*map(int, match.groups())).isoformat()
+        except ValueError:
+            return None
+    match = _MONTH_DAY.search(text)
+    if match:
+        due = _month_date(match.group(1), match.group(2), match.group(3), reference)
+        return due.isoformat() if due else None
+    match = _DAY_MONTH.search(text)
+    if match:
+        due = _month_date(match.group(2), match.group(1), match.group(3), reference)
+        return due.isoformat() if due else None
+
+    if "today" in text or "end of day" in text or "eod" in text.split():
+        return reference.isoformat()
+    if "tomorrow" in text:
+        return (reference + timedelta(days=1)).isoformat()
+    if "end of the month" in text or "end of month" in text:
+        next_month = (reference.replace(day=28) + timedelta(days=4)).replace(day=1)
+        return (next_month - timedelta(days=1)).isoformat()
+    if "end of the week" in text or "end of week" in text or "eow" in text.split():
+        return (reference + timedelta(days=(4 - reference.weekday()) % 7)).isoformat()
+    if "next week" in text:
+        return (reference + timedelta(days=7 - reference.weekday())).isoformat()
+    for index, weekday in enumerate(_WEEKDAYS):
+        if re.search(rf"\b{weekday}\b", text):
+            days = (index - reference.weekday()) % 7 or 7
+            if "next " + weekday in text and days < 7:
+                days += 7
+            return (reference + timedelta(days=days)).isoformat()
+    return None
+
+# Error summaries stored before the "failed" flag existed; only the backfill still meets them
+_LEGACY_FAILURE_PREFIXES = ("Summary generation failed:", "Processing failed:")
+
+def summary_failed(summary) -> bool:
+    """True for the placeholder summaries stored when transcription or summarization failed"""
+    if not isinstance(summary, dict):
+        return False
+    return bool(summary.get("failed")) or str(summary.get("summary") or "").startswith(_LEGACY_FAILURE_PREFIXES)
+
+def summary_items(summary: dict, created_at: str) -> tuple:
+    """Normalized (action item rows, decision rows) of a summary, in their summary order
+
+    Action item rows are (position, task, assignee, assignee_key, deadline, due_date);
+    decision rows are (position, decision).
+    """
+    if not isinstance(summary, dict):
+        return [], []
+
+    actions = []
+    for item in summary.get("action_items") or []:
+        if not isinstance(item, dict):
+            continue
+        task = _clean(item.get("task"))
+        if not task:
+            continue
+        assignee, assignee_key = normalize_assignee(item.get("assignee"))
+        deadline = _clean(item.get("deadline")) or None
+        actions.append((len(actions), task, assignee, assignee_key, deadline, resolve_due_date(deadline, created_at)))
+
+    decisions = []
+    for decision in summary.get("key_decisions") or []:
+        text = _clean(decision)
+        if text:
+            decisions.append((len(decisions), text))
+    return actions, decisions
@@ -0,0 +1,194 @@
+import os
+import re
+import json
+import time
+import hashlib
+import threading
+import logging
+from app.core.db import get_db_connection
+from app.core.transcript_codec import compress_text, decompress_text, encode_utterances, decode_utterances
+from app.core.metrics import register_collector
+
+logger = logging.getLogger(__name__)
+
+TRANSCRIPT_CACHE_MAX_ENTRIES = int(os.getenv("TRANSCRIPT_CACHE_MAX_ENTRIES", "1000"))
+TRANSCRIPT_CACHE_MAX_AGE_DAYS = float(os.getenv("TRANSCRIPT_CACHE_MAX_AGE_DAYS", "30"))
+SUMMARY_CACHE_MAX_ENTRIES = int(os.getenv("SUMMARY_CACHE_MAX_ENTRIES", "5000"))
+SUMMARY_CACHE_TTL_DAYS = float(os.getenv("SUMMARY_CACHE_TTL_DAYS", "90"))
+
+_transcript_stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+_summary_stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+_stats_lock = threading.Lock()
+
+def _count(stats: dict, key: str, amount: int = 1):
+    with _stats_lock:
+        stats[key] += amount
+
+def get_cached_transcript(audio_hash: str, asr_model: str):
+    """Return the stored {"text", "utterances"} for an audio content hash and ASR engine, or None"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    cutoff = time.time() - TRANSCRIPT_CACHE_MAX_AGE_DAYS * 86400
+    cursor.execute('''
+        SELECT transcript, utterances FROM transcript_cache WHERE audio_hash = ? AND asr_model = ? AND created_at >= ?
+    ''', (audio_hash, asr_model, cutoff))
+    row = cursor.fetchone()
+
+    if row is None:
+        _count(_transcript_stats, "misses")
+        return None
+
+    with conn:
+        cursor.execute('''
+            UPDATE transcript_cache SET last_used_at = ?, hit_count = hit_count + 1 WHERE audio_hash = ? AND asr_model = ?
+        ''', (time.time(), audio_hash, asr_model))
+
+    _count(_transcript_stats, "hits")
+    logger.info("Transcript cache hit for audio %s (%s)", audio_hash[:12], asr_model)
+    transcript = decompress_text(row["transcript"])
+    return {"text": transcript, "utterances": decode_utterances(row["utterances"], transcript)}
+
+def save_cached_transcript(audio_hash: str, asr_model: str, transcript: str, audio_size: int = 0, utterances: list = None):
+    """Store a transcript under its audio content hash and ASR engine, then apply the eviction policy"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    now = time.time()
+    with conn:
+        cursor.execute('''
+            INSERT OR REPLACE INTO transcript_cache (audio_hash, asr_model, transcript, utterances, audio_size, created_at, last_used_at, hit_count)
+            VALUES (?, ?, ?, ?, ?, ?, ?, 0)
+        ''', (audio_hash, asr_model, compress_text(transcript), encode_utterances(transcript, utterances), audio_size, now, now))
+        evicted = _evict_transcripts(cursor, now)
+
+    _count(_transcript_stats, "stores")
+    _count(_transcript_stats, "evictions", evicted)
+
+def _evict_transcripts(cursor, now: float) -> int:
+    """Drop expired entries, then the least recently used ones above the size limit"""
+    cursor.execute('''
+        DELETE FROM transcript_cache WHERE created_at < ?
+    ''', (now - TRANSCRIPT_CACHE_MAX_AGE_DAYS * 86400,))
+    evicted = cursor.rowcount
+
+    cursor.execute('''
+        DELETE FROM transcript_cache WHERE rowid IN (
+            SELECT rowid FROM transcript_cache
+            ORDER BY last_used_at DESC
+            LIMIT -1 OFFSET ?
+        )
+    ''', (TRANSCRIPT_CACHE_MAX_ENTRIES,))
+    evicted += cursor.rowcount
+    return evicted
+
+def transcript_fingerprint(transcript: str) -> str:
+    """Hash of a transcript with whitespace normalized, so reformatting does not miss the cache"""
+    normalized = re.sub(r"\s+", " ", transcript).strip()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+def get_cached_summary(transcript_hash: str, model: str, prompt_version: str):
+    """Return a memoized summary dict for (transcript, model, prompt version), or None"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    cutoff = time.time() - SUMMARY_CACHE_TTL_DAYS * 86400
+    cursor.execute('''
+        SELECT summary FROM summary_cache
+        WHERE transcript_hash = ? AND model = ? AND prompt_version = ? AND created_at >= ?
+    ''', (transcript_hash, model, prompt_version, cutoff))
+    row = cursor.fetchone()
+
+    if row is None:
+        _count(_summary_stats, "misses")
+        return None
+
+    with conn:
+        cursor.execute('''
+            UPDATE summary_cache SET last_used_at = ?, hit_count = hit_count + 1
+            WHERE transcript_hash = ? AND model = ? AND prompt_version = ?
+        ''', (time.time(), transcript_hash, model, prompt_version))
+
+    _count(_summary_stats, "hits")
+    logger.info("Summary cache hit for transcript %s (%s, prompt %s)", transcript_hash[:12], model, prompt_version)
+    return json.loads(row["summary"])
+
+def save_cached_summary(transcript_hash: str, model: str, prompt_version: str, summary: dict):
+    """Memoize a summary and apply the TTL/LRU eviction policy"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    now = time.time()
+    with conn:
+        cursor.execute('''
+            INSERT OR REPLACE INTO summary_cache (transcript_hash, model, prompt_version, summary, created_at, last_used_at, hit_count)
+            VALUES (?, ?, ?, ?, ?, ?, 0)
+        ''', (transcript_hash, model, prompt_version, json.dumps(summary), now, now))
+        evicted = _evict_summaries(cursor, now, model, prompt_version)
+
+    _count(_summary_stats, "stores")
+    _count(_summary_stats, "evictions", evicted)
+
+def _evict_summaries(cursor, now: float, model: str, prompt_version: str) -> int:
+    """Drop entries from older prompt versions, expired entries, then LRU entries above the limit"""
+    cursor.execute('''
+        DELETE FROM summary_cache WHERE model = ? AND prompt_version != ?
+    ''', (model, prompt_version))
+    evicted = cursor.rowcount
+
+    cursor.execute('''
+        DELETE FROM summary_cache WHERE created_at < ?
+    ''', (now - SUMMARY_CACHE_TTL_DAYS * 86400,))
+    evicted += cursor.rowcount
+
+    cursor.execute('''
+        DELETE FROM summary_cache WHERE rowid IN (
+            SELECT rowid FROM summary_cache
+            ORDER BY last_used_at DESC
+            LIMIT -1 OFFSET ?
+        )
+    ''', (SUMMARY_CACHE_MAX_ENTRIES,))
+    evicted += cursor.rowcount
+    return evicted
+
+def _with_rates(stats: dict) -> dict:
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+    return stats
+
+def get_cache_stats() -> dict:
+    """Hit/miss counters for this process plus current cache sizes"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute('SELECT COUNT(*) AS entries, COALESCE(SUM(audio_size), 0) AS audio_bytes FROM transcript_cache')
+    transcript_row = cursor.fetchone()
+    cursor.execute('SELECT COUNT(*) AS entries FROM summary_cache')
+    summary_row = cursor.fetchone()
+
+    with _stats_lock:
+        transcript_stats = _with_rates(dict(_transcript_stats))
+        summary_stats = _with_rates(dict(_summary_stats))
+
+    transcript_stats["entries"] = transcript_row["entries"]
+    transcript_stats["audio_bytes"] = transcript_row["audio_bytes"]
+    transcript_stats["max_entries"] = TRANSCRIPT_CACHE_MAX_ENTRIES
+    transcript_stats["max_age_days"] = TRANSCRIPT_CACHE_MAX_AGE_DAYS
+
+    summary_stats["entries"] = summary_row["entries"]
+    summary_stats["max_entries"] = SUMMARY_CACHE_MAX_ENTRIES
+    summary_stats["ttl_days"] = SUMMARY_CACHE_TTL_DAYS
+
+    return {"transcript_cache": transcript_stats, "summary_cache": summary_stats}
+
+def _collect_metrics() -> list:
+    with _stats_lock:
+        stats = {"transcript": dict(_transcript_stats), "summary": dict(_summary_stats)}
+    return [
+        ("meeting_cache_events_total", "counter", "Cache lookups and writes by cache and event (hits, misses, stores, evictions)", [
+            ({"cache": cache, "event": event}, value)
+            for cache, counters in stats.items()
+            for event, value in counters.items()
+        ])
+    ]
+
+register_collector(_collect_metrics)
@@ -1,13 +1,103 @@
-import sqlite3
+import os
+import re
 import json
+import time
+import base64
+import asyncio
+import sqlite3
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
+from app.core.metrics import DB_WRITE_SECONDS
+from app.core.action_items import summary_items, summary_failed
+from app.core.transcript_codec import TRANSCRIPT_ENCODING, compress_text, decompress_text, encode_utterances, decode_utterances
 
-def get_db_connection():
-    """Get SQLite database connection"""
-    conn = sqlite3.connect('meetings.db')
+logger = logging.getLogger(__name__)
+
+DB_PATH = os.getenv("MEETINGS_DB_PATH", "meetings.db")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "4"))
+SQLITE_CACHE_SIZE_MB = int(os.getenv("SQLITE_CACHE_SIZE_MB", "64"))
+SQLITE_MMAP_SIZE_MB = int(os.getenv("SQLITE_MMAP_SIZE_MB", "256"))
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+# Search ranks at most this many of the newest matches, so terms found in most meetings stay fast
+SEARCH_MAX_CANDIDATES = int(os.getenv("SEARCH_MAX_CANDIDATES", "5000"))
+# bm25 weights: transcript, summary, decisions, action_items, filename, created_at
+SEARCH_RANK = "bm25(1.0, 4.0, 6.0, 6.0, 0.0, 0.0)"
+
+# One long-lived connection per thread; sqlite3 keeps a per-connection cache of
+# prepared statements keyed by SQL text, so constant query strings are compiled once
+_local = threading.local()
+_connections = []
+_connections_lock = threading.Lock()
+# Bumped by close_db_connections so threads open a fresh connection on next use
+_generation = 0
+
+# Async callers run queries on this pool, which bounds the number of open connections
+_db_executor = ThreadPoolExecutor(max_workers=DB_POOL_SIZE, thread_name_prefix="sqlite")
+
+def _decompress_or_none(blob):
+    return decompress_text(blob) if blob is not None else None
+
+def _search_column(summary_json, index: int) -> str:
+    """One of the summary, decisions and action item search columns of a stored summary"""
+    try:
+        summary = json.loads(summary_json)
+    except (TypeError, ValueError):
+        summary = {"summary": summary_json}
+    return _search_columns(summary)[index]
+
+def register_sql_functions(conn: sqlite3.Connection):
+    """Define the Python SQL functions the schema depends on (see meeting_search_source)
+
+    Any connection that deletes meetings or reads the search index needs them, including
+    ones opened by maintenance scripts outside the app.
+    """
+    conn.create_function("decompress_text", 1, _decompress_or_none, deterministic=True)
+    conn.create_function("search_column", 2, _search_column, deterministic=True)
+
+def _connect(check_same_thread: bool = True) -> sqlite3.Connection:
+    conn = sqlite3.connect(DB_PATH, timeout=SQLITE_BUSY_TIMEOUT_MS / 1000, cached_statements=256, check_same_thread=check_same_thread)
     conn.row_factory = sqlite3.Row
+    register_sql_functions(conn)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute(f"PRAGMA cache_size = -{SQLITE_CACHE_SIZE_MB * 1024}")
+    conn.execute(f"PRAGMA mmap_size = {SQLITE_MMAP_SIZE_MB * 1024 * 1024}")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute(f"PRAGMA busy_timeout = {SQLITE_BUSY_TIMEOUT_MS}")
+    return conn
+
+def get_db_connection():
+    """Get this thread's SQLite connection (opened on first use, WAL mode, tuned pragmas)"""
+    conn = getattr(_local, "conn", None)
+    if conn is None or _local.generation != _generation:
+        # Only this thread uses the connection; check_same_thread is off so that
+        # close_db_connections can close it from the thread shutting the app down
+        conn = _connect(check_same_thread=False)
+        _local.conn = conn
+        _local.generation = _generation
+        with _connections_lock:
+            _connections.append(conn)
     return conn
 
+async def run_db(func, *args, **kwargs):
+    """Run a blocking database function on the SQLite pool from async code"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_db_executor, partial(func, *args, **kwargs))
+
+def close_db_connections():
+    """Close every pooled connection (application shutdown); the pool reopens on next use"""
+    global _db_executor, _generation
+    _db_executor.shutdown(wait=True)
+    with _connections_lock:
+        for conn in _connections:
+            conn.close()
+        _connections.clear()
+        _generation += 1
+    _db_executor = ThreadPoolExecutor(max_workers=DB_POOL_SIZE, thread_name_prefix="sqlite")
+
 def init_database():
     """Initialize the database and create/update tables"""
     conn = get_db_connection()
@@ -36,79 +126,814 @@ def init_database():
     if 'is_fallback' not in columns:
         cursor.execute('ALTER TABLE meeting_summaries ADD COLUMN is_fallback BOOLEAN DEFAULT FALSE')
     
+    # Entries are per ASR engine; older caches were keyed by audio alone and cannot tell
+    # which engine produced an entry, so they are dropped rather than served to the other one
+    cursor.execute("PRAGMA table_info(transcript_cache)")
+    transcript_cache_columns = [column[1] for column in cursor.fetchall()]
+    transcript_cache_dropped = bool(transcript_cache_columns) and 'asr_model' not in transcript_cache_columns
+    if transcript_cache_dropped:
+        cursor.execute('DROP TABLE transcript_cache')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS transcript_cache (
+            audio_hash TEXT NOT NULL,
+            asr_model TEXT NOT NULL,
+            transcript BLOB NOT NULL,
+            audio_size INTEGER DEFAULT 0,
+            created_at REAL NOT NULL,
+            last_used_at REAL NOT NULL,
+            hit_count INTEGER DEFAULT 0,
+            utterances BLOB,
+            PRIMARY KEY (audio_hash, asr_model)
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_transcript_cache_last_used ON transcript_cache (last_used_at)')
+
+    # Transcripts live here compressed, apart from meeting_summaries, so reading a summary never
+    # pages in or decompresses them; meeting_summaries.transcript is only read for legacy rows
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS meeting_transcripts (
+            meeting_id INTEGER PRIMARY KEY,
+            encoding TEXT NOT NULL,
+            transcript BLOB NOT NULL,
+            utterances BLOB,
+            utterance_count INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_meeting_transcripts_delete AFTER DELETE ON meeting_summaries
+        BEGIN
+            DELETE FROM meeting_transcripts WHERE meeting_id = OLD.id;
+        END
+    ''')
+
+    # Checkpoints of background pipeline jobs, so a restarted worker resumes instead of redoing them
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS pipeline_jobs (
+            job_id TEXT PRIMARY KEY,
+            filename TEXT NOT NULL,
+            audio_path TEXT,
+            audio_hash TEXT,
+            stage TEXT NOT NULL,
+            asr_transcript_id TEXT,
+            asr_offset_ms INTEGER NOT NULL DEFAULT 0,
+            transcript BLOB,
+            utterances BLOB,
+            summary TEXT,
+            meeting_id INTEGER,
+            error TEXT,
+            owner_pid INTEGER,
+            attempts INTEGER NOT NULL DEFAULT 1,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_pipeline_jobs_stage ON pipeline_jobs (stage, updated_at)')
+
+    cursor.execute("PRAGMA table_info(pipeline_jobs)")
+    if 'asr_offset_ms' not in [column[1] for column in cursor.fetchall()]:
+        cursor.execute('ALTER TABLE pipeline_jobs ADD COLUMN asr_offset_ms INTEGER NOT NULL DEFAULT 0')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS summary_cache (
+            transcript_hash TEXT NOT NULL,
+            model TEXT NOT NULL,
+            prompt_version TEXT NOT NULL,
+            summary TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            last_used_at REAL NOT NULL,
+            hit_count INTEGER DEFAULT 0,
+            PRIMARY KEY (transcript_hash, model, prompt_version)
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_summary_cache_last_used ON summary_cache (last_used_at)')
+
+    # Covers the listing query, so paging never touches the transcript/summary payloads
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_meeting_summaries_listing ON meeting_summaries (
+            created_at DESC, id DESC, filename, asr_service, llm_service, transcript_length, is_fallback
+        )
+    ''')
+
+    # The search index is external-content: it keeps only the inverted index, and reads the
+    # text for snippets (and for removing a row) from this view over the compressed transcripts.
+    # The view calls the Python functions decompress_text and search_column, which exist only on
+    # connections set up with register_sql_functions: the sqlite3 shell and other tools fail with
+    # "no such function" when they delete a meeting (trg_meeting_search_delete reads the view) or
+    # query meeting_search. Remove meetings through such a connection, or drop the trigger, delete,
+    # recreate it and run rebuild_search_index().
+    cursor.execute('''
+        CREATE VIEW IF NOT EXISTS meeting_search_source AS
+        SELECT m.id AS id,
+               COALESCE(decompress_text(t.transcript), m.transcript) AS transcript,
+               search_column(m.summary, 0) AS summary,
+               search_column(m.summary, 1) AS decisions,
+               search_column(m.summary, 2) AS action_items,
+               m.filename AS filename,
+               m.created_at AS created_at
+        FROM meeting_summaries m
+        LEFT JOIN meeting_transcripts t ON t.meeting_id = m.id
+    ''')
+    cursor.execute("SELECT sql FROM sqlite_master WHERE name = 'meeting_search'")
+    search_index = cursor.fetchone()
+    # Older databases kept a full plaintext copy of every transcript in the index
+    search_index_upgraded = search_index is not None and "meeting_search_source" not in search_index["sql"]
+    if search_index_upgraded:
+        cursor.execute("DROP TRIGGER IF EXISTS trg_meeting_search_delete")
+        cursor.execute("DROP TABLE meeting_search")
+    cursor.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS meeting_search USING fts5(
+            transcript, summary, decisions, action_items,
+            filename UNINDEXED, created_at UNINDEXED,
+            tokenize = 'porter unicode61',
+            content = 'meeting_search_source', content_rowid = 'id'
+        )
+    ''')
+    # BEFORE, so the view still returns the indexed values that the 'delete' command must be given
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_meeting_search_delete BEFORE DELETE ON meeting_summaries
+        BEGIN
+            INSERT INTO meeting_search (meeting_search, rowid, transcript, summary, decisions, action_items, filename, created_at)
+            SELECT 'delete', id, transcript, summary, decisions, action_items, filename, created_at
+            FROM meeting_search_source WHERE id = OLD.id;
+        END
+    ''')
+    # Stored in the index's config, so ORDER BY rank uses the weights without computing bm25() per row in SQL
+    cursor.execute("INSERT INTO meeting_search (meeting_search, rank) VALUES ('rank', ?)", (SEARCH_RANK,))
+
+    # Action items and decisions of every summary, one row each, so cross-meeting queries
+    # (open items of an assignee, items due soon) are index lookups instead of JSON scans
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'action_items'")
+    summary_items_exist = cursor.fetchone() is not None
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS action_items (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            meeting_id INTEGER NOT NULL,
+            position INTEGER NOT NULL,
+            task TEXT NOT NULL,
+            assignee TEXT,
+            assignee_key TEXT,
+            deadline TEXT,
+            due_date TEXT,
+            status TEXT NOT NULL DEFAULT 'open',
+            created_at TIMESTAMP NOT NULL,
+            updated_at TIMESTAMP,
+            UNIQUE (meeting_id, position)
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_action_items_assignee ON action_items (assignee_key, status, created_at)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_action_items_due ON action_items (status, due_date)')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS decisions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            meeting_id INTEGER NOT NULL,
+            position INTEGER NOT NULL,
+            decision TEXT NOT NULL,
+            created_at TIMESTAMP NOT NULL,
+            UNIQUE (meeting_id, position)
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_decisions_created ON decisions (created_at)')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_summary_items_delete AFTER DELETE ON meeting_summaries
+        BEGIN
+            DELETE FROM action_items WHERE meeting_id = OLD.id;
+            DELETE FROM decisions WHERE meeting_id = OLD.id;
+        END
+    ''')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS meeting_stats (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            total_meetings INTEGER NOT NULL DEFAULT 0,
+            fallback_count INTEGER NOT NULL DEFAULT 0,
+            total_transcript_length INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+    cursor.execute('''
+        INSERT OR IGNORE INTO meeting_stats (id, total_meetings, fallback_count, total_transcript_length)
+        SELECT 1, COUNT(*), COALESCE(SUM(is_fallback = 1), 0), COALESCE(SUM(transcript_length), 0)
+        FROM meeting_summaries
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_meeting_stats_insert AFTER INSERT ON meeting_summaries
+        BEGIN
+            UPDATE meeting_stats SET
+                total_meetings = total_meetings + 1,
+                fallback_count = fallback_count + (NEW.is_fallback = 1),
+                total_transcript_length = total_transcript_length + COALESCE(NEW.transcript_length, 0)
+            WHERE id = 1;
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_meeting_stats_delete AFTER DELETE ON meeting_summaries
+        BEGIN
+            UPDATE meeting_stats SET
+                total_meetings = total_meetings - 1,
+                fallback_count = fallback_count - (OLD.is_fallback = 1),
+                total_transcript_length = total_transcript_length - COALESCE(OLD.transcript_length, 0)
+            WHERE id = 1;
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_meeting_stats_update AFTER UPDATE OF is_fallback, transcript_length ON meeting_summaries
+        BEGIN
+            UPDATE meeting_stats SET
+                fallback_count = fallback_count - (OLD.is_fallback = 1) + (NEW.is_fallback = 1),
+                total_transcript_length = total_transcript_length - COALESCE(OLD.transcript_length, 0) + COALESCE(NEW.transcript_length, 0)
+            WHERE id = 1;
+        END
+    ''')
+    
     conn.commit()
-    conn.close()
-    print("Database initialized successfully")
+    
+    if search_index is None or search_index_upgraded:
+        rebuild_search_index()
+    if not summary_items_exist:
+        backfill_summary_items()
+    migrated = migrate_legacy_transcripts()
+    if search_index_upgraded or transcript_cache_dropped or migrated:
+        # Return the pages freed by the migrations to the filesystem
+        conn.execute("VACUUM")
+        logger.info("Database vacuumed after migrating stored text")
+    logger.info("Database initialized successfully")
 
-def save_meeting_summary(filename: str, transcript: str, summary: dict) -> int:
-    """Save meeting summary to database"""
+def _search_columns(summary: dict) -> tuple:
+    """Flatten the summary JSON into the summary, decisions and action item search columns"""
+    if not isinstance(summary, dict):
+        return "", "", ""
+    decisions = "\n".join(str(decision) for decision in summary.get("key_decisions") or [])
+    action_items = "\n".join(
+        " - ".join(str(item.get(field)) for field in ("task", "assignee") if item.get(field))
+        for item in summary.get("action_items") or [] if isinstance(item, dict)
+    )
+    return str(summary.get("summary") or ""), decisions, action_items
+
+def _index_meeting(cursor, meeting_id: int):
+    """Index a meeting whose row and transcript are already stored, from the same view deletes read"""
+    cursor.execute('''
+        INSERT INTO meeting_search (rowid, transcript, summary, decisions, action_items, filename, created_at)
+        SELECT id, transcript, summary, decisions, action_items, filename, created_at
+        FROM meeting_search_source WHERE id = ?
+    ''', (meeting_id,))
+
+def rebuild_search_index():
+    """Re-index every meeting from meeting_search_source"""
+    conn = get_db_connection()
+    with conn:
+        conn.execute("INSERT INTO meeting_search (meeting_search) VALUES ('rebuild')")
+    logger.info("Search index rebuilt")
+
+def _store_summary_items(cursor, meeting_id: int, created_at: str, summary: dict):
+    actions, decisions = summary_items(summary, created_at)
+    cursor.executemany('''
+        INSERT OR IGNORE INTO action_items (meeting_id, position, task, assignee, assignee_key, deadline, due_date, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ''', [(meeting_id, *action, created_at) for action in actions])
+    cursor.executemany('''
+        INSERT OR IGNORE INTO decisions (meeting_id, position, decision, created_at) VALUES (?, ?, ?, ?)
+    ''', [(meeting_id, *decision, created_at) for decision in decisions])
+
+def backfill_summary_items(batch_size: int = 500) -> int:
+    """Fill action_items and decisions from the summaries of existing meetings, committing in batches"""
     conn = get_db_connection()
     cursor = conn.cursor()
+    backfilled = 0
+    last_id = 0
     
-    is_fallback = "[FALLBACK]" in transcript
-    transcript_length = len(transcript)
+    while True:
+        cursor.execute('''
+            SELECT id, created_at, summary FROM meeting_summaries
+            WHERE id > ? AND COALESCE(is_fallback, 0) = 0
+            ORDER BY id
+            LIMIT ?
+        ''', (last_id, batch_size))
+        rows = cursor.fetchall()
+        if not rows:
+            break
+        
+        with conn:
+            for row in rows:
+                try:
+                    summary = json.loads(row["summary"])
+                except ValueError:
+                    continue
+                if summary_failed(summary):
+                    continue
+                _store_summary_items(cursor, row["id"], row["created_at"], summary)
+        
+        backfilled += len(rows)
+        last_id = rows[-1]["id"]
     
+    if backfilled:
+        logger.info("Action items and decisions backfilled from %d meetings", backfilled)
+    return backfilled
+
+def _row_transcript(row) -> str:
+    """Transcript text of a row joined with meeting_transcripts, falling back to the legacy TEXT column"""
+    if row["compressed_transcript"] is not None:
+        return decompress_text(row["compressed_transcript"])
+    return row["transcript"] or ""
+
+def _store_transcript(cursor, meeting_id: int, transcript: str, utterances: list = None):
     cursor.execute('''
-        INSERT INTO meeting_summaries (filename, transcript, summary, asr_service, llm_service, transcript_length, is_fallback)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-    ''', (filename, transcript, json.dumps(summary), 'AssemblyAI', 'Gemini', transcript_length, is_fallback))
+        INSERT OR REPLACE INTO meeting_transcripts (meeting_id, encoding, transcript, utterances, utterance_count)
+        VALUES (?, ?, ?, ?, ?)
+    ''', (meeting_id, TRANSCRIPT_ENCODING, compress_text(transcript), encode_utterances(transcript, utterances), len(utterances or [])))
+
+def migrate_legacy_transcripts(batch_size: int = 200) -> int:
+    """Move transcripts stored as plain TEXT in meeting_summaries into meeting_transcripts, in batches"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    migrated = 0
+    
+    while True:
+        cursor.execute('''
+            SELECT id, transcript FROM meeting_summaries WHERE transcript != '' ORDER BY id LIMIT ?
+        ''', (batch_size,))
+        rows = cursor.fetchall()
+        if not rows:
+            break
+        
+        with conn:
+            for row in rows:
+                cursor.execute('SELECT 1 FROM meeting_transcripts WHERE meeting_id = ?', (row["id"],))
+                if cursor.fetchone() is None:
+                    _store_transcript(cursor, row["id"], row["transcript"])
+                cursor.execute("UPDATE meeting_summaries SET transcript = '' WHERE id = ?", (row["id"],))
+        migrated += len(rows)
     
+    if migrated:
+        logger.info("Compressed %d legacy transcripts into meeting_transcripts", migrated)
+    return migrated
+
+def _fts_query(query: str) -> str:
+    """Turn free text into an FTS5 query: every word must match, trailing * keeps prefix search"""
+    terms = []
+    for word in re.findall(r"\w+\*?", query):
+        prefix = word.endswith("*")
+        word = word.rstrip("*")
+        terms.append(f'"{word}"*' if prefix else f'"{word}"')
+    return " ".join(terms)
+
+def _search_cutoff(cursor, fts_query: str):
+    """Lowest rowid among the SEARCH_MAX_CANDIDATES newest matches, or None if there are fewer"""
+    cursor.execute('''
+        SELECT rowid FROM meeting_search WHERE meeting_search MATCH ? ORDER BY rowid DESC LIMIT 1 OFFSET ?
+    ''', (fts_query, SEARCH_MAX_CANDIDATES - 1))
+    row = cursor.fetchone()
+    return row[0] if row else None
+
+def search_meetings(query: str, limit: int = 20, offset: int = 0) -> list:
+    """Full-text search over transcripts, summaries, decisions and action items, best match first
+
+    A term found in more than SEARCH_MAX_CANDIDATES meetings is ranked among the newest
+    SEARCH_MAX_CANDIDATES of them only; walking the rowid index for those is cheap, while
+    scoring every match of a very common term grows with the whole table.
+    """
+    fts_query = _fts_query(query)
+    if not fts_query:
+        return []
+    
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    
+    cutoff = _search_cutoff(cursor, fts_query)
+    cursor.execute('''
+        SELECT rowid AS id, filename, created_at, rank AS score,
+               snippet(meeting_search, -1, '<mark>', '</mark>', '...', 16) AS snippet
+        FROM meeting_search
+        WHERE meeting_search MATCH ? AND rowid >= ?
+        ORDER BY rank
+        LIMIT ? OFFSET ?
+    ''', (fts_query, cutoff or 0, limit, offset))
+    
+    return [dict(result) for result in cursor.fetchall()]
+
+def _insert_meeting(cursor, filename: str, transcript: str, summary: dict, created_at: str, asr_service: str, utterances: list = None) -> int:
+    """Insert one meeting, its compressed transcript and its search row; the caller owns the transaction"""
+    cursor.execute('''
+        INSERT INTO meeting_summaries (filename, transcript, summary, created_at, asr_service, llm_service, transcript_length, is_fallback)
+        VALUES (?, '', ?, ?, ?, ?, ?, ?)
+    ''', (filename, json.dumps(summary), created_at, asr_service, 'Gemini', len(transcript), "[FALLBACK]" in transcript))
     meeting_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
+    _store_transcript(cursor, meeting_id, transcript, utterances)
+    _index_meeting(cursor, meeting_id)
+    # Fallback and error summaries describe the outage, not the meeting
+    if "[FALLBACK]" not in transcript and not summary_failed(summary):
+        _store_summary_items(cursor, meeting_id, created_at, summary)
+    return meeting_id
+
+def save_meeting_summary(filename: str, transcript: str, summary: dict, asr_service: str = 'AssemblyAI', utterances: list = None) -> int:
+    """Save meeting summary to database"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    
+    is_fallback = "[FALLBACK]" in transcript
+    # Same format as SQLite's CURRENT_TIMESTAMP default, shared with the search index row
+    created_at = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+    
+    with DB_WRITE_SECONDS.time(operation="save"), conn:
+        meeting_id = _insert_meeting(cursor, filename, transcript, summary, created_at, asr_service, utterances)
     
     status = "fallback" if is_fallback else "real"
-    print(f"Meeting summary saved with ID: {meeting_id} ({status} transcription)")
+    logger.info("Meeting summary saved with ID: %d (%s transcription)", meeting_id, status)
+    return meeting_id
+
+def save_meeting_summaries_bulk(meetings: list, asr_service: str = 'AssemblyAI') -> list:
+    """Save many (filename, transcript, summary[, utterances]) tuples in one transaction; return their IDs in order
+
+    Each row gets its own savepoint, so a row that fails is rolled back alone and its ID is None.
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    created_at = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+    meeting_ids = []
+    
+    with DB_WRITE_SECONDS.time(operation="bulk_save"), conn:
+        # Opened explicitly: a savepoint outside a transaction would commit each row on release
+        cursor.execute("BEGIN")
+        for meeting in meetings:
+            cursor.execute("SAVEPOINT bulk_row")
+            try:
+                meeting_ids.append(_insert_meeting(cursor, meeting[0], meeting[1], meeting[2], created_at, asr_service, *meeting[3:]))
+            except Exception:
+                logger.exception("Bulk save skipped meeting %s", meeting[0])
+                cursor.execute("ROLLBACK TO bulk_row")
+                meeting_ids.append(None)
+            cursor.execute("RELEASE bulk_row")
+    
+    saved = sum(1 for meeting_id in meeting_ids if meeting_id is not None)
+    logger.info("Bulk saved %d of %d meeting summaries", saved, len(meeting_ids))
+    return meeting_ids
+
+PIPELINE_TERMINAL_STAGES = ("completed", "failed")
+
+def create_pipeline_job(job_id: str, filename: str, audio_path: str, audio_hash: str = None):
+    """Record a new background job whose audio is stored at audio_path"""
+    conn = get_db_connection()
+    now = time.time()
+    with conn:
+        conn.execute('''
+            INSERT INTO pipeline_jobs (job_id, filename, audio_path, audio_hash, stage, owner_pid, created_at, updated_at)
+            VALUES (?, ?, ?, ?, 'stored', ?, ?, ?)
+        ''', (job_id, filename, audio_path, audio_hash, os.getpid(), now, now))
+
+def checkpoint_pipeline_job(job_id: str, stage: str, transcript: str = None, utterances: list = None, summary: dict = None, **fields):
+    """Persist a completed stage; transcript, utterances and summary are encoded like stored meetings"""
+    if transcript is not None:
+        fields["transcript"] = compress_text(transcript)
+        fields["utterances"] = encode_utterances(transcript, utterances)
+    if summary is not None:
+        fields["summary"] = json.dumps(summary)
+    fields.update(stage=stage, updated_at=time.time())
+    
+    assignments = ", ".join(f"{column} = ?" for column in fields)
+    conn = get_db_connection()
+    with conn:
+        conn.execute(f"UPDATE pipeline_jobs SET {assignments} WHERE job_id = ?", (*fields.values(), job_id))
+
+def get_pipeline_job(job_id: str):
+    """A job's checkpoint with transcript, utterances and summary decoded, or None"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute('SELECT * FROM pipeline_jobs WHERE job_id = ?', (job_id,))
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    
+    job = dict(row)
+    transcript = decompress_text(job["transcript"]) if job["transcript"] is not None else None
+    job["utterances"] = decode_utterances(job["utterances"], transcript) if transcript is not None else None
+    job["transcript"] = transcript
+    job["summary"] = json.loads(job["summary"]) if job["summary"] is not None else None
+    return job
+
+def get_unfinished_pipeline_jobs() -> list:
+    """(job_id, owner_pid) of jobs that have not reached a terminal stage, oldest first"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute('''
+        SELECT job_id, owner_pid FROM pipeline_jobs WHERE stage NOT IN (?, ?) ORDER BY created_at
+    ''', PIPELINE_TERMINAL_STAGES)
+    return [(row["job_id"], row["owner_pid"]) for row in cursor.fetchall()]
+
+def claim_pipeline_job(job_id: str, previous_owner_pid: int) -> bool:
+    """Take over a job from a dead worker; False if another worker claimed it first"""
+    conn = get_db_connection()
+    with conn:
+        cursor = conn.execute('''
+            UPDATE pipeline_jobs SET owner_pid = ?, attempts = attempts + 1, updated_at = ?
+            WHERE job_id = ? AND owner_pid IS ?
+        ''', (os.getpid(), time.time(), job_id, previous_owner_pid))
+    return cursor.rowcount == 1
+
+def requeue_pipeline_job(job_id: str) -> bool:
+    """Move a failed job that kept its audio back to the stage it resumes from; False if it does not qualify"""
+    conn = get_db_connection()
+    with conn:
+        cursor = conn.execute('''
+            UPDATE pipeline_jobs
+            SET stage = CASE WHEN asr_transcript_id IS NULL THEN 'stored' ELSE 'transcribing' END,
+                error = NULL, owner_pid = ?, attempts = attempts + 1, updated_at = ?
+            WHERE job_id = ? AND stage = 'failed' AND audio_path IS NOT NULL
+        ''', (os.getpid(), time.time(), job_id))
+    return cursor.rowcount == 1
+
+def complete_pipeline_job(job_id: str, filename: str, transcript: str, summary: dict, asr_service: str, utterances: list = None) -> int:
+    """Save the meeting and mark the job completed in one transaction, so a crash cannot save it twice"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    created_at = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+    
+    with DB_WRITE_SECONDS.time(operation="save"), conn:
+        meeting_id = _insert_meeting(cursor, filename, transcript, summary, created_at, asr_service, utterances)
+        cursor.execute('''
+            UPDATE pipeline_jobs SET stage = 'completed', meeting_id = ?, transcript = NULL, utterances = NULL,
+                summary = NULL, updated_at = ?
+            WHERE job_id = ?
+        ''', (meeting_id, time.time(), job_id))
+    
+    logger.info("Meeting summary saved with ID: %d (job %s)", meeting_id, job_id)
     return meeting_id
 
+def prune_pipeline_jobs(max_age_seconds: float) -> list:
+    """Delete finished job checkpoints older than max_age_seconds; return their leftover audio paths"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cutoff = time.time() - max_age_seconds
+    cursor.execute('''
+        SELECT audio_path FROM pipeline_jobs WHERE stage IN (?, ?) AND updated_at < ? AND audio_path IS NOT NULL
+    ''', (*PIPELINE_TERMINAL_STAGES, cutoff))
+    audio_paths = [row["audio_path"] for row in cursor.fetchall()]
+    with conn:
+        cursor.execute('DELETE FROM pipeline_jobs WHERE stage IN (?, ?) AND updated_at < ?', (*PIPELINE_TERMINAL_STAGES, cutoff))
+    return audio_paths
+
 def get_meeting_summary(meeting_id: int):
-    """Retrieve a meeting summary by ID"""
+    """Retrieve a meeting summary by ID, without its transcript (see get_meeting_transcript)"""
     conn = get_db_connection()
     cursor = conn.cursor()
     
     cursor.execute('''
-        SELECT * FROM meeting_summaries WHERE id = ?
+        SELECT id, filename, summary, created_at, asr_service, llm_service, transcript_length, is_fallback
+        FROM meeting_summaries WHERE id = ?
     ''', (meeting_id,))
     
     result = cursor.fetchone()
-    conn.close()
     
     if result:
         return dict(result)
     return None
 
-# def get_all_meetings(limit: int = 10):
-#     """Get all meeting summaries with service status"""
-#     conn = get_db_connection()
-#     cursor = conn.cursor()
-    
-#     cursor.execute('''
-#         SELECT id, filename, created_at, asr_service, llm_service, transcript_length, is_fallback
-#         FROM meeting_summaries 
-#         ORDER BY created_at DESC 
-#         LIMIT ?
-#     ''', (limit,))
-    
-#     results = cursor.fetchall()
-#     conn.close()
-    
-#     return [dict(result) for result in results]
-
-# def get_service_stats():
-#     """Get statistics about ASR service usage"""
-#     conn = get_db_connection()
-#     cursor = conn.cursor()
-    
-#     cursor.execute('''
-#         SELECT 
-#             COUNT(*) as total_meetings,
-#             SUM(CASE WHEN is_fallback = 1 THEN 1 ELSE 0 END) as fallback_count,
-#             SUM(CASE WHEN is_fallback = 0 THEN 1 ELSE 0 END) as real_transcription_count,
-#             AVG(transcript_length) as avg_transcript_length
-#         FROM meeting_summaries
-#     ''')
-    
-#     result = cursor.fetchone()
-#     conn.close()
-    
-#     return dict(result) if result else None
\ No newline at end of file
+def get_meeting_transcript(meeting_id: int):
+    """Decompress and return a meeting's transcript text, or None if the meeting does not exist"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    
+    cursor.execute('''
+        SELECT m.transcript, t.transcript AS compressed_transcript
+        FROM meeting_summaries m
+        LEFT JOIN meeting_transcripts t ON t.meeting_id = m.id
+        WHERE m.id = ?
+    ''', (meeting_id,))
+    
+    result = cursor.fetchone()
+    if result is None:
+        return None
+    return _row_transcript(result)
+
+def get_meeting_utterances(meeting_id: int, speaker: str = None, start_ms: int = None, end_ms: int = None):
+    """A meeting's utterances ({"speaker", "start", "end", "text"}, ms), optionally one speaker's or those overlapping a time window
+
+    Returns None if the meeting does not exist and [] if it was stored without utterances.
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    
+    cursor.execute('''
+        SELECT m.transcript, t.transcript AS compressed_transcript, t.utterances
+        FROM meeting_summaries m
+        LEFT JOIN meeting_transcripts t ON t.meeting_id = m.id
+        WHERE m.id = ?
+    ''', (meeting_id,))
+    
+    result = cursor.fetchone()
+    if result is None:
+        return None
+    if result["utterances"] is None:
+        return []
+    
+    utterances = decode_utterances(result["utterances"], _row_transcript(result))
+    return [
+        utterance for utterance in utterances
+        if (speaker is None or utterance["speaker"] == speaker)
+        and (start_ms is None or utterance["end"] >= start_ms)
+        and (end_ms is None or utterance["start"] <= end_ms)
+    ]
+
+def _encode_cursor(created_at: str, meeting_id: int) -> str:
+    return base64.urlsafe_b64encode(f"{created_at}|{meeting_id}".encode("utf-8")).decode("ascii")
+
+def _decode_cursor(cursor_token: str) -> tuple:
+    try:
+        created_at, meeting_id = base64.urlsafe_b64decode(cursor_token.encode("ascii")).decode("utf-8").rsplit("|", 1)
+        return created_at, int(meeting_id)
+    except (ValueError, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor_token}") from e
+
+def get_all_meetings(limit: int = 10, cursor_token: str = None) -> dict:
+    """Get a page of meetings, newest first, using keyset pagination on (created_at, id)"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    
+    if cursor_token:
+        created_at, meeting_id = _decode_cursor(cursor_token)
+        cursor.execute('''
+            SELECT id, filename, created_at, asr_service, llm_service, transcript_length, is_fallback
+            FROM meeting_summaries INDEXED BY idx_meeting_summaries_listing
+            WHERE (created_at, id) < (?, ?)
+            ORDER BY created_at DESC, id DESC
+            LIMIT ?
+        ''', (created_at, meeting_id, limit + 1))
+    else:
+        cursor.execute('''
+            SELECT id, filename, created_at, asr_service, llm_service, transcript_length, is_fallback
+            FROM meeting_summaries INDEXED BY idx_meeting_summaries_listing
+            ORDER BY created_at DESC, id DESC
+            LIMIT ?
+        ''', (limit + 1,))
+    
+    results = [dict(result) for result in cursor.fetchall()]
+    
+    next_cursor = None
+    if len(results) > limit:
+        results = results[:limit]
+        next_cursor = _encode_cursor(results[-1]["created_at"], results[-1]["id"])
+    
+    return {"meetings": results, "next_cursor": next_cursor}
+
+def get_action_items(assignee: str = None, status: str = None, due_before: str = None, meeting_id: int = None, limit: int = 50, offset: int = 0) -> list:
+    """Action items across meetings, filtered by assignee (case-insensitive), status, due date or meeting
+
+    With an assignee the newest items come first (idx_action_items_assignee); with due_before the
+    soonest due come first (idx_action_items_due); items of one meeting keep their summary order.
+    """
+    conditions, params = [], []
+    if assignee is not None:
+        conditions.append("a.assignee_key = ?")
+        params.append(" ".join(assignee.split()).lower())
+    if status is not None:
+        conditions.append("a.status = ?")
+        params.append(status)
+    if due_before is not None:
+        conditions.append("a.due_date <= ?")
+        params.append(due_before)
+    if meeting_id is not None:
+        conditions.append("a.meeting_id = ?")
+        params.append(meeting_id)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    if meeting_id is not None:
+        order = "a.position"
+    elif due_before is not None:
+        order = "a.due_date, a.id"
+    else:
+        order = "a.created_at DESC, a.id DESC"
+
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute(f'''
+        SELECT a.id, a.meeting_id, m.filename, a.position, a.task, a.assignee, a.deadline, a.due_date,
+               a.status, a.created_at, a.updated_at
+        FROM action_items a JOIN meeting_summaries m ON m.id = a.meeting_id
+        {where}
+        ORDER BY {order}
+        LIMIT ? OFFSET ?
+    ''', (*params, limit, offset))
+    return [dict(result) for result in cursor.fetchall()]
+
+def get_action_item_assignees(status: str = "open") -> list:
+    """Assignees with their number of action items in a status, most loaded first"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute('''
+        SELECT MIN(assignee) AS assignee, COUNT(*) AS count
+        FROM action_items INDEXED BY idx_action_items_assignee
+        WHERE assignee_key IS NOT NULL AND status = ?
+        GROUP BY assignee_key
+        ORDER BY count DESC, assignee_key
+    ''', (status,))
+    return [dict(result) for result in cursor.fetchall()]
+
+def update_action_item_status(item_id: int, status: str):
+    """Set an action item's status; return the updated item, or None if it does not exist"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    with DB_WRITE_SECONDS.time(operation="action_item"), conn:
+        cursor.execute('''
+            UPDATE action_items SET status = ?, updated_at = ? WHERE id = ?
+        ''', (status, datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S"), item_id))
+    if cursor.rowcount == 0:
+        return None
+    cursor.execute('''
+        SELECT a.id, a.meeting_id, m.filename, a.position, a.task, a.assignee, a.deadline, a.due_date,
+               a.status, a.created_at, a.updated_at
+        FROM action_items a JOIN meeting_summaries m ON m.id = a.meeting_id
+        WHERE a.id = ?
+    ''', (item_id,))
+    return dict(cursor.fetchone())
+
+def get_decisions(meeting_id: int = None, since: str = None, until: str = None, limit: int = 50, offset: int = 0) -> list:
+    """Decisions across meetings, newest first, or one meeting's decisions in summary order"""
+    conditions, params = [], []
+    if meeting_id is not None:
+        conditions.append("d.meeting_id = ?")
+        params.append(meeting_id)
+    if since is not None:
+        conditions.append("d.created_at >= ?")
+        params.append(since)
+    if until is not None:
+        conditions.append("d.created_at < ?")
+        params.append(until)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    order = "d.position" if meeting_id is not None else "d.created_at DESC, d.id DESC"
+
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute(f'''
+        SELECT d.id, d.meeting_id, m.filename, d.position, d.decision, d.created_at
+        FROM decisions d JOIN meeting_summaries m ON m.id = d.meeting_id
+        {where}
+        ORDER BY {order}
+        LIMIT ? OFFSET ?
+    ''', (*params, limit, offset))
+    return [dict(result) for result in cursor.fetchall()]
+
+# Exportable fields and the SQL producing each one; "summary" is the stored JSON text, not decoded
+EXPORT_COLUMNS = {
+    "id": "m.id",
+    "filename": "m.filename",
+    "created_at": "m.created_at",
+    "asr_service": "m.asr_service",
+    "llm_service": "m.llm_service",
+    "transcript_length": "m.transcript_length",
+    "is_fallback": "m.is_fallback",
+    "summary": "m.summary",
+    "transcript": "COALESCE(decompress_text(t.transcript), m.transcript)"
+}
+
+def iter_meeting_export(fields: list, since: str = None, until: str = None, batch_size: int = 1000):
+    """Yield lists of row tuples (values in `fields` order), oldest first, for a bulk export
+
+    Rows come from one SELECT on a dedicated connection, read batch_size rows at a time, so
+    memory stays constant whatever the table size. The connection is not the pooled one: the
+    generator is resumed from whichever thread streams the response, and it holds a single
+    WAL read snapshot until it is exhausted or closed. since/until bound created_at (until exclusive).
+    """
+    conditions, params = [], []
+    if since:
+        conditions.append("m.created_at >= ?")
+        params.append(since)
+    if until:
+        conditions.append("m.created_at < ?")
+        params.append(until)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    join = "LEFT JOIN meeting_transcripts t ON t.meeting_id = m.id" if "transcript" in fields else ""
+
+    conn = _connect(check_same_thread=False)
+    try:
+        conn.row_factory = None
+        cursor = conn.execute(f'''
+            SELECT {", ".join(EXPORT_COLUMNS[field] for field in fields)}
+            FROM meeting_summaries m INDEXED BY idx_meeting_summaries_listing {join}
+            {where}
+            ORDER BY m.created_at, m.id
+        ''', params)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield rows
+    finally:
+        conn.close()
+
+def get_service_stats():
+    """Get statistics about ASR service usage from the incrementally maintained aggregate row"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    
+    cursor.execute('''
+        SELECT total_meetings, fallback_count, total_transcript_length FROM meeting_stats WHERE id = 1
+    ''')
+    
+    result = cursor.fetchone()
+    if not result:
+        return None
+    
+    total_meetings = result["total_meetings"]
+    return {
+        "total_meetings": total_meetings,
+        "fallback_count": result["fallback_count"],
+        "real_transcription_count": total_meetings - result["fallback_count"],
+        "avg_transcript_length": result["total_transcript_length"] / total_meetings if total_meetings else None
+    }
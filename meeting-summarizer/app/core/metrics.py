@@ -0,0 +1,157 @@
+import time
+import threading
+import contextlib
+
+# Spans a cached lookup (milliseconds) up to a long AssemblyAI transcription (minutes)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800)
+
+_registry = []
+_collectors = []
+_registry_lock = threading.Lock()
+
+def _format_labels(labels: tuple) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(name, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in labels
+    )
+    return "{" + pairs + "}"
+
+def _format_value(value) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str):
+        self.name = name
+        self.documentation = documentation
+        self.lock = threading.Lock()
+        with _registry_lock:
+            _registry.append(self)
+
+    def header(self) -> list:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+class Counter(_Metric):
+    """Monotonic count, optionally split by labels: counter.inc(stage="asr")"""
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str):
+        super().__init__(name, documentation)
+        self.values = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = tuple(sorted(labels.items()))
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def samples(self) -> list:
+        with self.lock:
+            return [(self.name, key, value) for key, value in self.values.items()]
+
+class Gauge(Counter):
+    """Value that can go up and down"""
+    kind = "gauge"
+
+    def set(self, value: float, **labels):
+        with self.lock:
+            self.values[tuple(sorted(labels.items()))] = value
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+    @contextlib.contextmanager
+    def track_in_progress(self, **labels):
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+class Histogram(_Metric):
+    """Cumulative-bucket latency/size distribution: histogram.observe(seconds, provider="x")"""
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, buckets: tuple = DEFAULT_BUCKETS):
+        super().__init__(name, documentation)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        self.values = {}
+
+    def observe(self, value: float, **labels):
+        key = tuple(sorted(labels.items()))
+        with self.lock:
+            state = self.values.get(key)
+            if state is None:
+                state = self.values[key] = {"counts": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state["counts"][index] += 1
+                    break
+            state["sum"] += value
+            state["count"] += 1
+
+    @contextlib.contextmanager
+    def time(self, **labels):
+        """Observe the wall time of a with-block, including when it raises"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def samples(self) -> list:
+        samples = []
+        with self.lock:
+            for key, state in self.values.items():
+                cumulative = 0
+                for bound, count in zip(self.buckets, state["counts"]):
+                    cumulative += count
+                    samples.append((f"{self.name}_bucket", key + (("le", _format_value(bound)),), cumulative))
+                samples.append((f"{self.name}_sum", key, state["sum"]))
+                samples.append((f"{self.name}_count", key, state["count"]))
+        return samples
+
+def register_collector(collector):
+    """Register a callable returning [(name, kind, documentation, [(labels dict, value), ...])] read at scrape time"""
+    with _registry_lock:
+        _collectors.append(collector)
+
+def render_metrics() -> str:
+    """All metrics in the Prometheus text exposition format (version 0.0.4)"""
+    with _registry_lock:
+        metrics = list(_registry)
+        collectors = list(_collectors)
+
+    lines = []
+    for metric in metrics:
+        lines.extend(metric.header())
+        for name, labels, value in metric.samples():
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+    for collector in collectors:
+        for name, kind, documentation, samples in collector():
+            lines.append(f"# HELP {name} {documentation}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                lines.append(f"{name}{_format_labels(tuple(sorted(labels.items())))} {_format_value(value)}")
+
+    return "\n".join(lines) + "\n"
+
+UPLOAD_SECONDS = Histogram("meeting_upload_seconds", "Time spent spooling an upload to disk")
+UPLOAD_BYTES = Counter("meeting_upload_bytes_total", "Audio bytes received from clients")
+PREPROCESS_SECONDS = Histogram("meeting_preprocess_seconds", "Time spent re-encoding audio with ffmpeg")
+PREPROCESS_BYTES_SAVED = Counter("meeting_preprocess_bytes_saved_total", "Upload bytes saved by audio preprocessing")
+ASR_SECONDS = Histogram("meeting_asr_seconds", "Transcription latency by provider")
+ASR_BYTES = Counter("meeting_asr_audio_bytes_total", "Audio bytes sent to transcription by provider")
+TRANSCRIPT_CHARS = Counter("meeting_transcript_chars_total", "Characters of transcript produced by provider")
+LLM_SECONDS = Histogram("meeting_llm_seconds", "Gemini request latency by operation")
+LLM_TOKENS = Counter("meeting_llm_tokens_total", "Gemini tokens by operation and kind (prompt, response)")
+COMPACTION_TOKENS = Counter("meeting_compaction_tokens_total", "Estimated transcript tokens before and after compaction")
+DB_WRITE_SECONDS = Histogram("meeting_db_write_seconds", "SQLite write transaction latency by operation")
+FALLBACKS = Counter("meeting_fallbacks_total", "Requests answered with a fallback result, by stage")
+ERRORS = Counter("meeting_errors_total", "Pipeline errors by stage")
+REQUESTS_IN_PROGRESS = Gauge("meeting_requests_in_progress", "Summarization requests being processed, by endpoint")
@@ -0,0 +1,115 @@
+import sys
+import json
+import zlib
+import struct
+from array import array
+
+TRANSCRIPT_COMPRESSION_LEVEL = 6
+# Bumped whenever the binary layout below changes; stored with every row
+TRANSCRIPT_ENCODING = "zlib-v1"
+
+_HEADER_LENGTH = struct.Struct("<I")
+
+def compress_text(text: str) -> bytes:
+    return zlib.compress(text.encode("utf-8"), TRANSCRIPT_COMPRESSION_LEVEL)
+
+def decompress_text(blob: bytes) -> str:
+    return zlib.decompress(blob).decode("utf-8")
+
+def _column(values: list) -> bytes:
+    column = array("i", values)
+    if sys.byteorder == "big":
+        column.byteswap()
+    return column.tobytes()
+
+def _read_column(data: bytes, start: int, count: int) -> tuple:
+    column = array("i")
+    end = start + count * column.itemsize
+    column.frombytes(data[start:end])
+    if sys.byteorder == "big":
+        column.byteswap()
+    return column.tolist(), end
+
+def _align(text: str, utterances: list) -> list:
+    """(offset, length) of each utterance in the transcript, searching forward; None if any is missing"""
+    spans = []
+    cursor = 0
+    for utterance in utterances:
+        offset = text.find(utterance["text"], cursor)
+        if offset == -1:
+            return None
+        spans.append((offset, len(utterance["text"])))
+        cursor = offset + len(utterance["text"])
+    return spans
+
+def encode_utterances(text: str, utterances: list) -> bytes:
+    """Pack utterances ({"speaker", "start", "end", "text"}, times in ms) into one compressed columnar blob
+
+    Columns are int32 arrays: speaker index into a label table, start (delta from the previous
+    start), duration, text offset (delta from the previous utterance's end) and text length.
+    Utterance text is not repeated: offsets point into the transcript. If the transcript does not
+    contain every utterance verbatim, the utterance texts are joined and stored in the header.
+    """
+    if not utterances:
+        return None
+
+    spans = _align(text, utterances)
+    header = {"count": len(utterances), "speakers": []}
+    if spans is None:
+        header["text"] = "\n".join(utterance["text"] for utterance in utterances)
+        spans = _align(header["text"], utterances)
+
+    speaker_index = {}
+    speakers, starts, durations, offsets, lengths = [], [], [], [], []
+    previous_start = 0
+    previous_end = 0
+    for utterance, (offset, length) in zip(utterances, spans):
+        label = utterance.get("speaker")
+        if label not in speaker_index:
+            speaker_index[label] = len(header["speakers"])
+            header["speakers"].append(label)
+        speakers.append(speaker_index[label])
+        start = int(utterance.get("start") or 0)
+        starts.append(start - previous_start)
+        durations.append(max(0, int(utterance.get("end") or start) - start))
+        offsets.append(offset - previous_end)
+        lengths.append(length)
+        previous_start = start
+        previous_end = offset + length
+
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    payload = _HEADER_LENGTH.pack(len(header_bytes)) + header_bytes + b"".join(
+        _column(values) for values in (speakers, starts, durations, offsets, lengths)
+    )
+    return zlib.compress(payload, TRANSCRIPT_COMPRESSION_LEVEL)
+
+def decode_utterances(blob: bytes, text: str = None) -> list:
+    """Unpack an encode_utterances blob into [{"speaker", "start", "end", "text"}]; text is the transcript"""
+    if not blob:
+        return []
+
+    data = zlib.decompress(blob)
+    (header_length,) = _HEADER_LENGTH.unpack_from(data)
+    position = _HEADER_LENGTH.size + header_length
+    header = json.loads(data[_HEADER_LENGTH.size:position])
+    text = header.get("text", text) or ""
+
+    columns = []
+    for _ in range(5):
+        values, position = _read_column(data, position, header["count"])
+        columns.append(values)
+
+    utterances = []
+    start = 0
+    end_offset = 0
+    for speaker, start_delta, duration, offset_delta, length in zip(*columns):
+        start += start_delta
+        offset = end_offset + offset_delta
+        end_offset = offset + length
+        utterances.append({
+            "speaker": header["speakers"][speaker],
+            "start": start,
+            "end": start + duration,
+            "text": text[offset:end_offset]
+        })
+    return utterances
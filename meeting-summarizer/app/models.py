@@ -7,6 +7,37 @@ class ActionItem(BaseModel):
     assignee: Optional[str] = None
     deadline: Optional[str] = None
 
+class ActionItemRecord(ActionItem):
+    id: int
+    meeting_id: int
+    filename: str
+    position: int
+    due_date: Optional[str] = None
+    status: str
+    created_at: str
+    updated_at: Optional[str] = None
+
+class ActionItemsResponse(BaseModel):
+    items: List[ActionItemRecord]
+
+class ActionItemUpdate(BaseModel):
+    status: str
+
+class AssigneeCount(BaseModel):
+    assignee: str
+    count: int
+
+class DecisionRecord(BaseModel):
+    id: int
+    meeting_id: int
+    filename: str
+    position: int
+    decision: str
+    created_at: str
+
+class DecisionsResponse(BaseModel):
+    decisions: List[DecisionRecord]
+
 class SummaryResponse(BaseModel):
     summary: str
     key_decisions: List[str]
@@ -19,14 +50,97 @@ class MeetingResponse(BaseModel):
     summary: Dict[str, Any]
     transcript_preview: str
     created_at: str
+    metadata: Optional[Dict[str, Any]] = None
 
 class MeetingListResponse(BaseModel):
     meetings: List[Dict[str, Any]]
     total: int
+    next_cursor: Optional[str] = None
+
+class SearchResult(BaseModel):
+    id: int
+    filename: str
+    created_at: str
+    score: float
+    snippet: str
+
+class SearchResponse(BaseModel):
+    query: str
+    results: List[SearchResult]
+
+class ChatRequest(BaseModel):
+    meeting_id: int
+    question: str
+
+class ChatResponse(BaseModel):
+    meeting_id: int
+    answer: str
+    sources: List[str]
+
+class Utterance(BaseModel):
+    speaker: Optional[str] = None
+    start: int
+    end: int
+    text: str
+
+class UtterancesResponse(BaseModel):
+    meeting_id: int
+    utterances: List[Utterance]
+
+class LiveChunkResult(BaseModel):
+    text: str
+    utterances: List[Utterance]
+    summary_updated: bool
+    elapsed_seconds: float
+
+class LiveSessionResponse(BaseModel):
+    session_id: str
+    filename: str
+    chunks: int
+    duration_ms: int
+    transcript_length: int
+    pending_chars: int
+    summary: Optional[Dict[str, Any]] = None
+    created_at: str
+    updated_at: str
+    last_chunk: Optional[LiveChunkResult] = None
+
+class BatchItemResult(BaseModel):
+    filename: str
+    source: str
+    status: str
+    meeting_id: Optional[int] = None
+    is_fallback: bool = False
+    transcript_cached: bool = False
+    elapsed_seconds: Optional[float] = None
+    error: Optional[str] = None
+    metadata: Optional[Dict[str, Any]] = None
+
+class BatchResponse(BaseModel):
+    total: int
+    succeeded: int
+    failed: int
+    elapsed_seconds: float
+    items: List[BatchItemResult]
 
 class HealthResponse(BaseModel):
     status: str
     service: str
     asr_provider: str
     llm_provider: str
-    timestamp: str
\ No newline at end of file
+    timestamp: str
+
+class JobResponse(BaseModel):
+    job_id: str
+    status: str
+    status_url: str
+    result_url: str
+
+class JobStatusResponse(BaseModel):
+    job_id: str
+    status: str
+    stage: str
+    detail: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: str
+    updated_at: str
@@ -1,27 +1,93 @@
-from app.services.transcription_service import transcribe_audio
+import os
+import asyncio
+import logging
+from datetime import datetime
+from app.core.metrics import ERRORS
+from app.models import MeetingResponse
+from app.core.db import run_db
+from app.core.cache import get_cached_transcript, save_cached_transcript
+from app.services.transcription_service import transcribe_audio_async, TranscriptionCancelledError, TranscriptionTimeoutError, ASR_SERVICE_NAME, ASR_MODEL
 from app.services.gemini_service import generate_summary
+from app.services.audio_preprocessing import preprocess_audio, remove_preprocessed, restore_timestamps
+from app.services.transcript_compaction import compact_transcript
 
-def process_audio_and_generate_summary(audio_file_path: str) -> dict:
+logger = logging.getLogger(__name__)
+
+def meeting_response(meeting_id: int, filename: str, transcript: str, summary: dict, metadata: dict = None, created_at: str = None) -> dict:
+    """MeetingResponse payload for a saved meeting"""
+    return MeetingResponse(
+        id=meeting_id,
+        filename=filename,
+        message=f"Meeting processed successfully with {ASR_SERVICE_NAME} ASR!" if "[FALLBACK]" not in transcript else "Meeting processed with fallback (ASR service unavailable)",
+        summary=summary,
+        transcript_preview=transcript[:200] + "..." if len(transcript) > 200 else transcript,
+        created_at=created_at or datetime.now().isoformat(),
+        metadata=metadata or None
+    ).model_dump()
+
+def _report(progress, stage: str, **info):
+    if progress is not None:
+        progress(stage, **info)
+
+async def process_audio_and_generate_summary_async(audio_file_path: str, audio_hash: str = None, progress=None, is_disconnected=None, on_token=None) -> dict:
+    """Async pipeline: transcription awaits AssemblyAI on the event loop, blocking work runs in threads
+
+    on_token receives summary text fragments as Gemini streams them (called from a worker thread).
+    """
 
     try:
-        transcript = transcribe_audio(audio_file_path)
+        transcribed = await run_db(get_cached_transcript, audio_hash, ASR_MODEL) if audio_hash else None
+        transcript_cached = transcribed is not None
+        metadata = {}
         
-        summary_data = generate_summary(transcript)
+        if transcript_cached:
+            _report(progress, "transcript_cached")
+        else:
+            _report(progress, "preprocessing")
+            prepared = await asyncio.to_thread(preprocess_audio, audio_file_path)
+            metadata["preprocessing"] = prepared["metadata"]
+            try:
+                _report(progress, "transcribing")
+                transcribed = await transcribe_audio_async(prepared["path"], is_disconnected=is_disconnected, progress=progress)
+            finally:
+                remove_preprocessed(audio_file_path, prepared["path"])
+            transcribed = restore_timestamps(transcribed, prepared["metadata"])
+            
+            if audio_hash and "[FALLBACK]" not in transcribed["text"]:
+                await run_db(
+                    save_cached_transcript, audio_hash, ASR_MODEL, transcribed["text"], os.path.getsize(audio_file_path), transcribed["utterances"]
+                )
+        
+        transcript = transcribed["text"]
+        compacted, metadata["compaction"] = await asyncio.to_thread(compact_transcript, transcript, utterances=transcribed["utterances"])
+        _report(progress, "summarizing", transcript_length=len(transcript), estimated_tokens=metadata["compaction"]["estimated_tokens_after"])
+        summary_data = await asyncio.to_thread(generate_summary, compacted, on_token)
         
         return {
             "transcript": transcript,
+            "utterances": transcribed["utterances"],
             "summary": summary_data,
+            "transcript_cached": transcript_cached,
+            "metadata": metadata,
             "success": True
         }
         
+    except (TranscriptionCancelledError, TranscriptionTimeoutError):
+        # A timeout only gets here with ASR_FALLBACK_ENABLED=false; the caller reports it
+        raise
+        
     except Exception as e:
-        print(f"Error in audio processing pipeline: {str(e)}")
+        ERRORS.inc(stage="pipeline")
+        logger.exception("Error in audio processing pipeline")
         return {
             "transcript": "",
+            "utterances": [],
             "summary": {
                 "summary": f"Processing failed: {str(e)}",
                 "key_decisions": ["Processing error"],
-                "action_items": []
+                "action_items": [],
+                "failed": True
             },
+            "transcript_cached": False,
             "success": False
-        }
\ No newline at end of file
+        }
@@ -0,0 +1,182 @@
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+import logging
+from app.core.metrics import PREPROCESS_SECONDS, PREPROCESS_BYTES_SAVED
+from app.services.upload_service import UPLOAD_TEMP_DIR
+from app.services.transcription_service import ASR_PROVIDER
+
+logger = logging.getLogger(__name__)
+
+AUDIO_PREPROCESS_ENABLED = os.getenv("AUDIO_PREPROCESS_ENABLED", "true").lower() in ("1", "true", "yes")
+FFMPEG_BINARY = os.getenv("FFMPEG_BINARY", "ffmpeg")
+AUDIO_PREPROCESS_SAMPLE_RATE = int(os.getenv("AUDIO_PREPROCESS_SAMPLE_RATE", "16000"))
+AUDIO_PREPROCESS_BITRATE = os.getenv("AUDIO_PREPROCESS_BITRATE", "24k")
+AUDIO_SILENCE_THRESHOLD_DB = float(os.getenv("AUDIO_SILENCE_THRESHOLD_DB", "-50"))
+# Leading or trailing silence longer than this is trimmed; pauses inside the recording are kept
+AUDIO_SILENCE_MAX_SECONDS = float(os.getenv("AUDIO_SILENCE_MAX_SECONDS", "2"))
+AUDIO_PREPROCESS_TIMEOUT_SECONDS = float(os.getenv("AUDIO_PREPROCESS_TIMEOUT_SECONDS", "600"))
+# Used to turn bytes saved into an upload time estimate (megabits per second)
+AUDIO_UPLOAD_MBPS = float(os.getenv("AUDIO_UPLOAD_MBPS", "20"))
+
+_SILENCE_START = re.compile(r"silence_start: (-?[\d.]+)")
+_SILENCE_END = re.compile(r"silence_end: ([\d.]+)")
+_DURATION = re.compile(r"Duration: (\d+):(\d+):([\d.]+)")
+
+def parse_edge_silence(ffmpeg_output: str) -> tuple:
+    """(leading silence seconds, start of trailing silence or None) from ffmpeg silencedetect output
+
+    Only silence touching the start or the end of the recording counts, so trimming it
+    leaves the timing of everything in between unchanged.
+    """
+    periods = []
+    for line in ffmpeg_output.splitlines():
+        start = _SILENCE_START.search(line)
+        if start:
+            periods.append([max(float(start.group(1)), 0.0), None])
+        end = _SILENCE_END.search(line)
+        if end and periods and periods[-1][1] is None:
+            periods[-1][1] = float(end.group(1))
+    if not periods:
+        return 0.0, None
+
+    duration = None
+    match = _DURATION.search(ffmpeg_output)
+    if match:
+        hours, minutes, seconds = match.groups()
+        duration = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+    leading = 0.0
+    if periods[0][0] <= 0.01 and periods[0][1] is not None:
+        leading = periods[0][1]
+        periods = periods[1:]
+    trailing_start = None
+    if periods:
+        start, end = periods[-1]
+        # Silence running into the end of the input may be reported without a silence_end
+        if end is None or (duration is not None and end >= duration - 0.05):
+            trailing_start = start
+    return leading, trailing_start
+
+def _detect_edge_silence(ffmpeg: str, audio_file_path: str) -> tuple:
+    """Streaming silencedetect pass over the input; (0, None) if it fails"""
+    command = [
+        ffmpeg, "-hide_banner", "-nostdin", "-i", audio_file_path, "-vn",
+        "-af", f"silencedetect=noise={AUDIO_SILENCE_THRESHOLD_DB}dB:d={AUDIO_SILENCE_MAX_SECONDS}",
+        "-f", "null", "-"
+    ]
+    try:
+        completed = subprocess.run(command, capture_output=True, timeout=AUDIO_PREPROCESS_TIMEOUT_SECONDS)
+    except subprocess.TimeoutExpired:
+        return 0.0, None
+    if completed.returncode != 0:
+        return 0.0, None
+    return parse_edge_silence(completed.stderr.decode("utf-8", "replace"))
+
+def restore_timestamps(transcribed: dict, metadata: dict) -> dict:
+    """Shift utterance times from the trimmed audio back onto the original recording"""
+    offset = (metadata or {}).get("leading_trim_ms") or 0
+    if not offset:
+        return transcribed
+    utterances = [
+        {**utterance, "start": utterance["start"] + offset, "end": utterance["end"] + offset}
+        for utterance in transcribed.get("utterances") or []
+    ]
+    return {**transcribed, "utterances": utterances}
+
+def preprocess_audio(audio_file_path: str) -> dict:
+    """Downmix, resample, trim leading/trailing silence and re-encode a recording to Opus with ffmpeg
+
+    ffmpeg decodes and encodes in a streaming pipeline, so memory use does not grow with
+    the recording length. Returns {"path", "metadata"}; path is the original file when
+    preprocessing is disabled, ASR is local, ffmpeg is unavailable or the result would not be smaller,
+    otherwise a new temp file in UPLOAD_TEMP_DIR. metadata["leading_trim_ms"] is what
+    restore_timestamps adds back to utterance times.
+    """
+    original_bytes = os.path.getsize(audio_file_path)
+    metadata = {"applied": False, "original_bytes": original_bytes}
+
+    if not AUDIO_PREPROCESS_ENABLED:
+        metadata["reason"] = "disabled"
+        return {"path": audio_file_path, "metadata": metadata}
+
+    # Nothing is uploaded, and faster-whisper downmixes and resamples the original itself;
+    # a lossy Opus pass would only cost time and accuracy
+    if ASR_PROVIDER == "local":
+        metadata["reason"] = "local ASR"
+        return {"path": audio_file_path, "metadata": metadata}
+
+    ffmpeg = shutil.which(FFMPEG_BINARY)
+    if ffmpeg is None:
+        logger.info("ffmpeg not found - uploading the original audio")
+        metadata["reason"] = "ffmpeg unavailable"
+        return {"path": audio_file_path, "metadata": metadata}
+
+    start_time = time.time()
+    leading, trailing_start = _detect_edge_silence(ffmpeg, audio_file_path)
+    # Output options: ffmpeg decodes and drops the trimmed ends, so the cut is sample-accurate
+    trim = ["-ss", f"{leading:.3f}"] if leading else []
+    if trailing_start is not None and trailing_start > leading:
+        trim += ["-to", f"{trailing_start:.3f}"]
+
+    # A unique file next to the uploads, never beside the input (batch imports point into BATCH_IMPORT_ROOT)
+    os.makedirs(UPLOAD_TEMP_DIR, exist_ok=True)
+    descriptor, output_path = tempfile.mkstemp(prefix="preprocessed_", suffix=".ogg", dir=UPLOAD_TEMP_DIR)
+    os.close(descriptor)
+    command = [
+        ffmpeg, "-hide_banner", "-loglevel", "error", "-nostdin", "-y",
+        "-i", audio_file_path, *trim,
+        "-vn", "-ac", "1", "-ar", str(AUDIO_PREPROCESS_SAMPLE_RATE),
+        "-c:a", "libopus", "-b:a", AUDIO_PREPROCESS_BITRATE, "-application", "voip",
+        output_path
+    ]
+
+    try:
+        completed = subprocess.run(command, capture_output=True, timeout=AUDIO_PREPROCESS_TIMEOUT_SECONDS)
+    except subprocess.TimeoutExpired:
+        completed = None
+    elapsed = time.time() - start_time
+
+    if completed is None or completed.returncode != 0 or not os.path.exists(output_path):
+        error = "timed out" if completed is None else completed.stderr.decode("utf-8", "replace").strip()[-500:]
+        logger.warning("Audio preprocessing failed (%s) - uploading the original audio", error)
+        remove_preprocessed(audio_file_path, output_path)
+        metadata["reason"] = "ffmpeg failed"
+        return {"path": audio_file_path, "metadata": metadata}
+
+    processed_bytes = os.path.getsize(output_path)
+    if processed_bytes >= original_bytes:
+        logger.info("Preprocessed audio is not smaller - uploading the original audio")
+        remove_preprocessed(audio_file_path, output_path)
+        metadata["reason"] = "no size reduction"
+        return {"path": audio_file_path, "metadata": metadata}
+
+    bytes_saved = original_bytes - processed_bytes
+    upload_seconds_saved = bytes_saved * 8 / (AUDIO_UPLOAD_MBPS * 1_000_000)
+    PREPROCESS_SECONDS.observe(elapsed)
+    PREPROCESS_BYTES_SAVED.inc(bytes_saved)
+    logger.info(
+        "Audio preprocessed in %.1fs: %d -> %d bytes", elapsed, original_bytes, processed_bytes,
+        extra={"preprocess_seconds": round(elapsed, 3), "bytes_saved": bytes_saved}
+    )
+
+    metadata.update({
+        "applied": True,
+        "processed_bytes": processed_bytes,
+        "bytes_saved": bytes_saved,
+        "preprocess_seconds": round(elapsed, 3),
+        "estimated_upload_seconds_saved": round(upload_seconds_saved, 3),
+        "estimated_seconds_saved": round(upload_seconds_saved - elapsed, 3),
+        "leading_trim_ms": round(leading * 1000)
+    })
+    if "-to" in trim:
+        metadata["trailing_trim_from_ms"] = round(trailing_start * 1000)
+    return {"path": output_path, "metadata": metadata}
+
+def remove_preprocessed(audio_file_path: str, processed_path: str):
+    """Delete a preprocessing output, never the original upload"""
+    if processed_path != audio_file_path and os.path.exists(processed_path):
+        os.remove(processed_path)
@@ -0,0 +1,97 @@
+import os
+import time
+import asyncio
+import logging
+from app.core.db import save_meeting_summaries_bulk, run_db
+from app.services.ai_service import process_audio_and_generate_summary_async
+from app.services.transcription_service import ASR_SERVICE_NAME
+from app.services.upload_service import hash_file
+
+logger = logging.getLogger(__name__)
+
+BATCH_MAX_FILES = int(os.getenv("BATCH_MAX_FILES", "100"))
+# Recordings in flight at once; the provider limiters decide how many actually call out
+BATCH_MAX_PARALLEL = int(os.getenv("BATCH_MAX_PARALLEL", "8"))
+# Server-side paths are only accepted below this directory; unset disables path imports
+BATCH_IMPORT_ROOT = os.getenv("BATCH_IMPORT_ROOT")
+
+class BatchPathError(Exception):
+    """Raised when a server-side path is outside BATCH_IMPORT_ROOT or not a readable file"""
+
+def resolve_import_path(path: str) -> str:
+    """Resolve a server-side path and make sure it stays inside BATCH_IMPORT_ROOT"""
+    if not BATCH_IMPORT_ROOT:
+        raise BatchPathError("Server-side paths are disabled (BATCH_IMPORT_ROOT is not set)")
+
+    root = os.path.realpath(BATCH_IMPORT_ROOT)
+    resolved = os.path.realpath(os.path.join(root, path))
+    if os.path.commonpath([root, resolved]) != root:
+        raise BatchPathError(f"Path is outside the import root: {path}")
+    if not os.path.isfile(resolved):
+        raise BatchPathError(f"File not found: {path}")
+    return resolved
+
+async def summarize_batch(items: list) -> list:
+    """Run the pipeline for every item concurrently and save all successes in one transaction
+
+    Each item is a dict with filename, source and either path (plus audio_hash for uploads)
+    or error. Concurrency is bounded by the per-provider limiters in rate_limiter, so a slow
+    provider does not starve the other. Returns one manifest entry per item, in input order.
+    """
+    in_flight = asyncio.Semaphore(BATCH_MAX_PARALLEL)
+    manifest = [
+        {"filename": item["filename"], "source": item["source"], "status": "failed", "error": item.get("error")}
+        for item in items
+    ]
+
+    async def run(index: int, item: dict):
+        if item.get("error"):
+            return None
+        try:
+            async with in_flight:
+                start_time = time.time()
+                audio_hash = item.get("audio_hash") or await asyncio.to_thread(hash_file, item["path"])
+                result = await process_audio_and_generate_summary_async(item["path"], audio_hash=audio_hash)
+        except Exception as e:
+            logger.exception("Batch item %s failed", item["filename"])
+            manifest[index]["error"] = str(e)
+            return None
+
+        manifest[index]["elapsed_seconds"] = round(time.time() - start_time, 3)
+        if not result["success"]:
+            manifest[index]["error"] = result["summary"]["summary"]
+            return None
+        return result
+
+    results = await asyncio.gather(*(run(index, item) for index, item in enumerate(items)))
+
+    completed = [(index, result) for index, result in enumerate(results) if result is not None]
+    if completed:
+        try:
+            meeting_ids = await run_db(
+                save_meeting_summaries_bulk,
+                [
+                    (items[index]["filename"], result["transcript"], result["summary"], result.get("utterances"))
+                    for index, result in completed
+                ],
+                ASR_SERVICE_NAME
+            )
+        except Exception as e:
+            logger.exception("Batch save failed")
+            for index, _ in completed:
+                manifest[index]["error"] = f"Database save failed: {str(e)}"
+            return manifest
+
+        for (index, result), meeting_id in zip(completed, meeting_ids):
+            if meeting_id is None:
+                manifest[index]["error"] = "Database save failed"
+                continue
+            manifest[index].update({
+                "status": "completed",
+                "meeting_id": meeting_id,
+                "is_fallback": "[FALLBACK]" in result["transcript"],
+                "transcript_cached": result["transcript_cached"],
+                "metadata": result.get("metadata") or None
+            })
+
+    return manifest
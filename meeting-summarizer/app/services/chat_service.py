@@ -0,0 +1,116 @@
+import os
+import re
+import asyncio
+import math
+import json
+import threading
+import logging
+from collections import Counter, OrderedDict
+from app.services.summary_chunking import split_transcript
+from app.services.gemini_service import answer_question
+from app.services.transcript_compaction import speaker_lines
+from app.core.db import get_meeting_transcript, get_meeting_utterances, run_db
+
+logger = logging.getLogger(__name__)
+
+CHAT_CHUNK_CHARS = int(os.getenv("CHAT_CHUNK_CHARS", "1200"))
+CHAT_TOP_K = int(os.getenv("CHAT_TOP_K", "4"))
+CHAT_INDEX_CACHE_SIZE = int(os.getenv("CHAT_INDEX_CACHE_SIZE", "64"))
+
+_STOPWORDS = {
+    "a", "an", "the", "and", "or", "but", "if", "of", "to", "in", "on", "at", "for", "with", "by",
+    "is", "are", "was", "were", "be", "been", "it", "this", "that", "these", "those", "i", "you",
+    "we", "they", "he", "she", "what", "who", "when", "where", "which", "how", "why", "do", "does",
+    "did", "about", "from", "as", "so", "not", "no", "yes", "can", "will", "would", "should", "there"
+}
+
+def _tokenize(text: str) -> list:
+    return [token for token in re.findall(r"\w+", text.lower()) if token not in _STOPWORDS]
+
+class TranscriptIndex:
+    """Okapi BM25 over utterance-aligned chunks of one transcript"""
+
+    def __init__(self, transcript: str, chunk_chars: int = CHAT_CHUNK_CHARS, k1: float = 1.5, b: float = 0.75):
+        self.chunks = split_transcript(transcript, chunk_chars) if transcript else []
+        self.k1 = k1
+        self.b = b
+        self.term_counts = [Counter(_tokenize(chunk)) for chunk in self.chunks]
+        self.lengths = [sum(counts.values()) for counts in self.term_counts]
+        self.avg_length = sum(self.lengths) / len(self.lengths) if self.lengths else 0.0
+
+        document_frequency = Counter()
+        for counts in self.term_counts:
+            document_frequency.update(counts.keys())
+        total = len(self.chunks)
+        self.idf = {
+            term: math.log(1 + (total - frequency + 0.5) / (frequency + 0.5))
+            for term, frequency in document_frequency.items()
+        }
+
+    def search(self, query: str, top_k: int = CHAT_TOP_K) -> list:
+        """Return up to top_k (score, chunk) pairs, best first, in a stable order"""
+        terms = [term for term in set(_tokenize(query)) if term in self.idf]
+        if not terms:
+            return []
+
+        scored = []
+        for index, counts in enumerate(self.term_counts):
+            score = 0.0
+            length_norm = self.k1 * (1 - self.b + self.b * self.lengths[index] / (self.avg_length or 1))
+            for term in terms:
+                frequency = counts.get(term)
+                if frequency:
+                    score += self.idf[term] * frequency * (self.k1 + 1) / (frequency + length_norm)
+            if score > 0:
+                scored.append((score, index))
+
+        best = sorted(scored, reverse=True)[:top_k]
+        # Hand passages to the model in transcript order so the conversation reads naturally
+        return [(score, self.chunks[index]) for score, index in sorted(best, key=lambda pair: pair[1])]
+
+def _index_text(meeting_id: int) -> str:
+    """Speaker-labelled lines of the stored utterances, or the raw transcript for meetings kept without them"""
+    utterances = get_meeting_utterances(meeting_id)
+    if utterances:
+        return speaker_lines(utterances)
+    return get_meeting_transcript(meeting_id) or ""
+
+_indexes = OrderedDict()
+_indexes_lock = threading.Lock()
+
+async def get_transcript_index(meeting_id: int) -> TranscriptIndex:
+    """Build a meeting's index once and keep the most recently used ones in memory
+
+    Chunks follow the stored speaker turns, so every passage says who spoke. The text is only
+    loaded (on the database pool) and indexed (in a worker thread) when the index is not cached.
+    """
+    with _indexes_lock:
+        index = _indexes.get(meeting_id)
+        if index is not None:
+            _indexes.move_to_end(meeting_id)
+            return index
+
+    text = await run_db(_index_text, meeting_id)
+    index = await asyncio.to_thread(TranscriptIndex, text)
+
+    with _indexes_lock:
+        _indexes[meeting_id] = index
+        while len(_indexes) > CHAT_INDEX_CACHE_SIZE:
+            _indexes.popitem(last=False)
+    return index
+
+async def answer_meeting_question(meeting: dict, question: str) -> dict:
+    """Retrieve the transcript passages relevant to a question and ask Gemini with only those"""
+    try:
+        summary = json.loads(meeting["summary"])
+    except (TypeError, ValueError):
+        summary = {"summary": meeting.get("summary") or ""}
+
+    passages = []
+    if not meeting.get("is_fallback"):
+        index = await get_transcript_index(meeting["id"])
+        passages = [chunk for _, chunk in index.search(question)]
+
+    logger.info("Chat for meeting %d: %d passages retrieved", meeting["id"], len(passages))
+    answer = await asyncio.to_thread(answer_question, question, summary, passages)
+    return {"answer": answer, "sources": passages}
@@ -0,0 +1,139 @@
+import os
+import io
+import json
+import zlib
+from datetime import datetime
+from app.core.db import EXPORT_COLUMNS, iter_meeting_export
+
+# Rows fetched from SQLite and encoded per step (one Parquet row group / Arrow record batch each)
+EXPORT_BATCH_ROWS = int(os.getenv("EXPORT_BATCH_ROWS", "1000"))
+EXPORT_DEFAULT_FIELDS = ["id", "filename", "created_at", "asr_service", "llm_service", "transcript_length", "is_fallback", "summary"]
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.stream"
+}
+
+class ExportError(ValueError):
+    """Raised for an unknown format or field, or a malformed date bound"""
+
+class ExportUnavailableError(Exception):
+    """Raised when a columnar format is requested but pyarrow is not installed"""
+
+def parse_export_fields(fields: str = None) -> list:
+    """Comma-separated field names -> list in request order (default: everything but the transcript)"""
+    if not fields:
+        return list(EXPORT_DEFAULT_FIELDS)
+
+    selected = []
+    for field in filter(None, (name.strip() for name in fields.split(","))):
+        if field not in EXPORT_COLUMNS:
+            raise ExportError(f"Unknown field {field!r}; available: {', '.join(EXPORT_COLUMNS)}")
+        if field not in selected:
+            selected.append(field)
+    return selected
+
+def parse_export_bound(value: str = None):
+    """ISO date or datetime -> the 'YYYY-MM-DD HH:MM:SS' form created_at is stored in"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).strftime("%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        raise ExportError(f"Invalid date {value!r}; use YYYY-MM-DD or an ISO datetime")
+
+def _ndjson_batches(rows_iter, fields: list):
+    """One NDJSON chunk per batch; the stored summary JSON is spliced in as-is, never parsed"""
+    keys = [json.dumps(field) + ":" for field in fields]
+    raw = [field == "summary" for field in fields]
+    boolean = [field == "is_fallback" for field in fields]
+
+    for rows in rows_iter:
+        lines = []
+        for row in rows:
+            parts = []
+            for key, value, is_raw, is_bool in zip(keys, row, raw, boolean):
+                if is_raw and value is not None:
+                    parts.append(key + value)
+                else:
+                    parts.append(key + json.dumps(bool(value) if is_bool else value, ensure_ascii=False))
+            lines.append("{" + ",".join(parts) + "}\n")
+        yield "".join(lines).encode("utf-8")
+
+def _arrow_schema(pa, fields: list):
+    types = {
+        "id": pa.int64(),
+        "transcript_length": pa.int64(),
+        "is_fallback": pa.bool_(),
+        "created_at": pa.timestamp("s")
+    }
+    return pa.schema([(field, types.get(field, pa.string())) for field in fields])
+
+def _import_pyarrow(output_format: str):
+    try:
+        import pyarrow
+        import pyarrow.parquet
+        return pyarrow
+    except ImportError:
+        raise ExportUnavailableError(f"{output_format} export needs pyarrow (pip install pyarrow)")
+
+def _arrow_batches(pa, rows_iter, fields: list, output_format: str):
+    """Encode each batch as a Parquet row group or an Arrow IPC record batch and yield the new bytes"""
+    schema = _arrow_schema(pa, fields)
+    sink = io.BytesIO()
+    if output_format == "parquet":
+        writer = pa.parquet.ParquetWriter(sink, schema, compression="zstd")
+    else:
+        writer = pa.ipc.new_stream(sink, schema)
+
+    def drain() -> bytes:
+        data = sink.getvalue()
+        sink.seek(0)
+        sink.truncate()
+        return data
+
+    try:
+        for rows in rows_iter:
+            columns = []
+            for index, field in enumerate(schema):
+                values = [row[index] for row in rows]
+                if field.name == "created_at":
+                    # Stored as 'YYYY-MM-DD HH:MM:SS' text, which Arrow casts natively
+                    columns.append(pa.array(values, pa.string()).cast(field.type))
+                elif field.name == "is_fallback":
+                    columns.append(pa.array([None if value is None else bool(value) for value in values], field.type))
+                else:
+                    columns.append(pa.array(values, field.type))
+            writer.write_batch(pa.RecordBatch.from_arrays(columns, schema=schema))
+            yield drain()
+    finally:
+        writer.close()
+    yield drain()
+
+def _gzip(chunks):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+def export_meetings(output_format: str = "ndjson", fields: list = None, since: str = None, until: str = None, compress: bool = False):
+    """Stream meetings (oldest first) as NDJSON, Parquet or an Arrow IPC stream, optionally gzipped
+
+    Returns a generator of byte chunks; rows are read and encoded EXPORT_BATCH_ROWS at a time,
+    so memory use does not grow with the number of meetings. The format and pyarrow are checked
+    here, before any row is read, so those errors surface before a response has started.
+    """
+    if output_format not in EXPORT_MEDIA_TYPES:
+        raise ExportError(f"Unknown format {output_format!r}; use one of {', '.join(EXPORT_MEDIA_TYPES)}")
+    fields = fields or list(EXPORT_DEFAULT_FIELDS)
+    pa = _import_pyarrow(output_format) if output_format != "ndjson" else None
+
+    rows_iter = iter_meeting_export(fields, since, until, EXPORT_BATCH_ROWS)
+    if pa is None:
+        chunks = _ndjson_batches(rows_iter, fields)
+    else:
+        chunks = _arrow_batches(pa, rows_iter, fields, output_format)
+    return _gzip(chunks) if compress else chunks
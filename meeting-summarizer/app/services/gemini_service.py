@@ -1,36 +1,55 @@
-import google.generativeai as genai
 import os
 import json
+import hashlib
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
+from app.core.metrics import LLM_SECONDS, LLM_TOKENS, FALLBACKS, ERRORS
+from app.core.cache import transcript_fingerprint, get_cached_summary, save_cached_summary
+from app.services.summary_chunking import split_transcript, merge_partial_summaries, SUMMARY_CHUNK_CHARS, SUMMARY_MAX_PARALLEL
+from app.services.rate_limiter import gemini_limiter
+from app.services.structured_output import SUMMARY_SCHEMA, StructuredOutputError, parse_summary
 
 load_dotenv()
 
-genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+logger = logging.getLogger(__name__)
 
-def generate_summary(transcript: str) -> dict:
+# Optional override, e.g. a local stand-in such as tools/fake_gemini.py; it is reached over REST
+GEMINI_API_ENDPOINT = os.getenv("GEMINI_API_ENDPOINT")
 
-    try:
-        is_fallback = "[FALLBACK]" in transcript
-        
-        if is_fallback:
-            print("Using fallback transcript (AssemblyAI service unavailable)")
-            return {
-                "summary": "AssemblyAI transcription service is currently unavailable. Please check your API key and internet connection.",
-                "key_decisions": ["Service temporarily unavailable"],
-                "action_items": [
-                    {
-                        "task": "Check AssemblyAI API configuration",
-                        "assignee": "System Administrator",
-                        "deadline": "ASAP"
-                    }
-                ]
-            }
-        else:
-            print("Using REAL transcript for summary generation")
-            
-        model = genai.GenerativeModel("gemini-2.5-flash") 
-            
-        prompt = f"""
+SUMMARY_MODEL = "gemini-2.5-flash"
+
+# Constrain summary responses to the SummaryResponse schema instead of trusting the prompt alone
+SUMMARY_GENERATION_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": SUMMARY_SCHEMA
+}
+
+_genai = None
+_genai_lock = threading.Lock()
+
+def get_genai():
+    """Import and configure the Gemini SDK on first use; the import alone takes most of a second"""
+    global _genai
+    if _genai is None:
+        with _genai_lock:
+            if _genai is None:
+                import google.generativeai as genai
+                if GEMINI_API_ENDPOINT:
+                    genai.configure(api_key=os.getenv("GEMINI_API_KEY"), transport="rest", client_options={"api_endpoint": GEMINI_API_ENDPOINT})
+                else:
+                    genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+                _genai = genai
+    return _genai
+
+def warm_up_gemini():
+    """Load the SDK and build its client ahead of the first request"""
+    from google.generativeai.client import get_default_generative_client
+    get_genai()
+    get_default_generative_client()
+
+SUMMARY_PROMPT_TEMPLATE = """
         Analyze this meeting transcript and return ONLY a valid JSON object with this exact structure:
         {{
             "summary": "concise overall summary of the meeting",
@@ -53,20 +72,224 @@ def generate_summary(transcript: str) -> dict:
         - Extract real action items and decisions from the conversation
         - If no clear assignee or deadline, use "TBD"
         """
+
+REPAIR_PROMPT_TEMPLATE = """
+        The text below was meant to be a valid JSON object matching this JSON schema, but it could not be used ({error}).
+        Return ONLY the corrected JSON object with the same content, no other text.
+        
+        Schema:
+        {schema}
+        
+        Text:
+        {response_text}
+        """
+
+ROLLING_SUMMARY_PROMPT_TEMPLATE = """
+        You are keeping notes on a meeting that is still in progress.
+        Below is the current summary so far, followed by the newest part of the transcript.
+        Update the summary to cover the new part and return ONLY a valid JSON object with the
+        same structure: "summary", "key_decisions" and "action_items" (task, assignee, deadline).
+        
+        Current summary (JSON):
+        {previous_summary}
+        
+        New transcript:
+        {transcript}
+        
+        Important:
+        - Keep earlier decisions and action items unless the new part changes or cancels them
+        - Keep the summary concise; fold older details into it instead of appending
+        - If no clear assignee or deadline, use "TBD"
+        """
+
+MERGE_PROMPT_TEMPLATE = """
+        The following are summaries of consecutive parts of one long meeting, in order.
+        Write a single concise overall summary of the whole meeting.
+        Return ONLY the summary text, no JSON and no markdown.
+        
+        Part summaries:
+        {part_summaries}
+        """
+
+CHAT_PROMPT_TEMPLATE = """
+        Answer the user's question about a meeting using only the information below.
+        If the answer is not in it, say that the meeting content does not cover it.
         
-        response = model.generate_content(prompt)
-        response_text = response.text.strip()
+        Meeting summary: {summary}
+        Key decisions: {key_decisions}
+        Action items: {action_items}
         
-        response_text = response_text.replace('```json', '').replace('```', '').strip()
+        Relevant transcript excerpts:
+        {passages}
+        
+        Question: {question}
+        """
+
+def _prompt_version(chunk_chars: int) -> str:
+    """Fingerprint of everything that shapes a summary besides the transcript and model"""
+    return hashlib.sha256(
+        (SUMMARY_PROMPT_TEMPLATE + MERGE_PROMPT_TEMPLATE + repr(SUMMARY_SCHEMA) + f"chunk_chars={chunk_chars}").encode("utf-8")
+    ).hexdigest()[:12]
+
+# Cached summaries are keyed on this, so editing a template, the response schema or the chunk size invalidates them
+PROMPT_VERSION = _prompt_version(SUMMARY_CHUNK_CHARS)
+
+def _record_usage(response, operation: str):
+    """Count prompt/response tokens from the response's usage metadata, when the SDK provides it"""
+    usage = getattr(response, "usage_metadata", None)
+    if usage is None:
+        return
+    LLM_TOKENS.inc(getattr(usage, "prompt_token_count", 0) or 0, operation=operation, kind="prompt")
+    LLM_TOKENS.inc(getattr(usage, "candidates_token_count", 0) or 0, operation=operation, kind="response")
+
+def _repair_summary(response_text: str, error: Exception) -> dict:
+    """One extra call that asks the model to fix its own malformed output; much cheaper than re-summarizing"""
+    ERRORS.inc(stage="llm_parse")
+    logger.warning("Summary output unusable (%s), attempting one repair pass", error)
+    
+    model = get_genai().GenerativeModel(SUMMARY_MODEL, generation_config=SUMMARY_GENERATION_CONFIG)
+    prompt = REPAIR_PROMPT_TEMPLATE.format(
+        error=error, schema=json.dumps(SUMMARY_SCHEMA), response_text=response_text
+    )
+    with gemini_limiter.slot(), LLM_SECONDS.time(operation="repair"):
+        response = gemini_limiter.call(model.generate_content, prompt)
+    _record_usage(response, "repair")
+    return parse_summary(response.text)
+
+def _generate_summary_json(prompt: str, operation: str, on_token=None) -> dict:
+    """Run a prompt that must answer with a SummaryResponse object and return the validated dict
+
+    With on_token, the response is streamed and each text fragment is passed to it as it arrives.
+    """
+    model = get_genai().GenerativeModel(SUMMARY_MODEL, generation_config=SUMMARY_GENERATION_CONFIG)
+    
+    with gemini_limiter.slot(), LLM_SECONDS.time(operation=operation):
+        if on_token is None:
+            response = gemini_limiter.call(model.generate_content, prompt)
+            response_text = response.text.strip()
+        else:
+            fragments = []
+            # The first chunk is fetched inside generate_content, so a 429 is retried before any token is emitted
+            response = gemini_limiter.call(model.generate_content, prompt, stream=True)
+            for chunk in response:
+                if chunk.text:
+                    fragments.append(chunk.text)
+                    on_token(chunk.text)
+            response_text = "".join(fragments).strip()
+    _record_usage(response, operation)
+    
+    try:
+        return parse_summary(response_text)
+    except StructuredOutputError as e:
+        return _repair_summary(response_text, e)
 
-        summary_data = json.loads(response_text)
-        print("Summary generated successfully")
+def _summarize_chunk(transcript: str, on_token=None) -> dict:
+    """Run the summary prompt over one transcript (or transcript chunk) and parse the JSON"""
+    return _generate_summary_json(SUMMARY_PROMPT_TEMPLATE.format(transcript=transcript), "summarize", on_token)
+
+def _merge_summary_text(partials: list) -> str:
+    """Reduce step: condense the ordered part summaries into one overall summary"""
+    part_summaries = "\n".join(
+        f"Part {index}: {partial.get('summary', '')}" for index, partial in enumerate(partials, 1)
+    )
+    
+    try:
+        model = get_genai().GenerativeModel(SUMMARY_MODEL)
+        with gemini_limiter.slot(), LLM_SECONDS.time(operation="merge"):
+            response = gemini_limiter.call(model.generate_content, MERGE_PROMPT_TEMPLATE.format(part_summaries=part_summaries))
+        _record_usage(response, "merge")
+        return response.text.strip()
+    except Exception as e:
+        ERRORS.inc(stage="llm_merge")
+        logger.warning("Summary merge failed, joining part summaries: %s", e)
+        return merge_partial_summaries(partials)["summary"]
+
+def _summarize_chunks(chunks: list) -> dict:
+    """Map-reduce: summarize chunks concurrently, then merge decisions and action items"""
+    logger.info("Summarizing %d transcript chunks (up to %d in parallel)", len(chunks), SUMMARY_MAX_PARALLEL)
+    
+    with ThreadPoolExecutor(max_workers=min(SUMMARY_MAX_PARALLEL, len(chunks))) as executor:
+        partials = list(executor.map(_summarize_chunk, chunks))
+    
+    summary_data = merge_partial_summaries(partials)
+    summary_data["summary"] = _merge_summary_text(partials)
+    return summary_data
+
+def generate_summary(transcript: str, on_token=None) -> dict:
+
+    try:
+        is_fallback = "[FALLBACK]" in transcript
+        
+        if is_fallback:
+            logger.warning("Using fallback transcript (ASR service unavailable)")
+            return {
+                "summary": "AssemblyAI transcription service is currently unavailable. Please check your API key and internet connection.",
+                "key_decisions": ["Service temporarily unavailable"],
+                "action_items": [
+                    {
+                        "task": "Check AssemblyAI API configuration",
+                        "assignee": "System Administrator",
+                        "deadline": "ASAP"
+                    }
+                ],
+                "failed": True
+            }
+            
+        transcript_hash = transcript_fingerprint(transcript)
+        cached_summary = get_cached_summary(transcript_hash, SUMMARY_MODEL, PROMPT_VERSION)
+        if cached_summary is not None:
+            return cached_summary
+            
+        chunks = split_transcript(transcript)
+        if len(chunks) == 1:
+            summary_data = _summarize_chunk(transcript, on_token)
+        else:
+            summary_data = _summarize_chunks(chunks)
+        
+        logger.info("Summary generated successfully")
+        save_cached_summary(transcript_hash, SUMMARY_MODEL, PROMPT_VERSION, summary_data)
         return summary_data
         
     except Exception as e:
-        print(f"Summary generation error: {str(e)}")
+        ERRORS.inc(stage="llm")
+        FALLBACKS.inc(stage="llm")
+        logger.exception("Summary generation error")
         return {
             "summary": f"Summary generation failed: {str(e)}",
             "key_decisions": ["Processing error"],
-            "action_items": []
-        }
\ No newline at end of file
+            "action_items": [],
+            "failed": True
+        }
+
+def update_rolling_summary(previous_summary: dict, new_transcript: str) -> dict:
+    """Fold the newest transcript segment into a running summary
+
+    Only the previous summary and the new text are sent, so each update costs in proportion
+    to the new audio rather than to the whole meeting so far.
+    """
+    if previous_summary is None:
+        return _generate_summary_json(SUMMARY_PROMPT_TEMPLATE.format(transcript=new_transcript), "summarize")
+    prompt = ROLLING_SUMMARY_PROMPT_TEMPLATE.format(
+        previous_summary=json.dumps(previous_summary), transcript=new_transcript
+    )
+    return _generate_summary_json(prompt, "rolling_summary")
+
+def answer_question(question: str, summary: dict, passages: list) -> str:
+    """Answer a question from the meeting summary plus retrieved transcript excerpts"""
+    action_items = "; ".join(
+        " - ".join(str(item.get(field)) for field in ("task", "assignee", "deadline") if item.get(field))
+        for item in summary.get("action_items") or []
+    )
+    prompt = CHAT_PROMPT_TEMPLATE.format(
+        summary=summary.get("summary", ""),
+        key_decisions="; ".join(summary.get("key_decisions") or []) or "None",
+        action_items=action_items or "None",
+        passages="\n---\n".join(passages) if passages else "No matching excerpts found.",
+        question=question
+    )
+    
+    model = get_genai().GenerativeModel(SUMMARY_MODEL)
+    with gemini_limiter.slot(), LLM_SECONDS.time(operation="chat"):
+        response = gemini_limiter.call(model.generate_content, prompt)
+    _record_usage(response, "chat")
+    return response.text.strip()
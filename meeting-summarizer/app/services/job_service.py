@@ -0,0 +1,106 @@
+import os
+import time
+import uuid
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from app.core.metrics import register_collector
+
+logger = logging.getLogger(__name__)
+
+JOB_MAX_WORKERS = int(os.getenv("JOB_MAX_WORKERS", "4"))
+JOB_MAX_PENDING = int(os.getenv("JOB_MAX_PENDING", "100"))
+JOB_RETENTION_SECONDS = int(os.getenv("JOB_RETENTION_SECONDS", "3600"))
+
+_executor = ThreadPoolExecutor(max_workers=JOB_MAX_WORKERS, thread_name_prefix="meeting-job")
+_jobs = {}
+_lock = threading.Lock()
+
+class JobQueueFullError(Exception):
+    """Raised when too many jobs are already waiting for a worker"""
+
+def _now() -> str:
+    return datetime.now().isoformat()
+
+def _prune_finished_jobs():
+    """Drop finished jobs older than the retention window (caller holds the lock)"""
+    cutoff = time.time() - JOB_RETENTION_SECONDS
+    expired = [
+        job_id for job_id, job in _jobs.items()
+        if job["status"] in ("completed", "failed") and job["finished_at"] < cutoff
+    ]
+    for job_id in expired:
+        del _jobs[job_id]
+
+def update_job(job_id: str, **fields):
+    """Update the stored state of a job"""
+    with _lock:
+        job = _jobs.get(job_id)
+        if job is None:
+            return
+        job.update(fields)
+        job["updated_at"] = _now()
+
+def _run_job(job_id: str, func, args, kwargs):
+    def progress(stage: str, **info):
+        update_job(job_id, stage=stage, detail=info or None)
+
+    update_job(job_id, status="processing", stage="started")
+    try:
+        result = func(*args, progress=progress, **kwargs)
+    except Exception as e:
+        logger.exception("Job %s failed", job_id)
+        update_job(job_id, status="failed", stage="failed", error=str(e), finished_at=time.time())
+        raise
+
+    update_job(job_id, status="completed", stage="completed", result=result, finished_at=time.time())
+    return result
+
+def submit_job(func, *args, job_id: str = None, **kwargs) -> dict:
+    """Queue func on the worker pool; func must accept a `progress` keyword argument"""
+    job_id = job_id or str(uuid.uuid4())
+
+    with _lock:
+        _prune_finished_jobs()
+        pending = sum(1 for job in _jobs.values() if job["status"] == "queued")
+        if pending >= JOB_MAX_PENDING:
+            raise JobQueueFullError(f"Job queue is full ({pending} jobs waiting)")
+
+        _jobs[job_id] = {
+            "job_id": job_id,
+            "status": "queued",
+            "stage": "queued",
+            "detail": None,
+            "error": None,
+            "result": None,
+            "created_at": _now(),
+            "updated_at": _now(),
+            "finished_at": None,
+        }
+
+    _executor.submit(_run_job, job_id, func, args, kwargs)
+    return get_job(job_id)
+
+def get_job(job_id: str):
+    """Return a snapshot of a job's state, or None if unknown"""
+    with _lock:
+        job = _jobs.get(job_id)
+        if job is None:
+            return None
+        return {key: value for key, value in job.items() if key != "finished_at"}
+
+def _collect_metrics() -> list:
+    with _lock:
+        statuses = [job["status"] for job in _jobs.values()]
+    return [
+        ("meeting_jobs", "gauge", "Background jobs held in memory by status", [
+            ({"status": status}, statuses.count(status)) for status in ("queued", "processing", "completed", "failed")
+        ])
+    ]
+
+register_collector(_collect_metrics)
+
+def shutdown_jobs(wait: bool = True):
+    """Stop accepting work and wait for running jobs"""
+    _executor.shutdown(wait=wait)
@@ -0,0 +1,195 @@
+import os
+import time
+import uuid
+import asyncio
+import threading
+import logging
+from datetime import datetime
+from app.core.metrics import ERRORS, register_collector
+from app.services.transcription_service import transcribe_audio_async
+from app.services.gemini_service import update_rolling_summary
+from app.services.transcript_compaction import compact_transcript, speaker_lines
+
+logger = logging.getLogger(__name__)
+
+LIVE_MAX_SESSIONS = int(os.getenv("LIVE_MAX_SESSIONS", "50"))
+# Sessions without a chunk for this long are dropped (they are held in memory only)
+LIVE_SESSION_IDLE_SECONDS = int(os.getenv("LIVE_SESSION_IDLE_SECONDS", "3600"))
+
+_sessions = {}
+_lock = threading.Lock()
+
+class LiveSessionLimitError(Exception):
+    """Raised when LIVE_MAX_SESSIONS sessions are already open"""
+
+class LiveSessionNotFoundError(Exception):
+    """Raised for an unknown, expired or already finished session id"""
+
+class LiveChunkError(Exception):
+    """Raised when a chunk could not be transcribed; the session is unchanged and the chunk can be resent"""
+
+def _now() -> str:
+    return datetime.now().isoformat()
+
+def _prune_idle_sessions():
+    """Drop sessions idle for longer than LIVE_SESSION_IDLE_SECONDS (caller holds the lock)"""
+    cutoff = time.time() - LIVE_SESSION_IDLE_SECONDS
+    expired = [session_id for session_id, session in _sessions.items() if session["last_activity"] < cutoff]
+    for session_id in expired:
+        logger.info("Live session %s expired after %ds idle", session_id, LIVE_SESSION_IDLE_SECONDS)
+        del _sessions[session_id]
+
+def _snapshot(session: dict) -> dict:
+    return {
+        "session_id": session["session_id"],
+        "filename": session["filename"],
+        "chunks": session["chunks"],
+        "duration_ms": session["duration_ms"],
+        "transcript_length": sum(len(part) for part in session["transcript_parts"]),
+        "pending_chars": sum(len(part) for part in session["pending_parts"]),
+        "summary": session["summary"],
+        "created_at": session["created_at"],
+        "updated_at": session["updated_at"]
+    }
+
+def _get(session_id: str) -> dict:
+    with _lock:
+        session = _sessions.get(session_id)
+    if session is None:
+        raise LiveSessionNotFoundError(f"Live session {session_id} not found")
+    return session
+
+def create_session(filename: str = None) -> dict:
+    """Open a live session that accepts audio chunks in order"""
+    session_id = str(uuid.uuid4())
+
+    with _lock:
+        _prune_idle_sessions()
+        if len(_sessions) >= LIVE_MAX_SESSIONS:
+            raise LiveSessionLimitError(f"Too many live sessions open ({len(_sessions)})")
+
+        _sessions[session_id] = {
+            "session_id": session_id,
+            "filename": filename or f"live-{session_id[:8]}",
+            "chunks": 0,
+            "duration_ms": 0,
+            "transcript_parts": [],
+            "utterances": [],
+            # Transcribed text not yet folded into the summary (e.g. after a failed summary update)
+            "pending_parts": [],
+            "summary": None,
+            "created_at": _now(),
+            "updated_at": _now(),
+            "last_activity": time.time(),
+            "lock": asyncio.Lock()
+        }
+        return _snapshot(_sessions[session_id])
+
+def get_session(session_id: str):
+    """Return a snapshot of a live session, or None if unknown"""
+    with _lock:
+        session = _sessions.get(session_id)
+        return _snapshot(session) if session is not None else None
+
+async def _fold_pending(session: dict) -> bool:
+    """Update the rolling summary from the pending text; on failure the text stays pending"""
+    if not session["pending_parts"]:
+        return True
+    new_text, _ = compact_transcript("\n".join(session["pending_parts"]))
+    if not new_text:
+        session["pending_parts"] = []
+        return True
+    try:
+        session["summary"] = await asyncio.to_thread(update_rolling_summary, session["summary"], new_text)
+    except Exception:
+        ERRORS.inc(stage="live_summary")
+        logger.exception("Rolling summary update failed for live session %s", session["session_id"])
+        return False
+    session["pending_parts"] = []
+    return True
+
+async def add_chunk(session_id: str, audio_file_path: str, offset_ms: int = None) -> dict:
+    """Transcribe the next chunk of a live meeting and fold it into the rolling summary
+
+    Chunks of one session are processed one at a time, in arrival order. Utterance times are
+    shifted by offset_ms (the chunk's start within the meeting) or, when omitted, by the end of
+    the previous chunk's last utterance. Speaker labels are assigned per chunk by the ASR provider.
+    """
+    session = _get(session_id)
+
+    async with session["lock"]:
+        if session_id not in _sessions:
+            raise LiveSessionNotFoundError(f"Live session {session_id} not found")
+
+        start_time = time.time()
+        try:
+            transcribed = await transcribe_audio_async(audio_file_path)
+        except Exception as e:
+            raise LiveChunkError(f"Transcription failed for this chunk, resend it: {e}") from e
+        if "[FALLBACK]" in transcribed["text"]:
+            raise LiveChunkError("Transcription failed for this chunk, resend it")
+
+        base_ms = session["duration_ms"] if offset_ms is None else offset_ms
+        utterances = [
+            {**utterance, "start": utterance["start"] + base_ms, "end": utterance["end"] + base_ms}
+            for utterance in transcribed["utterances"]
+        ]
+        text = transcribed["text"]
+
+        session["chunks"] += 1
+        session["utterances"].extend(utterances)
+        if utterances:
+            session["duration_ms"] = max(session["duration_ms"], utterances[-1]["end"])
+        if text:
+            session["transcript_parts"].append(text)
+            session["pending_parts"].append(speaker_lines(utterances) or text)
+        summary_updated = await _fold_pending(session)
+
+        session["updated_at"] = _now()
+        session["last_activity"] = time.time()
+
+        snapshot = _snapshot(session)
+        snapshot["last_chunk"] = {
+            "text": text,
+            "utterances": utterances,
+            "summary_updated": summary_updated,
+            "elapsed_seconds": round(time.time() - start_time, 3)
+        }
+        logger.info(
+            "Live session %s: chunk %d added (%d characters)", session_id, session["chunks"], len(text),
+            extra={"live_chunk_seconds": snapshot["last_chunk"]["elapsed_seconds"]}
+        )
+        return snapshot
+
+async def finish_session(session_id: str) -> dict:
+    """Close a live session and return its pipeline result (transcript, utterances, summary) for saving"""
+    session = _get(session_id)
+
+    async with session["lock"]:
+        with _lock:
+            if _sessions.pop(session_id, None) is None:
+                raise LiveSessionNotFoundError(f"Live session {session_id} not found")
+
+        await _fold_pending(session)
+        summary = session["summary"] or {
+            "summary": "No speech was transcribed in this live session.",
+            "key_decisions": [],
+            "action_items": []
+        }
+
+        return {
+            "filename": session["filename"],
+            "transcript": "\n".join(session["transcript_parts"]),
+            "utterances": session["utterances"],
+            "summary": summary,
+            "transcript_cached": False,
+            "metadata": {"live": {"chunks": session["chunks"], "duration_ms": session["duration_ms"]}},
+            "success": True
+        }
+
+def _collect_metrics() -> list:
+    with _lock:
+        open_sessions = len(_sessions)
+    return [("meeting_live_sessions", "gauge", "Live sessions currently open", [({}, open_sessions)])]
+
+register_collector(_collect_metrics)
@@ -0,0 +1,128 @@
+import os
+import time
+import threading
+import multiprocessing
+import logging
+from concurrent.futures import ProcessPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+LOCAL_ASR_MODEL = os.getenv("LOCAL_ASR_MODEL", "base")
+LOCAL_ASR_COMPUTE_TYPE = os.getenv("LOCAL_ASR_COMPUTE_TYPE", "int8")
+LOCAL_ASR_LANGUAGE = os.getenv("LOCAL_ASR_LANGUAGE") or None
+LOCAL_ASR_WORKERS = int(os.getenv("LOCAL_ASR_WORKERS", str(os.cpu_count() or 1)))
+LOCAL_ASR_THREADS_PER_WORKER = int(os.getenv("LOCAL_ASR_THREADS_PER_WORKER", "1"))
+LOCAL_ASR_SEGMENT_SECONDS = float(os.getenv("LOCAL_ASR_SEGMENT_SECONDS", "60"))
+LOCAL_ASR_SILENCE_DB = float(os.getenv("LOCAL_ASR_SILENCE_DB", "-40"))
+
+SAMPLE_RATE = 16000
+FRAME_SECONDS = 0.03
+
+_pool = None
+_pool_lock = threading.Lock()
+_worker_model = None
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Start the worker pool once; every worker loads the model a single time"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=LOCAL_ASR_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(LOCAL_ASR_MODEL, LOCAL_ASR_COMPUTE_TYPE, LOCAL_ASR_THREADS_PER_WORKER)
+            )
+        return _pool
+
+def shutdown_local_asr():
+    """Stop the worker pool (application shutdown)"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True)
+            _pool = None
+
+def _init_worker(model_name: str, compute_type: str, cpu_threads: int):
+    global _worker_model
+    from faster_whisper import WhisperModel
+    _worker_model = WhisperModel(model_name, device="cpu", compute_type=compute_type, cpu_threads=cpu_threads)
+
+def _transcribe_segment(task: tuple) -> list:
+    """Worker: transcribe one slice of audio and return (start, end, text) on the full timeline"""
+    samples, offset_seconds = task
+    segments, _ = _worker_model.transcribe(samples, language=LOCAL_ASR_LANGUAGE, beam_size=1)
+    return [
+        (offset_seconds + segment.start, offset_seconds + segment.end, segment.text.strip())
+        for segment in segments if segment.text.strip()
+    ]
+
+def find_split_points(samples, sample_rate: int = SAMPLE_RATE, target_seconds: float = LOCAL_ASR_SEGMENT_SECONDS) -> list:
+    """Sample offsets to cut at: the quietest frame within +/-50% of each target boundary"""
+    import numpy as np
+
+    frame = int(sample_rate * FRAME_SECONDS)
+    frame_count = len(samples) // frame
+    if frame_count == 0 or len(samples) <= target_seconds * 1.5 * sample_rate:
+        return []
+
+    frames = samples[:frame_count * frame].reshape(frame_count, frame)
+    rms = np.sqrt(np.mean(np.square(frames, dtype=np.float64), axis=1))
+    level_db = 20 * np.log10(np.maximum(rms, 1e-10))
+
+    target_frames = int(target_seconds / FRAME_SECONDS)
+    cuts = []
+    start = 0
+    while frame_count - start > target_frames * 1.5:
+        window_start = start + target_frames // 2
+        window_end = min(start + target_frames * 3 // 2, frame_count)
+        window = level_db[window_start:window_end]
+        # Prefer real silence nearest the target; otherwise take the quietest frame in the window
+        silent = np.flatnonzero(window <= LOCAL_ASR_SILENCE_DB)
+        if len(silent):
+            best = silent[np.argmin(np.abs(silent + window_start - (start + target_frames)))]
+        else:
+            best = int(np.argmin(window))
+        cut = window_start + int(best)
+        cuts.append(cut * frame)
+        start = cut
+    return cuts
+
+def _segment_tasks(samples, cuts: list, sample_rate: int = SAMPLE_RATE) -> list:
+    """(samples, offset_seconds) worker tasks for the slices between the cut points"""
+    bounds = [0] + cuts + [len(samples)]
+    return [(samples[begin:end], begin / sample_rate) for begin, end in zip(bounds, bounds[1:]) if end > begin]
+
+def _merge_segments(results) -> list:
+    """Flatten the per-slice worker results, already shifted onto the full timeline, in slice order"""
+    return [
+        {"start": round(start, 2), "end": round(end, 2), "text": text}
+        for segment_results in results
+        for start, end, text in segment_results
+    ]
+
+def transcribe_local(audio_file_path: str) -> dict:
+    """Transcribe a recording with faster-whisper on local CPUs
+
+    The audio is decoded once, cut at silences near LOCAL_ASR_SEGMENT_SECONDS and the
+    segments are transcribed in parallel on a process pool; segment timestamps are shifted
+    back onto the recording's timeline. Returns {"text", "segments": [{"start", "end", "text"}]}.
+    Requires the optional faster-whisper package.
+    """
+    from faster_whisper import decode_audio
+
+    start_time = time.time()
+    samples = decode_audio(audio_file_path, sampling_rate=SAMPLE_RATE)
+    tasks = _segment_tasks(samples, find_split_points(samples))
+
+    logger.info("Local ASR: %.1fs of audio in %d segments on %d workers", len(samples) / SAMPLE_RATE, len(tasks), LOCAL_ASR_WORKERS)
+    results = _get_pool().map(_transcribe_segment, tasks)
+
+    segments = _merge_segments(results)
+    elapsed = time.time() - start_time
+    logger.info("Local transcription completed in %.1fs (%d segments)", elapsed, len(segments))
+
+    return {
+        "text": "\n".join(segment["text"] for segment in segments),
+        "segments": segments
+    }
@@ -0,0 +1,226 @@
+import os
+import json
+import uuid
+import logging
+from datetime import datetime
+from app.core.db import (
+    create_pipeline_job, checkpoint_pipeline_job, get_pipeline_job, get_unfinished_pipeline_jobs,
+    claim_pipeline_job, requeue_pipeline_job, complete_pipeline_job, prune_pipeline_jobs, get_meeting_summary, get_meeting_transcript
+)
+from app.core.cache import get_cached_transcript, save_cached_transcript
+from app.core.metrics import ERRORS
+from app.services.ai_service import meeting_response
+from app.services.audio_preprocessing import preprocess_audio, remove_preprocessed, restore_timestamps
+from app.services.transcription_service import transcribe_audio, TranscriptionTimeoutError, ASR_SERVICE_NAME, ASR_MODEL
+from app.services.gemini_service import generate_summary
+from app.services.transcript_compaction import compact_transcript
+from app.services.job_service import submit_job, JobQueueFullError, JOB_RETENTION_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# Background job audio is kept here (not in a temp file) until the job completes
+PIPELINE_AUDIO_DIR = os.getenv("PIPELINE_AUDIO_DIR", "pipeline_audio")
+PIPELINE_RESUME_ON_STARTUP = os.getenv("PIPELINE_RESUME_ON_STARTUP", "true").lower() in ("1", "true", "yes")
+# A job that keeps crashing its worker is given up after this many runs
+PIPELINE_MAX_ATTEMPTS = int(os.getenv("PIPELINE_MAX_ATTEMPTS", "3"))
+
+class PipelineJobNotRetryableError(Exception):
+    """Raised when retrying a job that has not failed, or whose audio is gone"""
+
+def _timestamp(seconds: float) -> str:
+    return datetime.fromtimestamp(seconds).isoformat()
+
+def _remove_audio(audio_path: str):
+    if audio_path and os.path.exists(audio_path):
+        os.remove(audio_path)
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def submit_pipeline_job(file_path: str, filename: str, audio_hash: str = None) -> dict:
+    """Move an upload into PIPELINE_AUDIO_DIR, checkpoint it and queue the job; return the job snapshot"""
+    job_id = str(uuid.uuid4())
+    os.makedirs(PIPELINE_AUDIO_DIR, exist_ok=True)
+    audio_path = os.path.join(PIPELINE_AUDIO_DIR, job_id + os.path.splitext(file_path)[1])
+    os.replace(file_path, audio_path)
+    create_pipeline_job(job_id, filename, audio_path, audio_hash)
+
+    try:
+        return submit_job(run_pipeline_job, job_id, job_id=job_id)
+    except JobQueueFullError:
+        checkpoint_pipeline_job(job_id, "failed", error="Job queue is full", audio_path=None)
+        _remove_audio(audio_path)
+        raise
+
+def run_pipeline_job(job_id: str, progress=None) -> dict:
+    """Run (or resume) a checkpointed job: stored audio -> ASR job id -> transcript -> summary -> saved meeting
+
+    Every completed stage is written to pipeline_jobs first, so after a restart the job continues
+    from the last checkpoint; an AssemblyAI job that was already submitted is re-attached by id.
+    """
+    def report(stage: str, **info):
+        if progress is not None:
+            progress(stage, **info)
+
+    job = get_pipeline_job(job_id)
+    transcript, utterances, summary = job["transcript"], job["utterances"], job["summary"]
+    metadata = {"resumed": job["attempts"] > 1}
+
+    try:
+        if transcript is None:
+            cached = get_cached_transcript(job["audio_hash"], ASR_MODEL) if job["audio_hash"] else None
+            if cached is not None:
+                report("transcript_cached")
+                transcribed = cached
+            elif job["asr_transcript_id"]:
+                report("asr_reattaching", transcript_id=job["asr_transcript_id"])
+                transcribed = transcribe_audio(job["audio_path"], transcript_id=job["asr_transcript_id"])
+                transcribed = restore_timestamps(transcribed, {"leading_trim_ms": job["asr_offset_ms"]})
+            else:
+                report("preprocessing")
+                prepared = preprocess_audio(job["audio_path"])
+                metadata["preprocessing"] = prepared["metadata"]
+                # The trim offset is checkpointed with the ASR job id, so a re-attached transcript is shifted too
+                offset_ms = prepared["metadata"].get("leading_trim_ms") or 0
+                try:
+                    report("transcribing")
+                    transcribed = transcribe_audio(
+                        prepared["path"],
+                        on_submitted=lambda transcript_id: checkpoint_pipeline_job(
+                            job_id, "transcribing", asr_transcript_id=transcript_id, asr_offset_ms=offset_ms
+                        )
+                    )
+                finally:
+                    remove_preprocessed(job["audio_path"], prepared["path"])
+                transcribed = restore_timestamps(transcribed, prepared["metadata"])
+
+            transcript, utterances = transcribed["text"], transcribed["utterances"]
+            if cached is None and job["audio_hash"] and "[FALLBACK]" not in transcript:
+                save_cached_transcript(job["audio_hash"], ASR_MODEL, transcript, os.path.getsize(job["audio_path"]), utterances)
+            checkpoint_pipeline_job(job_id, "transcribed", transcript=transcript, utterances=utterances)
+        else:
+            report("transcript_checkpoint")
+
+        if summary is None:
+            compacted, metadata["compaction"] = compact_transcript(transcript, utterances=utterances)
+            report("summarizing", transcript_length=len(transcript), estimated_tokens=metadata["compaction"]["estimated_tokens_after"])
+            summary = generate_summary(compacted)
+            checkpoint_pipeline_job(job_id, "summarized", summary=summary)
+
+        report("saving")
+        meeting_id = complete_pipeline_job(job_id, job["filename"], transcript, summary, ASR_SERVICE_NAME, utterances)
+        report("saved", meeting_id=meeting_id)
+
+    except TranscriptionTimeoutError as e:
+        # The transcript is still running at AssemblyAI: keep the audio and job id so a retry re-attaches
+        ERRORS.inc(stage="pipeline")
+        checkpoint_pipeline_job(job_id, "failed", error=str(e))
+        report("failed", retryable=True)
+        raise
+
+    except Exception as e:
+        ERRORS.inc(stage="pipeline")
+        checkpoint_pipeline_job(job_id, "failed", error=str(e), audio_path=None)
+        _remove_audio(job["audio_path"])
+        raise
+
+    _remove_audio(job["audio_path"])
+    checkpoint_pipeline_job(job_id, "completed", audio_path=None)
+    return meeting_response(meeting_id, job["filename"], transcript, summary, metadata)
+
+def resume_pipeline_jobs() -> int:
+    """Re-queue unfinished jobs left by workers that are no longer running (application startup)
+
+    Jobs owned by another live worker process on this host are left alone; the SQLite database is
+    local to the host, so process liveness is enough to tell an orphaned job from a running one.
+    """
+    for audio_path in prune_pipeline_jobs(JOB_RETENTION_SECONDS):
+        _remove_audio(audio_path)
+    if not PIPELINE_RESUME_ON_STARTUP:
+        return 0
+
+    resumed = 0
+    for job_id, owner_pid in get_unfinished_pipeline_jobs():
+        if owner_pid != os.getpid() and owner_pid is not None and _pid_alive(owner_pid):
+            continue
+        if not claim_pipeline_job(job_id, owner_pid):
+            continue
+
+        job = get_pipeline_job(job_id)
+        if job["attempts"] > PIPELINE_MAX_ATTEMPTS:
+            logger.warning("Giving up on job %s after %d attempts", job_id, job["attempts"] - 1)
+            checkpoint_pipeline_job(job_id, "failed", error="Gave up after repeated worker restarts", audio_path=None)
+            _remove_audio(job["audio_path"])
+            continue
+
+        try:
+            submit_job(run_pipeline_job, job_id, job_id=job_id)
+        except JobQueueFullError:
+            logger.warning("Job queue full, job %s stays queued for the next restart", job_id)
+            break
+        logger.info("Resuming job %s from stage %s", job_id, job["stage"])
+        resumed += 1
+
+    if resumed:
+        logger.info("Resumed %d unfinished pipeline jobs", resumed)
+    return resumed
+
+def retry_pipeline_job(job_id: str):
+    """Re-queue a failed job that kept its audio (an ASR timeout); None if the job is unknown
+
+    The job resumes from its last checkpoint, re-attaching to its AssemblyAI transcript.
+    """
+    job = get_pipeline_job(job_id)
+    if job is None:
+        return None
+    if not (job["audio_path"] and os.path.exists(job["audio_path"]) and requeue_pipeline_job(job_id)):
+        raise PipelineJobNotRetryableError(f"Job {job_id} is {job['stage']} and cannot be retried")
+
+    try:
+        snapshot = submit_job(run_pipeline_job, job_id, job_id=job_id)
+    except JobQueueFullError:
+        checkpoint_pipeline_job(job_id, "failed", error=job["error"])
+        raise
+    logger.info("Retrying job %s from its checkpoint", job_id)
+    return snapshot
+
+def _job_detail(job: dict):
+    detail = {}
+    if job["asr_transcript_id"]:
+        detail["asr_transcript_id"] = job["asr_transcript_id"]
+    if job["stage"] == "failed" and job["audio_path"]:
+        detail["retryable"] = True
+    return detail or None
+
+def get_pipeline_job_status(job_id: str):
+    """Job snapshot rebuilt from its checkpoint, for jobs this process does not hold in memory"""
+    job = get_pipeline_job(job_id)
+    if job is None:
+        return None
+
+    status = job["stage"] if job["stage"] in ("queued", "completed", "failed") else "processing"
+    result = None
+    if job["stage"] == "completed" and job["meeting_id"] is not None:
+        meeting = get_meeting_summary(job["meeting_id"])
+        if meeting is not None:
+            result = meeting_response(
+                meeting["id"], meeting["filename"], get_meeting_transcript(meeting["id"]) or "",
+                json.loads(meeting["summary"]), created_at=meeting["created_at"]
+            )
+
+    return {
+        "job_id": job_id,
+        "status": status,
+        "stage": job["stage"],
+        "detail": _job_detail(job),
+        "error": job["error"],
+        "result": result,
+        "created_at": _timestamp(job["created_at"]),
+        "updated_at": _timestamp(job["updated_at"])
+    }
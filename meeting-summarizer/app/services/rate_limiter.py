@@ -0,0 +1,277 @@
+import os
+import re
+import time
+import random
+import asyncio
+import threading
+import contextlib
+import logging
+from collections import deque
+from app.core.metrics import register_collector
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_MAX_RETRIES = int(os.getenv("RATE_LIMIT_MAX_RETRIES", "5"))
+RATE_LIMIT_BACKOFF_BASE_SECONDS = float(os.getenv("RATE_LIMIT_BACKOFF_BASE_SECONDS", "1"))
+RATE_LIMIT_BACKOFF_MAX_SECONDS = float(os.getenv("RATE_LIMIT_BACKOFF_MAX_SECONDS", "30"))
+
+ASSEMBLYAI_MAX_CONCURRENCY = int(os.getenv("ASSEMBLYAI_MAX_CONCURRENCY", "5"))
+ASSEMBLYAI_REQUESTS_PER_MINUTE = float(os.getenv("ASSEMBLYAI_REQUESTS_PER_MINUTE", "600"))
+GEMINI_MAX_CONCURRENCY = int(os.getenv("GEMINI_MAX_CONCURRENCY", "8"))
+GEMINI_REQUESTS_PER_MINUTE = float(os.getenv("GEMINI_REQUESTS_PER_MINUTE", "60"))
+
+_RATE_LIMIT_PATTERN = re.compile(r"\b429\b|rate limit|too many requests|resource.exhausted|quota", re.IGNORECASE)
+
+def is_rate_limited(error: Exception) -> bool:
+    """True for provider 429 / quota errors (httpx, google-api-core or SDK message text)"""
+    response = getattr(error, "response", None)
+    if getattr(response, "status_code", None) == 429:
+        return True
+    if getattr(error, "code", None) == 429:
+        return True
+    return bool(_RATE_LIMIT_PATTERN.search(str(error)))
+
+def _retry_after(error: Exception):
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+def backoff_delay(attempt: int, retry_after: float = None) -> float:
+    """Full-jitter exponential backoff, never shorter than the provider's Retry-After"""
+    delay = random.uniform(0, min(RATE_LIMIT_BACKOFF_MAX_SECONDS, RATE_LIMIT_BACKOFF_BASE_SECONDS * 2 ** attempt))
+    return max(delay, retry_after or 0.0)
+
+class _SlotWaiter:
+    """A thread queued for a slot in slot(); granted is set under the limiter lock"""
+
+    def __init__(self):
+        self.granted = False
+
+class ProviderLimiter:
+    """Token bucket (requests per minute) plus a concurrency cap for one provider
+
+    Works from worker threads and from the event loop alike. Callers waiting for a
+    concurrency slot queue in one FIFO: a released slot is handed to the oldest waiter,
+    a thread (woken through a Condition) or a coroutine (through its future).
+    """
+
+    def __init__(self, name: str, max_concurrency: int, requests_per_minute: float):
+        self.name = name
+        self.max_concurrency = max(1, max_concurrency)
+        self.rate = max(requests_per_minute, 0.001) / 60.0
+        self.capacity = max(1.0, min(float(self.max_concurrency), requests_per_minute / 60.0 * 10))
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.in_flight = 0
+        self.lock = threading.Lock()
+        self.slot_granted = threading.Condition(self.lock)
+        self.waiters = deque()
+        self.stats = {
+            "waiting": 0,
+            "max_waiting": 0,
+            "acquired": 0,
+            "rate_limited": 0,
+            "retries_exhausted": 0,
+            "wait_seconds": 0.0
+        }
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def _try_take_token(self) -> float:
+        """Take a token if one is available; otherwise return how long until one is"""
+        with self.lock:
+            self._refill(time.monotonic())
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def _take_free_slot(self) -> bool:
+        """Take a slot without waiting; only when nobody is queued, so waiters keep their turn. Hold the lock"""
+        if self.in_flight < self.max_concurrency and not self.waiters:
+            self.in_flight += 1
+            return True
+        return False
+
+    def _release_slot(self):
+        """Hand the slot to the oldest live waiter, or free it"""
+        with self.lock:
+            while self.waiters:
+                waiter = self.waiters.popleft()
+                if isinstance(waiter, _SlotWaiter):
+                    waiter.granted = True
+                    self.slot_granted.notify_all()
+                    return
+                if waiter.done():
+                    continue
+                try:
+                    waiter.get_loop().call_soon_threadsafe(self._grant_future, waiter)
+                except RuntimeError:
+                    # Its event loop is closed; nobody is left to take the slot
+                    continue
+                return
+            self.in_flight -= 1
+
+    def _grant_future(self, future: asyncio.Future):
+        # Runs on the waiter's loop; a waiter cancelled since it was picked passes the slot on
+        if future.cancelled():
+            self._release_slot()
+        else:
+            future.set_result(None)
+
+    def _acquire_slot(self):
+        with self.lock:
+            if self._take_free_slot():
+                return
+            waiter = _SlotWaiter()
+            self.waiters.append(waiter)
+            self.slot_granted.wait_for(lambda: waiter.granted)
+
+    async def _acquire_slot_async(self):
+        with self.lock:
+            if self._take_free_slot():
+                return
+            future = asyncio.get_running_loop().create_future()
+            self.waiters.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self.lock:
+                queued = future in self.waiters
+                if queued:
+                    self.waiters.remove(future)
+            # Granted just before the cancellation arrived: give the slot back
+            if not queued and future.done() and not future.cancelled():
+                self._release_slot()
+            raise
+
+    def _wait_started(self):
+        with self.lock:
+            self.stats["waiting"] += 1
+            self.stats["max_waiting"] = max(self.stats["max_waiting"], self.stats["waiting"])
+
+    def _wait_finished(self, waited: float):
+        with self.lock:
+            self.stats["waiting"] -= 1
+            self.stats["acquired"] += 1
+            self.stats["wait_seconds"] += waited
+
+    def _record(self, key: str):
+        with self.lock:
+            self.stats[key] += 1
+
+    def throttle(self):
+        """Block until the token bucket allows one more request"""
+        while True:
+            delay = self._try_take_token()
+            if delay == 0:
+                return
+            time.sleep(delay)
+
+    async def throttle_async(self):
+        while True:
+            delay = self._try_take_token()
+            if delay == 0:
+                return
+            await asyncio.sleep(delay)
+
+    @contextlib.contextmanager
+    def slot(self):
+        """Hold one of the provider's concurrent-call slots"""
+        start = time.monotonic()
+        self._wait_started()
+        try:
+            self._acquire_slot()
+        finally:
+            self._wait_finished(time.monotonic() - start)
+        try:
+            yield
+        finally:
+            self._release_slot()
+
+    @contextlib.asynccontextmanager
+    async def slot_async(self):
+        start = time.monotonic()
+        self._wait_started()
+        try:
+            await self._acquire_slot_async()
+        finally:
+            self._wait_finished(time.monotonic() - start)
+        try:
+            yield
+        finally:
+            self._release_slot()
+
+    def call(self, func, *args, **kwargs):
+        """Run one request under the token bucket, retrying rate-limit errors with jittered backoff"""
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            self.throttle()
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                if not is_rate_limited(e):
+                    raise
+                self._record("rate_limited")
+                if attempt == RATE_LIMIT_MAX_RETRIES:
+                    self._record("retries_exhausted")
+                    raise
+                delay = backoff_delay(attempt, _retry_after(e))
+                logger.warning("%s rate limited, retrying in %.1fs (attempt %d/%d)", self.name, delay, attempt + 1, RATE_LIMIT_MAX_RETRIES)
+                time.sleep(delay)
+
+    async def call_async(self, func, *args, **kwargs):
+        """Async variant of call for coroutine functions"""
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            await self.throttle_async()
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                if not is_rate_limited(e):
+                    raise
+                self._record("rate_limited")
+                if attempt == RATE_LIMIT_MAX_RETRIES:
+                    self._record("retries_exhausted")
+                    raise
+                delay = backoff_delay(attempt, _retry_after(e))
+                logger.warning("%s rate limited, retrying in %.1fs (attempt %d/%d)", self.name, delay, attempt + 1, RATE_LIMIT_MAX_RETRIES)
+                await asyncio.sleep(delay)
+
+    def get_stats(self) -> dict:
+        with self.lock:
+            self._refill(time.monotonic())
+            return {
+                "max_concurrency": self.max_concurrency,
+                "requests_per_minute": round(self.rate * 60, 3),
+                "in_flight": self.in_flight,
+                "queue_depth": self.stats["waiting"],
+                "max_queue_depth": self.stats["max_waiting"],
+                "acquired": self.stats["acquired"],
+                "rate_limited": self.stats["rate_limited"],
+                "retries_exhausted": self.stats["retries_exhausted"],
+                "wait_seconds_total": round(self.stats["wait_seconds"], 3),
+                "tokens_available": round(self.tokens, 3)
+            }
+
+assemblyai_limiter = ProviderLimiter("AssemblyAI", ASSEMBLYAI_MAX_CONCURRENCY, ASSEMBLYAI_REQUESTS_PER_MINUTE)
+gemini_limiter = ProviderLimiter("Gemini", GEMINI_MAX_CONCURRENCY, GEMINI_REQUESTS_PER_MINUTE)
+
+def get_rate_limiter_stats() -> dict:
+    return {limiter.name: limiter.get_stats() for limiter in (assemblyai_limiter, gemini_limiter)}
+
+def _collect_metrics() -> list:
+    stats = get_rate_limiter_stats()
+    def samples(key):
+        return [({"provider": provider}, values[key]) for provider, values in stats.items()]
+    return [
+        ("meeting_provider_in_flight", "gauge", "Provider calls currently holding a concurrency slot", samples("in_flight")),
+        ("meeting_provider_queue_depth", "gauge", "Callers waiting for a provider concurrency slot", samples("queue_depth")),
+        ("meeting_provider_rate_limited_total", "counter", "Rate-limit responses received from the provider", samples("rate_limited")),
+        ("meeting_provider_wait_seconds_total", "counter", "Time spent waiting for provider concurrency slots", samples("wait_seconds_total")),
+    ]
+
+register_collector(_collect_metrics)
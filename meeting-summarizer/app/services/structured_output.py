@@ -0,0 +1,117 @@
+import json
+from pydantic import ValidationError
+from app.models import SummaryResponse
+
+# JSON Schema keywords the Gemini response_schema (an OpenAPI subset) rejects
+_UNSUPPORTED_KEYS = {"title", "default", "examples", "additionalProperties", "$schema"}
+
+class StructuredOutputError(ValueError):
+    """Model output that could not be parsed or validated against the expected schema"""
+
+def _inline_schema(node, definitions: dict):
+    if isinstance(node, list):
+        return [_inline_schema(item, definitions) for item in node]
+    if not isinstance(node, dict):
+        return node
+
+    if "$ref" in node:
+        return _inline_schema(definitions[node["$ref"].rsplit("/", 1)[-1]], definitions)
+
+    variants = node.get("anyOf")
+    if variants is not None:
+        # Optional[X] is rendered as anyOf [X, null]; Gemini spells that as X with nullable
+        non_null = [variant for variant in variants if variant.get("type") != "null"]
+        if len(non_null) == 1:
+            merged = {key: value for key, value in node.items() if key != "anyOf"}
+            merged.update(non_null[0])
+            merged = _inline_schema(merged, definitions)
+            if len(non_null) < len(variants):
+                merged["nullable"] = True
+            return merged
+
+    return {
+        key: _inline_schema(value, definitions)
+        for key, value in node.items()
+        if key not in _UNSUPPORTED_KEYS and key != "$defs"
+    }
+
+def gemini_schema(model: type) -> dict:
+    """A pydantic model's JSON schema with $refs inlined and only the keywords Gemini's response_schema accepts"""
+    schema = model.model_json_schema()
+    return _inline_schema(schema, schema.get("$defs", {}))
+
+def _strip_fences(text: str) -> str:
+    text = text.strip()
+    if text.startswith("```"):
+        text = text.split("\n", 1)[1] if "\n" in text else ""
+        if text.rstrip().endswith("```"):
+            text = text.rstrip()[:-3]
+    return text.strip()
+
+def extract_json(text: str) -> dict:
+    """Parse the first JSON object in model output, tolerating fences, surrounding prose and truncation
+
+    Scans once from the first "{", tracking string state and open brackets. A balanced object is
+    parsed as-is; output cut off mid-object (e.g. at the token limit) is closed and parsed.
+    """
+    text = _strip_fences(text)
+    start = text.find("{")
+    if start == -1:
+        raise StructuredOutputError("No JSON object in model output")
+
+    stack = []
+    in_string = False
+    escaped = False
+    for index in range(start, len(text)):
+        char = text[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            stack.append("}" if char == "{" else "]")
+        elif char in "}]":
+            if not stack or stack.pop() != char:
+                raise StructuredOutputError(f"Unbalanced '{char}' at offset {index}")
+            if not stack:
+                return _loads(text[start:index + 1])
+
+    # Truncated: drop a dangling partial token, then close the open string and brackets
+    fragment = text[start:]
+    if escaped:
+        fragment = fragment[:-1]
+    if in_string:
+        fragment += '"'
+    fragment = fragment.rstrip().rstrip(",:")
+    return _loads(fragment + "".join(reversed(stack)))
+
+def _loads(candidate: str) -> dict:
+    try:
+        data = json.loads(candidate)
+    except json.JSONDecodeError as e:
+        raise StructuredOutputError(f"Invalid JSON in model output: {e}") from e
+    if not isinstance(data, dict):
+        raise StructuredOutputError("Model output is not a JSON object")
+    return data
+
+def parse_structured(text: str, model: type = SummaryResponse) -> dict:
+    """Extract and validate model output, returning the validated data as a plain dict"""
+    try:
+        return model.model_validate(extract_json(text)).model_dump()
+    except ValidationError as e:
+        raise StructuredOutputError(f"Model output does not match {model.__name__}: {e.error_count()} errors") from e
+
+def parse_summary(text: str) -> dict:
+    """Validated summary dict; missing assignees and deadlines become "TBD" as the prompt asks"""
+    summary = parse_structured(text, SummaryResponse)
+    for item in summary["action_items"]:
+        item["assignee"] = item["assignee"] or "TBD"
+        item["deadline"] = item["deadline"] or "TBD"
+    return summary
+
+SUMMARY_SCHEMA = gemini_schema(SummaryResponse)
@@ -0,0 +1,98 @@
+import os
+import re
+
+SUMMARY_CHUNK_CHARS = int(os.getenv("SUMMARY_CHUNK_CHARS", "24000"))
+SUMMARY_MAX_PARALLEL = int(os.getenv("SUMMARY_MAX_PARALLEL", "4"))
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+_SPEAKER_TURN = re.compile(r"\s+(?=(?:Speaker [A-Z0-9]+|[A-Z][a-z]+):\s)")
+
+def _split_utterances(transcript: str) -> list:
+    """Split on line breaks (one utterance per line) or inline "Speaker X:" turns"""
+    lines = [line.strip() for line in transcript.splitlines() if line.strip()]
+    if len(lines) > 1:
+        return lines
+    return [turn.strip() for turn in _SPEAKER_TURN.split(transcript) if turn.strip()]
+
+def _split_oversized(text: str, max_chars: int) -> list:
+    """Break a single utterance that is longer than a chunk at sentence, then word, boundaries"""
+    pieces = []
+    for sentence in _SENTENCE_END.split(text):
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(" ", 0, max_chars)
+            if cut <= 0:
+                cut = max_chars
+            pieces.append(sentence[:cut].strip())
+            sentence = sentence[cut:].strip()
+        if sentence:
+            pieces.append(sentence)
+    return pieces
+
+def split_transcript(transcript: str, max_chars: int = SUMMARY_CHUNK_CHARS) -> list:
+    """Pack whole utterances into chunks of at most max_chars characters"""
+    if len(transcript) <= max_chars:
+        return [transcript]
+
+    units = []
+    for utterance in _split_utterances(transcript):
+        if len(utterance) > max_chars:
+            units.extend(_split_oversized(utterance, max_chars))
+        else:
+            units.append(utterance)
+
+    chunks = []
+    current = []
+    current_length = 0
+    for unit in units:
+        if current and current_length + len(unit) + 1 > max_chars:
+            chunks.append("\n".join(current))
+            current = []
+            current_length = 0
+        current.append(unit)
+        current_length += len(unit) + 1
+
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+def _normalize(text) -> str:
+    return re.sub(r"[^a-z0-9]+", " ", str(text or "").lower()).strip()
+
+def _is_unknown(value) -> bool:
+    return not value or _normalize(value) in ("tbd", "none", "unknown", "n a")
+
+def merge_partial_summaries(partials: list) -> dict:
+    """Combine per-chunk summaries: keep order, drop duplicate decisions and action items"""
+    key_decisions = []
+    seen_decisions = set()
+    action_items = []
+    items_by_task = {}
+
+    for partial in partials:
+        for decision in partial.get("key_decisions", []):
+            key = _normalize(decision)
+            if key and key not in seen_decisions:
+                seen_decisions.add(key)
+                key_decisions.append(decision)
+
+        for item in partial.get("action_items", []):
+            key = _normalize(item.get("task"))
+            if not key:
+                continue
+
+            existing = items_by_task.get(key)
+            if existing is None:
+                items_by_task[key] = dict(item)
+                action_items.append(items_by_task[key])
+                continue
+
+            # A later chunk often names the owner or date for a task raised earlier
+            for field in ("assignee", "deadline"):
+                if _is_unknown(existing.get(field)) and not _is_unknown(item.get(field)):
+                    existing[field] = item[field]
+
+    return {
+        "summary": " ".join(partial.get("summary", "") for partial in partials).strip(),
+        "key_decisions": key_decisions,
+        "action_items": action_items
+    }
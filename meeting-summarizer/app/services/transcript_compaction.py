@@ -0,0 +1,181 @@
+import os
+import re
+import math
+import logging
+from collections import Counter
+from app.core.metrics import COMPACTION_TOKENS
+
+logger = logging.getLogger(__name__)
+
+# 0 = off; 1 = drop fillers and stutters; 2 = also drop backchannels and repeated sentences and
+# merge consecutive turns of one speaker; 3 = also keep only the most salient sentences
+COMPACTION_LEVEL = int(os.getenv("COMPACTION_LEVEL", "1"))
+# Level 3: share of sentences kept (action/decision sentences are always kept)
+COMPACTION_KEEP_RATIO = float(os.getenv("COMPACTION_KEEP_RATIO", "0.6"))
+# Level 3 only applies to transcripts with at least this many sentences
+COMPACTION_MIN_SENTENCES = int(os.getenv("COMPACTION_MIN_SENTENCES", "30"))
+# Level 2: a sentence repeating one of the previous N sentences is dropped
+COMPACTION_REPEAT_WINDOW = int(os.getenv("COMPACTION_REPEAT_WINDOW", "20"))
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+_SPEAKER_LABEL = re.compile(r"^((?:Speaker [A-Z0-9]+|[A-Z][\w .'-]{0,30}?):)\s+")
+_FILLERS = re.compile(r"(?<![\w-])(?:u+m+|u+h+|e+r+m+|e+r+|a+h+|h+m+)(?![\w-])[,.]?\s*", re.IGNORECASE)
+_PHRASE_FILLERS = re.compile(r"(?:^|,)\s*(?:you know|I mean|like|sort of|kind of|so yeah)\s*,\s*", re.IGNORECASE)
+# Only single letters ("I I think") and filler words repeat as stutters; "had had" or "that that" are grammar
+_STUTTER = re.compile(r"\b([a-z]|so|well|like|yeah|okay)(?:,?\s+\1\b)+", re.IGNORECASE)
+_BACKCHANNELS = {"ok", "okay", "yeah", "yep", "right", "mm hmm", "uh huh", "mhm", "sure", "got it", "i see", "cool"}
+# Sentences that usually carry decisions or action items; never dropped by level 3
+_CUES = re.compile(
+    r"\b(?:will|going to|need(?:s)? to|should|must|decid\w*|agree\w*|deadline|due|by (?:monday|tuesday|wednesday|thursday|friday|"
+    r"saturday|sunday|tomorrow|next|end of)|action|follow(?:ing)? up|assign\w*|owner|next steps?|todo|to-do|"
+    r"january|february|march|april|june|july|august|september|october|november|december|\d{1,2}(?:st|nd|rd|th)|\d{1,2}[:/]\d{2})\b",
+    re.IGNORECASE
+)
+_WORD = re.compile(r"[a-z0-9']+")
+_STOPWORDS = frozenset(
+    "a an the and or but so of to in on at for with by from as is are was were be been being it its this that these those "
+    "i you he she we they me him her us them my your our their what which who whom do does did have has had not no yes "
+    "just really very can could would there here then than about into up out if all any some".split()
+)
+
+def estimate_tokens(text: str) -> int:
+    """Rough LLM token count (about four characters per token for English text)"""
+    return math.ceil(len(text) / 4)
+
+def _normalize(sentence: str) -> str:
+    return " ".join(_WORD.findall(sentence.lower()))
+
+def _clean(text: str, original: str) -> str:
+    """Tidy spacing and punctuation left behind by removals; re-capitalize if the start was removed"""
+    text = re.sub(r"\s+([,.!?])", r"\1", text)
+    text = re.sub(r"([,.!?])[,.]+", r"\1", text)
+    text = re.sub(r"^[\s,.]+", "", re.sub(r"\s{2,}", " ", text)).strip()
+    if text and text != original and original[:1].isupper():
+        text = text[0].upper() + text[1:]
+    return text
+
+def _remove_disfluencies(sentence: str, level: int, stats: dict) -> str:
+    cleaned, fillers = _FILLERS.subn("", sentence)
+    cleaned, stutters = _STUTTER.subn(r"\1", cleaned)
+    if level >= 2:
+        cleaned, phrases = _PHRASE_FILLERS.subn(" ", cleaned)
+        fillers += phrases
+    stats["fillers"] += fillers
+    stats["stutters"] += stutters
+    return _clean(cleaned, sentence) if fillers or stutters else sentence
+
+def _parse_lines(transcript: str) -> list:
+    """[(speaker label or None, [sentences])], one entry per non-empty line"""
+    turns = []
+    for line in transcript.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        match = _SPEAKER_LABEL.match(line)
+        label = match.group(1) if match else None
+        body = line[match.end():] if match else line
+        turns.append((label, [sentence for sentence in _SENTENCE_END.split(body) if sentence.strip()]))
+    return turns
+
+def _select_salient(turns: list, stats: dict) -> list:
+    """Keep the COMPACTION_KEEP_RATIO highest-scoring sentences, in order, plus every cue sentence"""
+    sentences = [sentence for _, turn in turns for sentence in turn]
+    if len(sentences) < COMPACTION_MIN_SENTENCES:
+        return turns
+
+    frequencies = Counter(word for sentence in sentences for word in _WORD.findall(sentence.lower()) if word not in _STOPWORDS)
+    def score(sentence: str) -> float:
+        words = [word for word in _WORD.findall(sentence.lower()) if word not in _STOPWORDS]
+        if not words:
+            return 0.0
+        return sum(math.log1p(frequencies[word]) for word in words) / math.sqrt(len(words))
+
+    budget = max(1, round(len(sentences) * COMPACTION_KEEP_RATIO))
+    ranked = sorted(range(len(sentences)), key=lambda index: score(sentences[index]), reverse=True)
+    keep = set(ranked[:budget]) | {index for index, sentence in enumerate(sentences) if _CUES.search(sentence)}
+
+    selected = []
+    index = 0
+    for label, turn in turns:
+        kept = [sentence for offset, sentence in enumerate(turn) if index + offset in keep]
+        index += len(turn)
+        if kept and selected and label is not None and selected[-1][0] == label:
+            selected[-1][1].extend(kept)
+        elif kept:
+            selected.append((label, kept))
+    stats["dropped_sentences"] += len(sentences) - sum(len(turn) for _, turn in selected)
+    return selected
+
+def speaker_lines(utterances: list) -> str:
+    """One "Speaker X: text" line per utterance; utterances without a speaker become plain lines"""
+    return "\n".join(
+        f"Speaker {utterance['speaker']}: {utterance['text']}" if utterance.get("speaker") else utterance["text"]
+        for utterance in utterances if utterance["text"]
+    )
+
+def compact_transcript(transcript: str, level: int = None, utterances: list = None) -> tuple:
+    """Deterministically shorten a transcript before summarization; return (text, report)
+
+    The ASR text is a single unlabelled paragraph, so when utterances are given they are compacted
+    instead, as speaker_lines. The report gives characters and estimated tokens of the transcript
+    argument and of the result, plus what was removed; with utterances it also gives the tokens of
+    the labelled text, so the cost of the speaker labels is visible. Line structure (one speaker turn per line) is kept, so chunking still
+    splits on turns. Fallback transcripts are returned unchanged.
+    """
+    level = COMPACTION_LEVEL if level is None else level
+    source = speaker_lines(utterances) if utterances else transcript
+    stats = {"fillers": 0, "stutters": 0, "backchannels": 0, "repeats": 0, "merged_turns": 0, "dropped_sentences": 0}
+
+    compacted = source
+    if level > 0 and "[FALLBACK]" not in source:
+        turns = []
+        recent = []
+        for label, sentences in _parse_lines(source):
+            kept = []
+            for sentence in sentences:
+                sentence = _remove_disfluencies(sentence, level, stats)
+                key = _normalize(sentence)
+                if not key:
+                    continue
+                if level >= 2:
+                    if key in _BACKCHANNELS:
+                        stats["backchannels"] += 1
+                        continue
+                    if len(key.split()) >= 3 and key in recent:
+                        stats["repeats"] += 1
+                        continue
+                    recent = (recent + [key])[-COMPACTION_REPEAT_WINDOW:]
+                kept.append(sentence)
+            if not kept:
+                continue
+            if level >= 2 and turns and label is not None and turns[-1][0] == label:
+                turns[-1][1].extend(kept)
+                stats["merged_turns"] += 1
+            else:
+                turns.append((label, kept))
+
+        if level >= 3:
+            turns = _select_salient(turns, stats)
+        compacted = "\n".join(
+            (f"{label} " if label else "") + " ".join(sentences) for label, sentences in turns
+        )
+
+    tokens_before, tokens_after = estimate_tokens(transcript), estimate_tokens(compacted)
+    COMPACTION_TOKENS.inc(tokens_before, kind="before")
+    COMPACTION_TOKENS.inc(tokens_after, kind="after")
+    logger.info(
+        "Transcript compacted at level %d: ~%d -> ~%d tokens", level, tokens_before, tokens_after,
+        extra={"compaction_level": level, "tokens_before": tokens_before, "tokens_after": tokens_after}
+    )
+    report = {
+        "level": level,
+        "chars_before": len(transcript),
+        "chars_after": len(compacted),
+        "estimated_tokens_before": tokens_before,
+        "estimated_tokens_after": tokens_after,
+        "reduction": round(1 - tokens_after / tokens_before, 3) if tokens_before else 0.0,
+        "removed": stats
+    }
+    if utterances:
+        report["estimated_tokens_labelled"] = estimate_tokens(source)
+    return compacted, report
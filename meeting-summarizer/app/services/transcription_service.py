@@ -1,87 +1,397 @@
-import assemblyai as aai
+import asyncio
+import httpx
 import os
 import time
+import weakref
+import logging
 from dotenv import load_dotenv
+from app.core.metrics import ASR_SECONDS, ASR_BYTES, TRANSCRIPT_CHARS, FALLBACKS, ERRORS
+from app.services.rate_limiter import assemblyai_limiter, backoff_delay
+from app.services.local_asr import LOCAL_ASR_MODEL
 
 load_dotenv()
 
-def transcribe_audio(audio_file_path: str) -> str:
+logger = logging.getLogger(__name__)
 
-    print(f"Starting AssemblyAI transcription for: {audio_file_path}")
+ASSEMBLYAI_BASE_URL = os.getenv("ASSEMBLYAI_BASE_URL", "https://api.assemblyai.com")
+ASSEMBLYAI_DEADLINE_SECONDS = float(os.getenv("ASSEMBLYAI_DEADLINE_SECONDS", "900"))
+ASSEMBLYAI_POLL_INITIAL_SECONDS = float(os.getenv("ASSEMBLYAI_POLL_INITIAL_SECONDS", "0.5"))
+ASSEMBLYAI_POLL_MAX_SECONDS = float(os.getenv("ASSEMBLYAI_POLL_MAX_SECONDS", "10"))
+ASSEMBLYAI_UPLOAD_CHUNK_SIZE = 1024 * 1024
+# Retries for uploads and status polls that fail with a 5xx or a dropped connection
+ASSEMBLYAI_TRANSIENT_RETRIES = int(os.getenv("ASSEMBLYAI_TRANSIENT_RETRIES", "3"))
+
+# "assemblyai" (hosted) or "local" (faster-whisper on this machine's CPUs, see local_asr.py)
+ASR_PROVIDER = os.getenv("ASR_PROVIDER", "assemblyai").lower()
+# When disabled, ASR failures raise instead of returning the [FALLBACK] sample transcript
+ASR_FALLBACK_ENABLED = os.getenv("ASR_FALLBACK_ENABLED", "true").lower() in ("1", "true", "yes")
+ASR_SERVICE_NAME = "faster-whisper" if ASR_PROVIDER == "local" else "AssemblyAI"
+# Engine and model behind a transcript; part of the transcript cache key
+ASR_MODEL = f"faster-whisper/{LOCAL_ASR_MODEL}" if ASR_PROVIDER == "local" else "AssemblyAI"
+
+# The async path shares one keep-alive client per event loop, so uploads, submits and polls
+# reuse warm TLS connections instead of handshaking for every transcription
+ASSEMBLYAI_MAX_CONNECTIONS = int(os.getenv("ASSEMBLYAI_MAX_CONNECTIONS", "20"))
+ASSEMBLYAI_KEEPALIVE_SECONDS = float(os.getenv("ASSEMBLYAI_KEEPALIVE_SECONDS", "60"))
+
+_clients = weakref.WeakKeyDictionary()
+
+class TranscriptionCancelledError(Exception):
+    """Raised when the caller went away while a transcription was pending"""
+
+class TranscriptionTimeoutError(Exception):
+    """Raised when a transcript is still pending at the ASSEMBLYAI_DEADLINE_SECONDS deadline
+
+    transcript_id names the AssemblyAI job, which keeps running and can be re-attached later.
+    """
+
+    def __init__(self, message: str, transcript_id: str = None):
+        super().__init__(message)
+        self.transcript_id = transcript_id
+
+def transcribe_audio(audio_file_path: str, on_submitted=None, transcript_id: str = None) -> dict:
+    """Transcribe a recording with the configured ASR_PROVIDER
+
+    Returns {"text", "utterances": [{"speaker", "start", "end", "text"}]} with times in milliseconds.
+    With AssemblyAI, on_submitted(transcript_id) is called once the job is queued, and passing a
+    transcript_id re-attaches to that job instead of uploading again (the local backend ignores both).
+    """
+    if ASR_PROVIDER == "local":
+        with ASR_SECONDS.time(provider=ASR_SERVICE_NAME):
+            return _transcribe_local(audio_file_path)
+    # A slot covers the whole transcription: AssemblyAI limits concurrent jobs, not just requests
+    with assemblyai_limiter.slot(), ASR_SECONDS.time(provider=ASR_SERVICE_NAME):
+        return _transcribe_assemblyai(audio_file_path, on_submitted, transcript_id)
+
+async def transcribe_audio_async(audio_file_path: str, deadline_seconds: float = None, is_disconnected=None, progress=None) -> dict:
+    """Async variant of transcribe_audio; the local backend runs in a worker thread"""
+    if ASR_PROVIDER == "local":
+        if progress is not None:
+            progress("asr_local")
+        with ASR_SECONDS.time(provider=ASR_SERVICE_NAME):
+            return await asyncio.to_thread(_transcribe_local, audio_file_path)
+    async with assemblyai_limiter.slot_async():
+        with ASR_SECONDS.time(provider=ASR_SERVICE_NAME):
+            return await _transcribe_assemblyai_async(audio_file_path, deadline_seconds, is_disconnected, progress)
+
+def get_assemblyai_client(api_key: str) -> httpx.AsyncClient:
+    """Shared AssemblyAI client for the running event loop, created on first use"""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=ASSEMBLYAI_BASE_URL,
+            timeout=httpx.Timeout(30.0, connect=10.0),
+            limits=httpx.Limits(
+                max_connections=ASSEMBLYAI_MAX_CONNECTIONS,
+                max_keepalive_connections=ASSEMBLYAI_MAX_CONNECTIONS,
+                keepalive_expiry=ASSEMBLYAI_KEEPALIVE_SECONDS
+            )
+        )
+        _clients[loop] = client
+    client.headers["authorization"] = api_key
+    return client
+
+async def close_assemblyai_client():
+    """Close the running event loop's shared client (application shutdown)"""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+async def warm_up_assemblyai():
+    """Open a keep-alive connection to AssemblyAI ahead of the first upload"""
+    api_key = os.getenv("ASSEMBLYAI_API_KEY")
+    if not api_key or ASR_PROVIDER == "local":
+        return
+    await get_assemblyai_client(api_key).get("/v2/transcript", params={"limit": 1})
+
+def _transcription_completed(audio_file_path: str, transcript: str, elapsed: float, utterances: list) -> dict:
+    ASR_BYTES.inc(os.path.getsize(audio_file_path), provider=ASR_SERVICE_NAME)
+    TRANSCRIPT_CHARS.inc(len(transcript), provider=ASR_SERVICE_NAME)
+    logger.info(
+        "Transcription completed in %.1fs: %d characters, %d speaker turns", elapsed, len(transcript), len(utterances),
+        extra={"asr_seconds": round(elapsed, 3), "transcript_chars": len(transcript), "provider": ASR_SERVICE_NAME}
+    )
+    return {"text": transcript.strip(), "utterances": utterances}
+
+def _utterance(speaker, start, end, text: str) -> dict:
+    return {"speaker": speaker, "start": int(start or 0), "end": int(end or 0), "text": (text or "").strip()}
+
+def _transcription_failed(error: Exception) -> dict:
+    ERRORS.inc(stage="asr")
+    logger.error("Transcription failed: %s", error)
+    if not ASR_FALLBACK_ENABLED:
+        raise error
+    FALLBACKS.inc(stage="asr")
+    logger.warning("Falling back to sample transcript")
+    return {"text": get_sample_transcript(), "utterances": []}
+
+def _transcribe_local(audio_file_path: str) -> dict:
+    logger.info("Starting local transcription for: %s", audio_file_path)
+
+    if not os.path.exists(audio_file_path):
+        error_msg = f"Audio file not found: {audio_file_path}"
+        logger.error(error_msg)
+        raise Exception(error_msg)
+
+    try:
+        from app.services.local_asr import transcribe_local
+        start_time = time.time()
+        result = transcribe_local(audio_file_path)
+        # Whisper segments carry no speaker labels; their times are seconds
+        utterances = [
+            _utterance(None, segment["start"] * 1000, segment["end"] * 1000, segment["text"])
+            for segment in result["segments"]
+        ]
+        return _transcription_completed(audio_file_path, result["text"], time.time() - start_time, utterances)
+    except Exception as e:
+        return _transcription_failed(e)
+
+def _read_file_chunks_sync(audio_file_path: str):
+    with open(audio_file_path, "rb") as audio_file:
+        while True:
+            chunk = audio_file.read(ASSEMBLYAI_UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+
+def _request_json_sync(client, method: str, url: str, **kwargs) -> dict:
+    response = client.request(method, url, **kwargs)
+    response.raise_for_status()
+    return response.json()
+
+def _call_with_retries_sync(func, *args, **kwargs):
+    """Blocking variant of _call_with_retries"""
+    for attempt in range(ASSEMBLYAI_TRANSIENT_RETRIES + 1):
+        try:
+            return assemblyai_limiter.call(func, *args, **kwargs)
+        except Exception as e:
+            if attempt == ASSEMBLYAI_TRANSIENT_RETRIES or not _is_transient(e):
+                raise
+            delay = backoff_delay(attempt)
+            logger.warning("AssemblyAI request failed (%s), retrying in %.1fs (attempt %d/%d)", e, delay, attempt + 1, ASSEMBLYAI_TRANSIENT_RETRIES)
+            time.sleep(delay)
+
+def _upload_audio_sync(client, audio_file_path: str) -> str:
+    return _request_json_sync(client, "POST", "/v2/upload", content=_read_file_chunks_sync(audio_file_path))["upload_url"]
+
+def _wait_for_transcript_sync(client, transcript_id: str, deadline: float) -> dict:
+    """Blocking variant of _wait_for_transcript; deadline is a time.monotonic() value"""
+    delay = ASSEMBLYAI_POLL_INITIAL_SECONDS
+    
+    while True:
+        data = _call_with_retries_sync(_request_json_sync, client, "GET", f"/v2/transcript/{transcript_id}")
+        if data["status"] in ("completed", "error"):
+            return data
+        
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TranscriptionTimeoutError(
+                f"AssemblyAI timeout - transcript {transcript_id} still {data['status']} at the deadline", transcript_id
+            )
+        
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 1.5, ASSEMBLYAI_POLL_MAX_SECONDS)
+
+def _transcribe_assemblyai(audio_file_path: str, on_submitted=None, transcript_id: str = None, deadline_seconds: float = None) -> dict:
+    """Blocking AssemblyAI transcription for worker threads, polling until ASSEMBLYAI_DEADLINE_SECONDS
+
+    TranscriptionTimeoutError is raised rather than falling back: the job keeps running at
+    AssemblyAI, and the caller can re-attach to it later by its id.
+    """
+    logger.info("Starting AssemblyAI transcription for: %s", audio_file_path)
     
     if not os.path.exists(audio_file_path):
         error_msg = f"Audio file not found: {audio_file_path}"
-        print(f"{error_msg}")
+        logger.error(error_msg)
         raise Exception(error_msg)
 
     api_key = os.getenv("ASSEMBLYAI_API_KEY")
     if not api_key:
         error_msg = "AssemblyAI API key not configured"
-        print(f"{error_msg}")
+        logger.error(error_msg)
         raise Exception(error_msg)
     
-    aai.settings.api_key = api_key
+    start_time = time.monotonic()
+    deadline = start_time + (deadline_seconds or ASSEMBLYAI_DEADLINE_SECONDS)
     
     try:
-        config = aai.TranscriptionConfig(
-            speaker_labels=True,
-            language_detection=True,
-            punctuate=True,
-            format_text=True
-        )
+        with httpx.Client(base_url=ASSEMBLYAI_BASE_URL, headers={"authorization": api_key}, timeout=httpx.Timeout(30.0, connect=10.0)) as client:
+            data = None
+            
+            if transcript_id:
+                logger.info("Re-attaching to AssemblyAI transcript %s", transcript_id)
+                try:
+                    data = _wait_for_transcript_sync(client, transcript_id, deadline)
+                except httpx.HTTPError as e:
+                    logger.warning("Could not re-attach to transcript %s (%s), submitting again", transcript_id, e)
+            
+            if data is None:
+                logger.info("Uploading to AssemblyAI")
+                upload_url = _call_with_retries_sync(_upload_audio_sync, client, audio_file_path)
+                # Only 429s are retried here: after a 5xx the job may already exist, and a resubmit would bill it twice
+                submitted = assemblyai_limiter.call(_request_json_sync, client, "POST", "/v2/transcript", json={
+                    "audio_url": upload_url,
+                    "speaker_labels": True,
+                    "language_detection": True,
+                    "punctuate": True,
+                    "format_text": True
+                })
+                logger.info("Transcription submitted: %s", submitted["id"])
+                # Reported before waiting, so the job can be re-attached after a restart or a timeout
+                if on_submitted is not None:
+                    on_submitted(submitted["id"])
+                data = _wait_for_transcript_sync(client, submitted["id"], deadline)
 
-        transcriber = aai.Transcriber()
-        
-        print("Uploading to AssemblyAI...")
-        start_time = time.time()
+        if data["status"] == "error":
+            error_msg = f"AssemblyAI Error: {data.get('error')}"
+            raise Exception(error_msg)
         
-        transcript = transcriber.transcribe(audio_file_path, config=config)
+        utterances = [
+            _utterance(utterance.get("speaker"), utterance.get("start"), utterance.get("end"), utterance.get("text"))
+            for utterance in data.get("utterances") or []
+        ]
+        return _transcription_completed(audio_file_path, data.get("text") or "", time.monotonic() - start_time, utterances)
+    
+    except TranscriptionTimeoutError as e:
+        ERRORS.inc(stage="asr")
+        logger.error("Transcription failed: %s", e)
+        raise
         
-        print(f"Transcription started. Status: {transcript.status}")
+    except Exception as e:
+        return _transcription_failed(e)
+
+async def _read_file_chunks(audio_file_path: str):
+    with open(audio_file_path, "rb") as audio_file:
+        while True:
+            chunk = await asyncio.to_thread(audio_file.read, ASSEMBLYAI_UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+
+async def _request_json(client, method: str, url: str, **kwargs) -> dict:
+    response = await client.request(method, url, **kwargs)
+    response.raise_for_status()
+    return response.json()
+
+def _is_transient(error: Exception) -> bool:
+    if isinstance(error, httpx.TransportError):
+        return True
+    return isinstance(error, httpx.HTTPStatusError) and error.response.status_code >= 500
+
+async def _call_with_retries(func, *args, **kwargs):
+    """Rate-limited call that also retries 5xx and connection errors; only for idempotent requests"""
+    for attempt in range(ASSEMBLYAI_TRANSIENT_RETRIES + 1):
+        try:
+            return await assemblyai_limiter.call_async(func, *args, **kwargs)
+        except Exception as e:
+            if attempt == ASSEMBLYAI_TRANSIENT_RETRIES or not _is_transient(e):
+                raise
+            delay = backoff_delay(attempt)
+            logger.warning("AssemblyAI request failed (%s), retrying in %.1fs (attempt %d/%d)", e, delay, attempt + 1, ASSEMBLYAI_TRANSIENT_RETRIES)
+            await asyncio.sleep(delay)
+
+async def _upload_audio(client, audio_file_path: str) -> str:
+    # Open a fresh chunk stream per attempt so a rate-limited upload can be retried
+    data = await _request_json(client, "POST", "/v2/upload", content=_read_file_chunks(audio_file_path))
+    return data["upload_url"]
+
+async def _wait_for_transcript(client, transcript_id: str, deadline: float, is_disconnected=None, progress=None) -> dict:
+    """Poll a transcript with exponential backoff until it finishes, the deadline passes or the client leaves"""
+    loop = asyncio.get_running_loop()
+    delay = ASSEMBLYAI_POLL_INITIAL_SECONDS
+    last_status = None
     
-        poll_count = 0
-        max_polls = 60 
+    while True:
+        data = await _call_with_retries(_request_json, client, "GET", f"/v2/transcript/{transcript_id}")
         
-        while transcript.status == 'processing' and poll_count < max_polls:
-            poll_count += 1
-            elapsed = time.time() - start_time
-            print(f"Processing... {elapsed:.1f}s elapsed")
-            
-            transcript = transcriber.get_transcript(transcript.id)
-            time.sleep(5)
+        if progress is not None and data["status"] != last_status:
+            progress(f"asr_{data['status']}", transcript_id=transcript_id)
+        last_status = data["status"]
+        
+        if data["status"] in ("completed", "error"):
+            return data
+        
+        if is_disconnected is not None and await is_disconnected():
+            raise TranscriptionCancelledError(f"Client disconnected while transcript {transcript_id} was {data['status']}")
+        
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            raise TranscriptionTimeoutError(
+                f"AssemblyAI timeout - transcript {transcript_id} still {data['status']} at the deadline", transcript_id
+            )
+        
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * 1.5, ASSEMBLYAI_POLL_MAX_SECONDS)
 
-        if transcript.status == aai.TranscriptStatus.error:
-            error_msg = f"AssemblyAI Error: {transcript.error}"
-            print(f"{error_msg}")
-            raise Exception(error_msg)
+async def _transcribe_assemblyai_async(audio_file_path: str, deadline_seconds: float = None, is_disconnected=None, progress=None) -> dict:
+    """Talk to the AssemblyAI REST API without blocking a thread
+
+    is_disconnected is an optional coroutine function (e.g. Request.is_disconnected);
+    polling stops with TranscriptionCancelledError as soon as it returns True.
+    progress(stage, **info) is called with asr_uploading and asr_<status> on every status change.
+    """
+    logger.info("Starting async AssemblyAI transcription for: %s", audio_file_path)
+    
+    if not os.path.exists(audio_file_path):
+        error_msg = f"Audio file not found: {audio_file_path}"
+        logger.error(error_msg)
+        raise Exception(error_msg)
+
+    api_key = os.getenv("ASSEMBLYAI_API_KEY")
+    if not api_key:
+        error_msg = "AssemblyAI API key not configured"
+        logger.error(error_msg)
+        raise Exception(error_msg)
+    
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
+    deadline = start_time + (deadline_seconds or ASSEMBLYAI_DEADLINE_SECONDS)
+    
+    try:
+        client = get_assemblyai_client(api_key)
+        logger.info("Uploading to AssemblyAI")
+        if progress is not None:
+            progress("asr_uploading")
+        upload_url = await _call_with_retries(_upload_audio, client, audio_file_path)
         
-        elif transcript.status == aai.TranscriptStatus.completed:
-            actual_transcript = transcript.text
-            elapsed = time.time() - start_time
-            
-            print(f"Transcription completed in {elapsed:.1f}s!")
-            print(f"Transcript length: {len(actual_transcript)} characters")
-            
-            if transcript.utterances:
-                print(f"Speakers detected: {len(transcript.utterances)}")
-            
-            return actual_transcript.strip()
+        # Only 429s are retried here: after a 5xx the job may already exist, and a resubmit would bill it twice
+        submitted = await assemblyai_limiter.call_async(_request_json, client, "POST", "/v2/transcript", json={
+            "audio_url": upload_url,
+            "speaker_labels": True,
+            "language_detection": True,
+            "punctuate": True,
+            "format_text": True
+        })
+        transcript_id = submitted["id"]
+        logger.info("Transcription submitted: %s", transcript_id)
         
-        elif poll_count >= max_polls:
-            error_msg = "AssemblyAI timeout - processing took too long"
-            print(f"{error_msg}")
-            raise Exception(error_msg)
+        data = await _wait_for_transcript(client, transcript_id, deadline, is_disconnected, progress)
         
-        else:
-            error_msg = f"Unexpected AssemblyAI status: {transcript.status}"
-            print(f"{error_msg}")
+        if data["status"] == "error":
+            error_msg = f"AssemblyAI Error: {data.get('error')}"
             raise Exception(error_msg)
         
+        utterances = [
+            _utterance(utterance.get("speaker"), utterance.get("start"), utterance.get("end"), utterance.get("text"))
+            for utterance in data.get("utterances") or []
+        ]
+        return _transcription_completed(audio_file_path, data.get("text") or "", loop.time() - start_time, utterances)
+    
+    except (TranscriptionCancelledError, asyncio.CancelledError):
+        logger.info("Transcription cancelled")
+        raise
+    
+    except TranscriptionTimeoutError as e:
+        logger.warning(
+            "Transcript %s is still running at AssemblyAI and can be re-attached by id", e.transcript_id,
+            extra={"transcript_id": e.transcript_id}
+        )
+        return _transcription_failed(e)
+        
     except Exception as e:
-        print(f"Transcription failed: {str(e)}")
-        print("Falling back to sample transcript...")
-        return get_sample_transcript()
+        return _transcription_failed(e)
 
 def get_sample_transcript():
     """Fallback sample transcript when ASR fails"""
-    return "[FALLBACK] This is a sample transcript. AssemblyAI transcription failed. Please check the logs for details."
\ No newline at end of file
+    return "[FALLBACK] This is a sample transcript. Transcription failed. Please check the logs for details."
\ No newline at end of file
@@ -0,0 +1,54 @@
+import os
+import asyncio
+import hashlib
+
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(1024 * 1024)))
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_MB", "500")) * 1024 * 1024
+MAX_BATCH_UPLOAD_BYTES = int(os.getenv("MAX_BATCH_UPLOAD_MB", "4096")) * 1024 * 1024
+# Uploads are spooled here, and preprocessed copies of them are written here too
+UPLOAD_TEMP_DIR = os.getenv("UPLOAD_TEMP_DIR", ".")
+
+class UploadTooLargeError(Exception):
+    """Raised when an upload exceeds MAX_UPLOAD_BYTES"""
+
+def _too_large_message(size: int) -> str:
+    return f"Upload of {size} bytes exceeds the {MAX_UPLOAD_BYTES // 1024 // 1024} MB limit"
+
+async def spool_upload(upload, file_path: str) -> tuple:
+    """Copy an UploadFile to disk chunk by chunk; return (bytes written, sha256 hex digest)"""
+    declared_size = getattr(upload, "size", None)
+    if declared_size is not None and declared_size > MAX_UPLOAD_BYTES:
+        raise UploadTooLargeError(_too_large_message(declared_size))
+
+    written = 0
+    digest = hashlib.sha256()
+    try:
+        with open(file_path, "wb") as buffer:
+            while True:
+                chunk = await upload.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+
+                written += len(chunk)
+                if written > MAX_UPLOAD_BYTES:
+                    raise UploadTooLargeError(_too_large_message(written))
+
+                digest.update(chunk)
+                await asyncio.to_thread(buffer.write, chunk)
+    except BaseException:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+        raise
+
+    return written, digest.hexdigest()
+
+def hash_file(file_path: str) -> str:
+    """sha256 hex digest of a file on disk, read in UPLOAD_CHUNK_SIZE pieces"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as audio_file:
+        while True:
+            chunk = audio_file.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
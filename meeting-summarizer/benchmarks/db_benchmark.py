@@ -0,0 +1,141 @@
+"""Insert/read throughput of app.core.db under concurrent writers.
+
+Compares the pooled WAL connection layer with the previous behaviour
+(a fresh rollback-journal connection per call) on a scratch database.
+
+    python benchmarks/db_benchmark.py --writers 8 --ops 200 --json results.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SUMMARY = {
+    "summary": "Weekly sync covering the release plan and documentation status.",
+    "key_decisions": ["Ship version two next Friday"],
+    "action_items": [{"task": "Finish the docs", "assignee": "Ben", "deadline": "Wednesday"}]
+}
+LEGACY_SCHEMA = '''
+    CREATE TABLE meeting_summaries (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        filename TEXT NOT NULL,
+        transcript TEXT NOT NULL,
+        summary TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        asr_service TEXT DEFAULT 'AssemblyAI',
+        llm_service TEXT DEFAULT 'Gemini',
+        transcript_length INTEGER DEFAULT 0,
+        is_fallback BOOLEAN DEFAULT FALSE
+    )
+'''
+TRANSCRIPT = "Thanks everyone for joining, let's go through the release plan. " * 200
+
+def legacy_save(db_path: str, filename: str, transcript: str, summary: dict) -> int:
+    conn = sqlite3.connect(db_path, timeout=30)
+    cursor = conn.cursor()
+    cursor.execute('''
+        INSERT INTO meeting_summaries (filename, transcript, summary, asr_service, llm_service, transcript_length, is_fallback)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    ''', (filename, transcript, json.dumps(summary), 'AssemblyAI', 'Gemini', len(transcript), False))
+    meeting_id = cursor.lastrowid
+    conn.commit()
+    conn.close()
+    return meeting_id
+
+def legacy_get(db_path: str, meeting_id: int):
+    conn = sqlite3.connect(db_path, timeout=30)
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+    cursor.execute('SELECT * FROM meeting_summaries WHERE id = ?', (meeting_id,))
+    result = cursor.fetchone()
+    conn.close()
+    return dict(result) if result else None
+
+def run_threads(count: int, target) -> float:
+    threads = [threading.Thread(target=target, args=(index,)) for index in range(count)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+def measure(save, get, writers: int, ops: int) -> dict:
+    ids = []
+    ids_lock = threading.Lock()
+    errors = []
+
+    def writer(index):
+        for op in range(ops):
+            try:
+                meeting_id = save(f"bench_{index}_{op}.wav", TRANSCRIPT, SUMMARY)
+                with ids_lock:
+                    ids.append(meeting_id)
+            except sqlite3.Error as e:
+                errors.append(str(e))
+
+    def reader(index):
+        for op in range(ops):
+            try:
+                get(ids[(index * ops + op) % len(ids)])
+            except sqlite3.Error as e:
+                errors.append(str(e))
+
+    write_seconds = run_threads(writers, writer)
+    read_seconds = run_threads(writers, reader)
+    total = writers * ops
+    return {
+        "inserts_per_sec": round(total / write_seconds, 1),
+        "reads_per_sec": round(total / read_seconds, 1),
+        "errors": len(errors)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--writers", type=int, nargs="+", default=[1, 4, 8, 16], help="concurrent writer threads")
+    parser.add_argument("--ops", type=int, default=200, help="operations per thread")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="meetings-bench-")
+    os.environ["MEETINGS_DB_PATH"] = os.path.join(workdir, "pooled.db")
+    from app.core import db
+
+    db.init_database()
+    legacy_path = os.path.join(workdir, "legacy.db")
+    conn = sqlite3.connect(legacy_path)
+    conn.execute(LEGACY_SCHEMA)
+    conn.close()
+
+    results = []
+    for writers in args.writers:
+        # save_meeting_summary logs every insert; keep that out of the timings
+        with contextlib.redirect_stdout(io.StringIO()):
+            legacy = measure(
+                lambda *a: legacy_save(legacy_path, *a),
+                lambda meeting_id: legacy_get(legacy_path, meeting_id),
+                writers, args.ops
+            )
+            pooled = measure(db.save_meeting_summary, db.get_meeting_summary, writers, args.ops)
+        results.append({"writers": writers, "ops_per_writer": args.ops, "legacy": legacy, "pooled": pooled})
+        print(
+            f"writers={writers:<3} "
+            f"legacy: {legacy['inserts_per_sec']:>8} ins/s {legacy['reads_per_sec']:>9} reads/s  "
+            f"pooled: {pooled['inserts_per_sec']:>8} ins/s {pooled['reads_per_sec']:>9} reads/s"
+        )
+
+    if args.json:
+        with open(args.json, "w") as output:
+            json.dump({"benchmark": "db", "results": results}, output, indent=2)
+        print(f"Results written to {args.json}")
+
+if __name__ == "__main__":
+    main()
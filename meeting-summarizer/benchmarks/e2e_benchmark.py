@@ -0,0 +1,163 @@
+"""End-to-end throughput of POST /meeting/summarize against local fake providers.
+
+Starts tools/fake_assemblyai.py and tools/fake_gemini.py in-process, runs the API
+with uvicorn in a subprocess on a scratch database, then uploads random audio
+payloads for every (file size, concurrency) pair and reports requests/sec,
+p50/p99 latency, errors, degraded (fallback) responses and the server's peak RSS.
+
+    python benchmarks/e2e_benchmark.py --sizes-kb 64 1024 --concurrency 1 8 --requests 32 --json e2e.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "tools"))
+
+import fake_assemblyai
+import fake_gemini
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def peak_rss_mb(pid: int):
+    """High-water mark of the process's resident set (Linux /proc), or None elsewhere"""
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        return None
+    return None
+
+def percentile(values: list, fraction: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+def start_server(port: int, env: dict) -> subprocess.Popen:
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("API server exited during startup")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1).status_code == 200:
+                return process
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("API server did not become healthy within 60s")
+
+async def run_level(base_url: str, size_bytes: int, concurrency: int, requests: int) -> dict:
+    latencies = []
+    errors = 0
+    degraded = 0
+    limit = asyncio.Semaphore(concurrency)
+
+    async def one(client):
+        nonlocal errors, degraded
+        # Random bytes give every upload a distinct hash, so the transcript cache never answers
+        audio = os.urandom(size_bytes)
+        async with limit:
+            start = time.perf_counter()
+            try:
+                response = await client.post("/meeting/summarize", files={"audio": ("bench.wav", audio, "audio/wav")})
+                ok = response.status_code == 200
+            except httpx.HTTPError:
+                ok = False
+            latencies.append(time.perf_counter() - start)
+            if not ok:
+                errors += 1
+            elif "fallback" in response.json()["message"] or "failed" in response.json()["summary"].get("summary", ""):
+                # 200 with the sample transcript or a "Summary generation failed" summary
+                degraded += 1
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=600) as client:
+        start = time.perf_counter()
+        await asyncio.gather(*(one(client) for _ in range(requests)))
+        elapsed = time.perf_counter() - start
+
+    return {
+        "requests": requests,
+        "errors": errors,
+        "degraded": degraded,
+        "elapsed_seconds": round(elapsed, 3),
+        "requests_per_sec": round(requests / elapsed, 2),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 1)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes-kb", type=int, nargs="+", default=[64, 1024, 8192], help="upload sizes in KiB")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16], help="concurrent clients")
+    parser.add_argument("--requests", type=int, default=32, help="requests per (size, concurrency) level")
+    parser.add_argument("--asr-latency", type=float, default=1.0, help="fake AssemblyAI seconds per transcript")
+    parser.add_argument("--llm-latency", type=float, default=0.5, help="fake Gemini seconds per call")
+    parser.add_argument("--asr-failure-rate", type=float, default=0.0)
+    parser.add_argument("--llm-failure-rate", type=float, default=0.0)
+    parser.add_argument("--llm-throttle-rate", type=float, default=0.0, help="fraction of Gemini calls answered with 429")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    asr_port, llm_port, api_port = free_port(), free_port(), free_port()
+    asr_server = fake_assemblyai.serve(asr_port, args.asr_latency, args.asr_failure_rate, unique=True)
+    llm_server = fake_gemini.serve(llm_port, args.llm_latency, args.llm_failure_rate, args.llm_throttle_rate)
+
+    workdir = tempfile.mkdtemp(prefix="meetings-e2e-")
+    env = dict(os.environ)
+    env.update({
+        "MEETINGS_DB_PATH": os.path.join(workdir, "bench.db"),
+        "ASSEMBLYAI_BASE_URL": f"http://127.0.0.1:{asr_port}",
+        "ASSEMBLYAI_API_KEY": "benchmark",
+        "GEMINI_API_ENDPOINT": f"http://127.0.0.1:{llm_port}",
+        "GEMINI_API_KEY": "benchmark",
+        "ASSEMBLYAI_POLL_INITIAL_SECONDS": "0.1",
+    })
+    # Measure the service, not the production provider quotas, unless the caller set them
+    for name, value in (("ASSEMBLYAI_MAX_CONCURRENCY", "64"), ("ASSEMBLYAI_REQUESTS_PER_MINUTE", "60000"),
+                        ("GEMINI_MAX_CONCURRENCY", "64"), ("GEMINI_REQUESTS_PER_MINUTE", "60000")):
+        env.setdefault(name, value)
+
+    server = start_server(api_port, env)
+    results = []
+    try:
+        for size_kb in args.sizes_kb:
+            for concurrency in args.concurrency:
+                level = asyncio.run(run_level(f"http://127.0.0.1:{api_port}", size_kb * 1024, concurrency, args.requests))
+                level.update({"size_kb": size_kb, "concurrency": concurrency, "peak_rss_mb": peak_rss_mb(server.pid)})
+                results.append(level)
+                print(
+                    f"size={size_kb:>6} KiB  concurrency={concurrency:<3} "
+                    f"{level['requests_per_sec']:>7} req/s  p50={level['p50_ms']:>8} ms  p99={level['p99_ms']:>8} ms  "
+                    f"errors={level['errors']}  degraded={level['degraded']}  peak_rss={level['peak_rss_mb']} MB"
+                )
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+        asr_server.shutdown()
+        llm_server.shutdown()
+
+    if args.json:
+        config = {key: value for key, value in vars(args).items() if key != "json"}
+        with open(args.json, "w") as output:
+            json.dump({"benchmark": "e2e", "config": config, "results": results}, output, indent=2)
+        print(f"Results written to {args.json}")
+
+if __name__ == "__main__":
+    main()
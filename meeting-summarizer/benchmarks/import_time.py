@@ -0,0 +1,107 @@
+"""Cold import time of the API module (`import main`), as a fresh worker process sees it.
+
+Each run is a new interpreter started with -X importtime in a scratch directory. Wall
+times depend on the machine, so the report also gives figures that do not:
+the import cost relative to a bare interpreter start (`python -c pass`), the number of
+modules loaded, and which provider SDKs were imported at all (both should be absent,
+they are loaded on first use or by PROVIDER_WARMUP in the lifespan hook).
+
+    python benchmarks/import_time.py --runs 7 --top 15 --json import_time.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROVIDER_SDKS = ("google.generativeai", "assemblyai")
+
+def run_python(code: str, cwd: str, env: dict, importtime: bool = False) -> tuple:
+    """Run one fresh interpreter; return (wall seconds, stderr)"""
+    command = [sys.executable] + (["-X", "importtime"] if importtime else []) + ["-c", code]
+    start = time.perf_counter()
+    completed = subprocess.run(command, cwd=cwd, env=env, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if completed.returncode != 0:
+        raise RuntimeError(f"{code!r} failed:\n{completed.stderr[-2000:]}")
+    return elapsed, completed.stderr
+
+def parse_importtime(stderr: str) -> dict:
+    """{module: (self microseconds, cumulative microseconds)} from -X importtime output"""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per measurement")
+    parser.add_argument("--module", default="main", help="module to import")
+    parser.add_argument("--top", type=int, default=10, help="report this many slowest top-level packages")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="meetings-import-")
+    env = dict(os.environ)
+    env["PYTHONPATH"] = ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    env["MEETINGS_DB_PATH"] = os.path.join(workdir, "import.db")
+    env.setdefault("LOG_LEVEL", "WARNING")
+
+    baseline = [run_python("pass", workdir, env)[0] for _ in range(args.runs)]
+    walls = []
+    profiles = []
+    for _ in range(args.runs):
+        elapsed, stderr = run_python(f"import {args.module}", workdir, env, importtime=True)
+        walls.append(elapsed)
+        profiles.append(parse_importtime(stderr))
+
+    # Cumulative time per top-level package, median over runs
+    packages = {}
+    for profile in profiles:
+        totals = {}
+        for name, (self_us, _) in profile.items():
+            root = name.split(".")[0]
+            totals[root] = totals.get(root, 0) + self_us
+        for root, total in totals.items():
+            packages.setdefault(root, []).append(total)
+    slowest = sorted(
+        ((root, statistics.median(times) / 1000) for root, times in packages.items()),
+        key=lambda pair: pair[1], reverse=True
+    )[:args.top]
+
+    baseline_ms = statistics.median(baseline) * 1000
+    import_ms = statistics.median(walls) * 1000
+    loaded = profiles[-1]
+    result = {
+        "module": args.module,
+        "runs": args.runs,
+        "interpreter_start_ms": round(baseline_ms, 1),
+        "import_wall_ms": round(import_ms, 1),
+        "import_cost_ms": round(import_ms - baseline_ms, 1),
+        "relative_to_interpreter_start": round(import_ms / baseline_ms, 2),
+        "modules_loaded": len(loaded),
+        "provider_sdks_imported": {sdk: sdk in loaded for sdk in PROVIDER_SDKS},
+        "slowest_packages_ms": [{"package": root, "self_ms": round(ms, 1)} for root, ms in slowest]
+    }
+
+    print(f"import {args.module}: {result['import_wall_ms']} ms wall ({result['import_cost_ms']} ms over a bare interpreter, "
+          f"{result['relative_to_interpreter_start']}x), {result['modules_loaded']} modules")
+    for sdk, imported in result["provider_sdks_imported"].items():
+        print(f"  {sdk:<22} {'IMPORTED' if imported else 'not imported'}")
+    for entry in result["slowest_packages_ms"]:
+        print(f"  {entry['package']:<22} {entry['self_ms']:>8} ms")
+
+    if args.json:
+        with open(args.json, "w") as output:
+            json.dump({"benchmark": "import_time", "results": result}, output, indent=2)
+        print(f"Results written to {args.json}")
+
+if __name__ == "__main__":
+    main()
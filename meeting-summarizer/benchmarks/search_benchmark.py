@@ -0,0 +1,113 @@
+"""Latency of GET /meeting/search (app.core.db.search_meetings) on a large synthetic database.
+
+Builds --meetings synthetic meetings in a scratch database, then times searches for a term in
+every meeting, terms in about 10% and 1% of them, a rare term and a two-word query. --compare
+also times the previous query (bm25() computed in SQL for every match, ORDER BY score).
+
+    python benchmarks/search_benchmark.py --meetings 100000 --runs 5
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Transcripts and summaries use WORDS[3:]; "roadmap" is added to a set share of meetings
+WORDS = (
+    "budget roadmap hiring launch customer feedback metrics pipeline deadline review design testing "
+    "migration onboarding pricing contract vendor security incident outage backlog sprint retro demo "
+    "analytics dashboard invoice renewal partner forecast quarter travel offsite training compliance"
+).split()
+FILLER = "we should look at the numbers and then talk about what comes next for the team this week".split()
+QUERIES = {
+    "every meeting": "meeting",
+    "~10% of meetings": "roadmap",
+    "~1% of meetings": "kubernetes",
+    "rare": "zeppelin",
+    "two words": "customer review"
+}
+PREVIOUS_QUERY = '''
+    SELECT rowid AS id, filename, created_at,
+           bm25(meeting_search, 1.0, 4.0, 6.0, 6.0, 0.0, 0.0) AS score,
+           snippet(meeting_search, -1, '<mark>', '</mark>', '...', 16) AS snippet
+    FROM meeting_search
+    WHERE meeting_search MATCH ?
+    ORDER BY score
+    LIMIT ? OFFSET ?
+'''
+
+def synthetic_meeting(index: int, rng: random.Random) -> tuple:
+    words = ["meeting"]
+    for _ in range(220):
+        words.append(rng.choice(FILLER) if rng.random() < 0.7 else rng.choice(WORDS[3:]))
+    if rng.random() < 0.1:
+        words.append("roadmap")
+    if rng.random() < 0.01:
+        words.append("kubernetes")
+    if index % 20000 == 0:
+        words.append("zeppelin")
+    summary = {
+        "summary": f"Meeting {index} about {rng.choice(WORDS[3:])} and {rng.choice(WORDS[3:])}.",
+        "key_decisions": [f"Approve the {rng.choice(WORDS[3:])} plan"],
+        "action_items": [{"task": f"Follow up on {rng.choice(WORDS[3:])}", "assignee": rng.choice(["Ana", "Ben", "Chen"]), "deadline": "Friday"}]
+    }
+    return f"meeting_{index}.wav", " ".join(words) + ".", summary
+
+def build(db, meetings: int, batch: int = 1000):
+    rng = random.Random(42)
+    for start in range(0, meetings, batch):
+        db.save_meeting_summaries_bulk([synthetic_meeting(index, rng) for index in range(start, min(start + batch, meetings))])
+
+def timed(func, runs: int) -> float:
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--meetings", type=int, default=100000)
+    parser.add_argument("--runs", type=int, default=5, help="best of N runs per query")
+    parser.add_argument("--compare", action="store_true", help="also time the previous bm25()-per-row query")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="meetings-search-bench-")
+    os.environ["MEETINGS_DB_PATH"] = os.path.join(workdir, "search.db")
+    import logging
+    logging.disable(logging.INFO)
+    from app.core import db
+
+    db.init_database()
+    start = time.perf_counter()
+    build(db, args.meetings)
+    print(f"Indexed {args.meetings} meetings in {time.perf_counter() - start:.1f}s "
+          f"({os.path.getsize(db.DB_PATH) / 1024 / 1024:.0f} MB)")
+
+    conn = db.get_db_connection()
+    results = []
+    for label, query in QUERIES.items():
+        fts_query = db._fts_query(query)
+        matches = conn.execute("SELECT COUNT(*) FROM meeting_search WHERE meeting_search MATCH ?", (fts_query,)).fetchone()[0]
+        result = {"query": query, "matches": matches, "search_ms": round(timed(lambda: db.search_meetings(query, 20), args.runs), 2)}
+        line = f"{label:<18} {query!r:<16} {matches:>7} matches  search: {result['search_ms']:>9.2f} ms"
+        if args.compare:
+            result["previous_ms"] = round(timed(lambda: conn.execute(PREVIOUS_QUERY, (fts_query, 20, 0)).fetchall(), args.runs), 2)
+            line += f"  previous: {result['previous_ms']:>9.2f} ms"
+        results.append(result)
+        print(line)
+
+    if args.json:
+        with open(args.json, "w") as output:
+            json.dump({"benchmark": "search", "meetings": args.meetings, "results": results}, output, indent=2)
+        print(f"Results written to {args.json}")
+
+if __name__ == "__main__":
+    main()
@@ -36,7 +36,7 @@ document.addEventListener('DOMContentLoaded', function() {
             formData.append('audio', file);
 
             console.log('🔄 Sending to backend...');
-            const response = await fetch(`${API_BASE}/meeting/summarize`, {
+            const response = await fetch(`${API_BASE}/meeting/summarize/stream`, {
                 method: 'POST',
                 body: formData
             });
@@ -47,7 +47,7 @@ document.addEventListener('DOMContentLoaded', function() {
                 throw new Error(`Server error: ${response.status}`);
             }
 
-            const result = await response.json();
+            const result = await readSummaryStream(response);
             console.log('✅ Success! Displaying results...');
             
             // Store meeting data for chat
@@ -97,9 +97,7 @@ document.addEventListener('DOMContentLoaded', function() {
                 },
                 body: JSON.stringify({
                     meeting_id: currentMeetingData.id,
-                    question: message,
-                    transcript: currentMeetingData.transcript_preview,
-                    summary: currentMeetingData.summary
+                    question: message
                 })
             });
 
@@ -122,6 +120,59 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     }
 
+    // Stage labels for the server-sent events emitted by /meeting/summarize/stream
+    const STAGE_LABELS = {
+        upload_received: 'Upload received, starting transcription...',
+        transcript_cached: 'Found an earlier transcript of this recording...',
+        preprocessing: 'Compressing audio for upload...',
+        asr_local: 'Transcribing your meeting audio on the server...',
+        asr_uploading: 'Sending audio to the transcription service...',
+        asr_queued: 'Waiting for the transcription service...',
+        asr_processing: 'Transcribing your meeting audio...',
+        asr_completed: 'Transcription complete...',
+        summarizing: 'Generating summary...',
+        saving: 'Saving meeting...'
+    };
+
+    async function readSummaryStream(response) {
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        let summaryChars = 0;
+
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break;
+            buffer += decoder.decode(value, { stream: true });
+
+            let boundary;
+            while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+                const rawEvent = buffer.slice(0, boundary);
+                buffer = buffer.slice(boundary + 2);
+
+                let eventName = 'message';
+                let data = '';
+                rawEvent.split('\n').forEach(line => {
+                    if (line.startsWith('event: ')) eventName = line.slice(7);
+                    if (line.startsWith('data: ')) data += line.slice(6);
+                });
+                if (!data) continue;
+
+                const payload = JSON.parse(data);
+                if (eventName === 'result') return payload;
+                if (eventName === 'error') throw new Error(payload.detail);
+
+                if (eventName === 'summary_token') {
+                    summaryChars += payload.text.length;
+                    loadingText.textContent = `Generating summary... (${summaryChars} characters)`;
+                } else if (STAGE_LABELS[eventName]) {
+                    loadingText.textContent = STAGE_LABELS[eventName];
+                }
+            }
+        }
+        throw new Error('Connection closed before the summary was ready');
+    }
+
     function enableChat() {
         chatInput.disabled = false;
         chatInput.placeholder = "Ask a question about this meeting...";
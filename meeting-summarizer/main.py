@@ -1,19 +1,65 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Query, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from app.api.meeting import router as meeting_router
-#from app.core.db import get_all_meetings, get_service_stats
+from app.services.upload_service import MAX_UPLOAD_BYTES, MAX_BATCH_UPLOAD_BYTES
+from app.services.job_service import shutdown_jobs
+from app.services.pipeline_service import resume_pipeline_jobs
+from app.services.local_asr import shutdown_local_asr
+from app.services.transcription_service import close_assemblyai_client, warm_up_assemblyai
+from app.services.gemini_service import warm_up_gemini
+from app.services.export_service import (
+    export_meetings, parse_export_fields, parse_export_bound, ExportError, ExportUnavailableError, EXPORT_MEDIA_TYPES
+)
+from app.core.db import init_database, get_all_meetings, get_service_stats, run_db, close_db_connections
+from app.core.metrics import render_metrics
+from app.core.logging_config import configure_logging
+from app.models import MeetingListResponse
 import os
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Optional
 from dotenv import load_dotenv
 from datetime import datetime
 
 load_dotenv()
+configure_logging()
+
+logger = logging.getLogger(__name__)
+
+# Allowance for multipart boundaries and form headers around the audio bytes
+UPLOAD_FORM_OVERHEAD = 64 * 1024
+# Import provider SDKs and open provider connections at startup instead of on the first request
+PROVIDER_WARMUP = os.getenv("PROVIDER_WARMUP", "false").lower() in ("1", "true", "yes")
+
+async def _warm_up_providers():
+    results = await asyncio.gather(asyncio.to_thread(warm_up_gemini), warm_up_assemblyai(), return_exceptions=True)
+    for provider, result in zip(("Gemini", "AssemblyAI"), results):
+        if isinstance(result, Exception):
+            logger.warning("%s warm-up failed: %s", provider, result)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """One-time setup per worker process: schema, resuming unfinished jobs, optional provider warm-up; orderly teardown"""
+    await run_db(init_database)
+    await run_db(resume_pipeline_jobs)
+    if PROVIDER_WARMUP:
+        await _warm_up_providers()
+    yield
+    # Let running jobs finish, then stop local ASR workers and close connections
+    shutdown_jobs(wait=True)
+    shutdown_local_asr()
+    await close_assemblyai_client()
+    close_db_connections()
 
 app = FastAPI(
     title="Meeting Summarizer API",
     description="AI-powered meeting transcription using AssemblyAI ASR and summarization using Google Gemini",
     version="2.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -26,6 +72,67 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+class _BodyTooLarge(Exception):
+    pass
+
+class RequestSizeLimitMiddleware:
+    """Reject oversized uploads with 413 while the body streams in
+
+    Requests declaring a Content-Length over the limit are refused before any body is read;
+    chunked requests are counted as received and cut off as soon as they pass the limit,
+    so Starlette never spools more than the limit to disk.
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        limit = MAX_BATCH_UPLOAD_BYTES if scope["path"] == "/meeting/summarize/batch" else MAX_UPLOAD_BYTES
+        too_large = JSONResponse(
+            status_code=413,
+            content={"detail": f"Request body exceeds the {limit // 1024 // 1024} MB upload limit"}
+        )
+        content_length = dict(scope["headers"]).get(b"content-length", b"")
+        if content_length.isdigit() and int(content_length) > limit + UPLOAD_FORM_OVERHEAD:
+            await too_large(scope, receive, send)
+            return
+
+        received = 0
+        exceeded = False
+        response_started = False
+
+        async def limited_receive():
+            nonlocal received, exceeded
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit + UPLOAD_FORM_OVERHEAD:
+                    exceeded = True
+                    raise _BodyTooLarge()
+            return message
+
+        async def guarded_send(message):
+            nonlocal response_started
+            if exceeded:
+                # The route turned the aborted body read into its own error response; send 413 instead
+                if not response_started:
+                    response_started = True
+                    await too_large(scope, receive, send)
+                return
+            response_started = response_started or message["type"] == "http.response.start"
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except _BodyTooLarge:
+            if not response_started:
+                await too_large(scope, receive, send)
+
+app.add_middleware(RequestSizeLimitMiddleware)
+
 app.include_router(meeting_router, prefix="/meeting", tags=["meeting"])
 
 @app.get("/")
@@ -36,10 +143,24 @@ async def root():
         "docs": "/docs",
         "endpoints": {
             "summarize": "POST /meeting/summarize",
+            "summarize_stream": "POST /meeting/summarize/stream",
+            "summarize_batch": "POST /meeting/summarize/batch",
+            "live_start": "POST /meeting/live",
+            "live_chunk": "POST /meeting/live/{session_id}/chunks",
+            "live_finish": "POST /meeting/live/{session_id}/finish",
+            "job_status": "GET /meeting/jobs/{job_id}",
+            "job_result": "GET /meeting/jobs/{job_id}/result",
+            "job_retry": "POST /meeting/jobs/{job_id}/retry",
             "test": "GET /meeting/test", 
+            "search": "GET /meeting/search?q=",
+            "action_items": "GET /meeting/action-items?assignee=&status=open",
+            "decisions": "GET /meeting/decisions",
+            "chat": "POST /meeting/chat",
             "health": "GET /health",
             "meetings": "GET /meetings",
-            "stats": "GET /stats"
+            "export": "GET /meetings/export?format=ndjson|parquet|arrow",
+            "stats": "GET /stats",
+            "metrics": "GET /metrics"
         },
         "features": {
             "asr": "AssemblyAI API (Real Transcription)",
@@ -73,23 +194,56 @@ async def health_check():
         }
     }
 
-# @app.get("/meetings")
-# async def list_meetings(limit: int = 10):
-#     """Get list of recent meeting summaries with service info"""
-#     meetings = get_all_meetings(limit)
-#     return {
-#         "meetings": meetings,
-#         "total": len(meetings)
-#     }
-
-# @app.get("/stats")
-# async def service_stats():
-#     """Get service usage statistics"""
-#     stats = get_service_stats()
-#     return {
-#         "statistics": stats,
-#         "timestamp": datetime.now().isoformat()
-#     }
+@app.get("/meetings", response_model=MeetingListResponse)
+async def list_meetings(limit: int = Query(10, ge=1, le=100), cursor: Optional[str] = None):
+    """Get a page of recent meeting summaries with service info; pass next_cursor to continue"""
+    try:
+        page = await run_db(get_all_meetings, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    stats = await run_db(get_service_stats)
+    return {
+        "meetings": page["meetings"],
+        "total": stats["total_meetings"] if stats else len(page["meetings"]),
+        "next_cursor": page["next_cursor"]
+    }
+
+@app.get("/meetings/export")
+async def export_meetings_endpoint(
+    format: str = Query("ndjson"),
+    fields: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    gzip: bool = False
+):
+    """Stream all meetings (oldest first) as NDJSON, Parquet or Arrow; filter by created_at range and fields"""
+    try:
+        chunks = export_meetings(format, parse_export_fields(fields), parse_export_bound(since), parse_export_bound(until), gzip)
+    except ExportError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ExportUnavailableError as e:
+        raise HTTPException(status_code=501, detail=str(e))
+
+    filename = f"meetings.{format}" + (".gz" if gzip else "")
+    return StreamingResponse(
+        chunks,
+        media_type="application/gzip" if gzip else EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+@app.get("/stats")
+async def service_stats():
+    """Get service usage statistics"""
+    stats = await run_db(get_service_stats)
+    return {
+        "statistics": stats,
+        "timestamp": datetime.now().isoformat()
+    }
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus text-format metrics: stage latencies, cache, fallback and provider counters"""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
 
 @app.get("/info")
 async def api_info():
@@ -167,28 +167,17 @@ if send_button and user_input:
     with st.spinner("Thinking..."):
         try:
             if st.session_state.meeting_data and st.session_state.chat_context == "meeting_specific":
-            
-                result = st.session_state.meeting_data
-                meeting_context = f"""
-                Meeting Summary: {result['summary']['summary']}
-                
-                Key Decisions: {', '.join(result['summary']['key_decisions'])}
-                
-                Action Items: {', '.join([item['task'] for item in result['summary']['action_items']])}
-                
-                Transcript Preview: {result['transcript_preview']}
-                
-                User Question: {user_input}
-                """
-                
-                model = genai.GenerativeModel("gemini-2.5-flash")
-                response = model.generate_content(f"""
-                Based on this meeting context, answer the user's question accurately and helpfully:
-                
-                {meeting_context}
-                
-                Answer the question based only on the meeting information provided. If you don't have enough information from the meeting context, say so.
-                """)
+                # The backend retrieves the relevant parts of the full stored transcript
+                chat_response = requests.post(
+                    f"{API_BASE}/meeting/chat",
+                    json={
+                        "meeting_id": st.session_state.meeting_data["id"],
+                        "question": user_input
+                    },
+                    timeout=120
+                )
+                chat_response.raise_for_status()
+                ai_response = chat_response.json()["answer"]
             else:
                 model = genai.GenerativeModel("gemini-2.5-flash")
                 response = model.generate_content(f"""
@@ -200,8 +189,8 @@ if send_button and user_input:
                 
                 If the user wants to analyze a meeting, guide them to use the file uploader at the top of the page.
                 """)
+                ai_response = response.text
             
-            ai_response = response.text
             st.session_state.messages.append({"role": "ai", "content": ai_response})
             
         except Exception as e:
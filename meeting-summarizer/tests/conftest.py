@@ -0,0 +1,72 @@
+import os
+import sys
+import tempfile
+import weakref
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Settings are read at import time, so point the app at a scratch database and
+# directories before anything under app/ is imported
+_SCRATCH = tempfile.mkdtemp(prefix="meeting-summarizer-tests-")
+os.environ["MEETINGS_DB_PATH"] = os.path.join(_SCRATCH, "meetings.db")
+os.environ["PIPELINE_AUDIO_DIR"] = os.path.join(_SCRATCH, "pipeline_audio")
+os.environ["ASSEMBLYAI_API_KEY"] = "test-key"
+os.environ["GEMINI_API_KEY"] = "test-key"
+os.environ["AUDIO_PREPROCESS_ENABLED"] = "false"
+os.environ["PROVIDER_WARMUP"] = "false"
+# Uploads are spooled to the working directory; keep them out of the checkout
+os.chdir(_SCRATCH)
+
+@pytest.fixture(scope="session")
+def client():
+    """TestClient with the app's startup and shutdown hooks run once for the session"""
+    from fastapi.testclient import TestClient
+    from main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+@pytest.fixture(scope="session")
+def database():
+    """Scratch database with the current schema, for tests that call app.core directly"""
+    from app.core.db import init_database
+    init_database()
+
+@pytest.fixture
+def fake_assemblyai(monkeypatch):
+    """Fake AssemblyAI server on a free port (transcripts complete after 0.3 s), with fast retries"""
+    from tools.fake_assemblyai import serve
+    from app.services import transcription_service, rate_limiter
+
+    server = serve(port=0, latency=0.3)
+    monkeypatch.setattr(transcription_service, "ASSEMBLYAI_BASE_URL", f"http://127.0.0.1:{server.server_address[1]}")
+    # Shared clients of earlier tests still point at their own fake server
+    monkeypatch.setattr(transcription_service, "_clients", weakref.WeakKeyDictionary())
+    monkeypatch.setattr(transcription_service, "ASSEMBLYAI_POLL_INITIAL_SECONDS", 0.05)
+    monkeypatch.setattr(transcription_service, "ASR_FALLBACK_ENABLED", False)
+    monkeypatch.setattr(rate_limiter, "RATE_LIMIT_BACKOFF_BASE_SECONDS", 0.01)
+    monkeypatch.setattr(rate_limiter, "RATE_LIMIT_BACKOFF_MAX_SECONDS", 0.05)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def fake_gemini(monkeypatch):
+    """Fake Gemini server on a free port with no latency; the SDK is reconfigured to use it"""
+    from tools.fake_gemini import serve
+    from app.services import gemini_service
+
+    server = serve(port=0, latency=0)
+    monkeypatch.setattr(gemini_service, "GEMINI_API_ENDPOINT", f"http://127.0.0.1:{server.server_address[1]}")
+    monkeypatch.setattr(gemini_service, "_genai", None)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def audio_file(tmp_path):
+    path = tmp_path / "meeting.wav"
+    path.write_bytes(b"RIFF" + b"\0" * 4096)
+    return str(path)
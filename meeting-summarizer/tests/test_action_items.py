@@ -0,0 +1,145 @@
+import uuid
+import pytest
+from app.core.action_items import resolve_due_date
+from app.core.db import save_meeting_summary, backfill_summary_items, get_action_items, get_db_connection
+
+pytestmark = pytest.mark.usefixtures("database")
+
+# A Wednesday
+MEETING_DAY = "2026-10-14 10:00:00"
+
+def _owner() -> str:
+    return f"Owner {uuid.uuid4().hex[:8]}"
+
+def _save(action_items: list = (), decisions: list = (), **extra) -> int:
+    summary = {"summary": "Planning.", "key_decisions": list(decisions), "action_items": list(action_items), **extra}
+    return save_meeting_summary(f"{uuid.uuid4().hex}.wav", "Speaker A: We planned the release.", summary)
+
+def _stored_items(meeting_id: int) -> tuple:
+    conn = get_db_connection()
+    actions = conn.execute("SELECT COUNT(*) FROM action_items WHERE meeting_id = ?", (meeting_id,)).fetchone()[0]
+    decisions = conn.execute("SELECT COUNT(*) FROM decisions WHERE meeting_id = ?", (meeting_id,)).fetchone()[0]
+    return actions, decisions
+
+@pytest.mark.parametrize("deadline, due", [
+    ("Friday", "2026-10-16"),
+    ("by Monday", "2026-10-19"),
+    ("Wednesday", "2026-10-21"),
+    ("next Friday", "2026-10-23"),
+    ("next week", "2026-10-19"),
+    ("tomorrow", "2026-10-15"),
+    ("end of the week", "2026-10-16"),
+    ("end of month", "2026-10-31"),
+    ("March 3rd", "2027-03-03"),
+    ("3rd of November", "2026-11-03"),
+    ("2026-12-01", "2026-12-01")
+])
+def test_deadlines_resolve_relative_to_the_meeting_day(deadline, due):
+    assert resolve_due_date(deadline, MEETING_DAY) == due
+
+@pytest.mark.parametrize("deadline", ["ASAP", "Q3", "TBD", "", None, "February 30", "2026-02-30", "soon-ish"])
+def test_unparseable_deadlines_have_no_due_date(deadline):
+    assert resolve_due_date(deadline, MEETING_DAY) is None
+
+def test_error_summaries_store_no_items():
+    failed = _save(
+        [{"task": "Retry the upload", "assignee": "Ops", "deadline": "ASAP"}], ["Processing error"], failed=True
+    )
+    legacy = save_meeting_summary(
+        "legacy.wav", "Speaker A: Hello.",
+        {"summary": "Summary generation failed: quota", "key_decisions": ["Processing error"], "action_items": []}
+    )
+    fallback = save_meeting_summary(
+        "fallback.wav", "[FALLBACK] sample transcript",
+        {"summary": "Unavailable.", "key_decisions": ["Service temporarily unavailable"], "action_items": []}
+    )
+
+    assert _stored_items(failed) == _stored_items(legacy) == _stored_items(fallback) == (0, 0)
+    assert _stored_items(_save([{"task": "Ship it", "assignee": "A", "deadline": "Friday"}], ["Ship"])) == (1, 1)
+
+def test_backfill_restores_items_and_skips_error_summaries():
+    good = _save([{"task": "Write the notes", "assignee": "A", "deadline": "Friday"}], ["Ship on Friday"])
+    failed = _save([{"task": "Check the API key", "assignee": "Ops", "deadline": "ASAP"}], ["Processing error"], failed=True)
+    conn = get_db_connection()
+    with conn:
+        for table in ("action_items", "decisions"):
+            conn.execute(f"DELETE FROM {table} WHERE meeting_id IN (?, ?)", (good, failed))
+        # A failed summary saved before the flag existed
+        conn.execute("UPDATE meeting_summaries SET summary = ? WHERE id = ?", (
+            '{"summary": "Processing failed: boom", "key_decisions": ["Processing error"], "action_items": []}', failed
+        ))
+
+    assert backfill_summary_items(batch_size=2) > 0
+    backfill_summary_items()
+
+    assert _stored_items(good) == (1, 1)
+    assert _stored_items(failed) == (0, 0)
+
+def test_action_items_filter_by_assignee_status_due_date_and_meeting(client):
+    owner = _owner()
+    first = _save([
+        {"task": "Draft the plan", "assignee": owner, "deadline": "2030-01-10"},
+        {"task": "Book the room", "assignee": "Someone Else", "deadline": "2030-01-05"}
+    ])
+    second = _save([{"task": "Review the plan", "assignee": f"  {owner.upper()} ", "deadline": "2030-03-01"}])
+
+    items = client.get("/meeting/action-items", params={"assignee": owner.lower()}).json()["items"]
+    assert [item["task"] for item in items] == ["Review the plan", "Draft the plan"]
+
+    client.patch(f"/meeting/action-items/{items[1]['id']}", json={"status": "done"})
+    open_items = client.get("/meeting/action-items", params={"assignee": owner, "status": "open"}).json()["items"]
+    assert [item["task"] for item in open_items] == ["Review the plan"]
+
+    due = client.get("/meeting/action-items", params={"assignee": owner, "due_before": "2030-02-01"}).json()["items"]
+    assert [item["due_date"] for item in due] == ["2030-01-10"]
+
+    in_order = client.get("/meeting/action-items", params={"meeting_id": first}).json()["items"]
+    assert [item["position"] for item in in_order] == [0, 1]
+    assert {item["meeting_id"] for item in get_action_items(meeting_id=second)} == {second}
+
+    assert client.get("/meeting/action-items", params={"status": "finished"}).status_code == 400
+    assert client.get("/meeting/action-items", params={"due_before": "next week"}).status_code == 400
+
+def test_assignees_are_counted_case_insensitively_per_status(client):
+    owner = _owner()
+    _save([
+        {"task": "One", "assignee": owner, "deadline": "TBD"},
+        {"task": "Two", "assignee": owner.lower(), "deadline": "TBD"},
+        {"task": "Three", "assignee": "TBD", "deadline": "TBD"}
+    ])
+
+    counts = {row["assignee"].lower(): row["count"] for row in client.get("/meeting/action-items/assignees").json()}
+    assert counts[owner.lower()] == 2
+    assert "tbd" not in counts
+
+    done = client.get("/meeting/action-items/assignees", params={"status": "done"}).json()
+    assert owner.lower() not in {row["assignee"].lower() for row in done}
+    assert client.get("/meeting/action-items/assignees", params={"status": "later"}).status_code == 400
+
+def test_status_updates_validate_the_status_and_the_item(client):
+    meeting_id = _save([{"task": "Send the invite", "assignee": _owner(), "deadline": "Friday"}])
+    item_id = get_action_items(meeting_id=meeting_id)[0]["id"]
+
+    response = client.patch(f"/meeting/action-items/{item_id}", json={"status": "in_progress"})
+    assert response.status_code == 200
+    assert response.json()["status"] == "in_progress"
+    assert response.json()["updated_at"] is not None
+
+    assert client.patch(f"/meeting/action-items/{item_id}", json={"status": "finished"}).status_code == 400
+    assert get_action_items(meeting_id=meeting_id)[0]["status"] == "in_progress"
+    assert client.patch("/meeting/action-items/999999999", json={"status": "done"}).status_code == 404
+
+def test_decisions_filter_by_created_at_range(client):
+    meeting_ids = [_save(decisions=[f"Decision {index}"]) for index in range(3)]
+    conn = get_db_connection()
+    with conn:
+        for meeting_id, created_at in zip(meeting_ids, ["2001-01-01 09:00:00", "2001-01-15 09:00:00", "2001-02-01 00:00:00"]):
+            conn.execute("UPDATE decisions SET created_at = ? WHERE meeting_id = ?", (created_at, meeting_id))
+
+    def decisions(**params):
+        return [row["decision"] for row in client.get("/meeting/decisions", params=params).json()["decisions"]]
+
+    assert decisions(since="2001-01-01", until="2001-02-01") == ["Decision 1", "Decision 0"]
+    assert decisions(since="2001-01-10", until="2001-02-01T00:00:01") == ["Decision 2", "Decision 1"]
+    assert decisions(meeting_id=meeting_ids[0]) == ["Decision 0"]
+    assert client.get("/meeting/decisions", params={"since": "last month"}).status_code == 400
@@ -0,0 +1,116 @@
+import os
+import subprocess
+import pytest
+from app.services import audio_preprocessing
+from app.services.audio_preprocessing import parse_edge_silence, restore_timestamps, preprocess_audio, remove_preprocessed
+
+DETECT_OUTPUT = """Input #0, wav, from 'meeting.wav':
+  Duration: 00:01:00.00, bitrate: 256 kb/s
+[silencedetect @ 0x1] silence_start: 0
+[silencedetect @ 0x1] silence_end: 3.5 | silence_duration: 3.5
+[silencedetect @ 0x1] silence_start: 20.25
+[silencedetect @ 0x1] silence_end: 26 | silence_duration: 5.75
+[silencedetect @ 0x1] silence_start: 55.5
+[silencedetect @ 0x1] silence_end: 60 | silence_duration: 4.5
+"""
+
+def test_only_silence_at_the_edges_is_trimmed():
+    # The 5.75 s pause in the middle stays, so later timestamps keep their meaning
+    assert parse_edge_silence(DETECT_OUTPUT) == (3.5, 55.5)
+
+def test_trailing_silence_without_an_end_marker():
+    output = "  Duration: 00:00:30.00\n[silencedetect @ 0x1] silence_start: 27.0\n"
+    assert parse_edge_silence(output) == (0.0, 27.0)
+
+def test_no_edge_silence():
+    output = "  Duration: 00:00:30.00\n[silencedetect @ 0x1] silence_start: 10\n[silencedetect @ 0x1] silence_end: 14 | silence_duration: 4\n"
+    assert parse_edge_silence(output) == (0.0, None)
+    assert parse_edge_silence("") == (0.0, None)
+
+def test_restore_timestamps_adds_the_leading_trim():
+    transcribed = {"text": "Hi.", "utterances": [{"speaker": "A", "start": 0, "end": 900, "text": "Hi."}]}
+
+    restored = restore_timestamps(transcribed, {"leading_trim_ms": 3500})
+
+    assert restored["utterances"][0]["start"] == 3500
+    assert restored["utterances"][0]["end"] == 4400
+    assert transcribed["utterances"][0]["start"] == 0
+    assert restore_timestamps(transcribed, {"applied": False}) is transcribed
+
+@pytest.fixture
+def fake_ffmpeg(monkeypatch, tmp_path):
+    """Replace ffmpeg with a stub that reports edge silence and writes a small output file"""
+    commands = []
+
+    def run(command, **kwargs):
+        commands.append(command)
+        if command[-1] == "-":
+            return subprocess.CompletedProcess(command, 0, b"", DETECT_OUTPUT.encode())
+        with open(command[-1], "wb") as output:
+            output.write(b"OggS" + b"\0" * 16)
+        return subprocess.CompletedProcess(command, 0, b"", b"")
+
+    upload_dir = tmp_path / "uploads"
+    monkeypatch.setattr(audio_preprocessing, "AUDIO_PREPROCESS_ENABLED", True)
+    monkeypatch.setattr(audio_preprocessing, "UPLOAD_TEMP_DIR", str(upload_dir))
+    monkeypatch.setattr(audio_preprocessing.shutil, "which", lambda name: "/usr/bin/ffmpeg")
+    monkeypatch.setattr(audio_preprocessing.subprocess, "run", run)
+    return commands, upload_dir
+
+def test_preprocessing_trims_the_edges_and_records_the_offset(fake_ffmpeg, tmp_path):
+    commands, upload_dir = fake_ffmpeg
+    source = tmp_path / "import" / "meeting.wav"
+    source.parent.mkdir()
+    source.write_bytes(b"\0" * 10000)
+
+    prepared = preprocess_audio(str(source))
+
+    encode = commands[-1]
+    assert encode[encode.index("-ss") + 1] == "3.500"
+    assert encode[encode.index("-to") + 1] == "55.500"
+    assert not any("silenceremove" in part for part in encode)
+    assert prepared["metadata"]["leading_trim_ms"] == 3500
+    assert prepared["metadata"]["trailing_trim_from_ms"] == 55500
+    remove_preprocessed(str(source), prepared["path"])
+
+def test_output_goes_to_a_unique_temp_file_not_beside_the_input(fake_ffmpeg, tmp_path):
+    commands, upload_dir = fake_ffmpeg
+    source = tmp_path / "import" / "meeting.wav"
+    source.parent.mkdir()
+    source.write_bytes(b"\0" * 10000)
+
+    first = preprocess_audio(str(source))
+    second = preprocess_audio(str(source))
+
+    assert first["path"] != second["path"]
+    assert os.path.dirname(first["path"]) == str(upload_dir)
+    assert os.listdir(source.parent) == ["meeting.wav"]
+
+    remove_preprocessed(str(source), first["path"])
+    remove_preprocessed(str(source), second["path"])
+    assert os.listdir(upload_dir) == []
+    assert source.exists()
+
+def test_failed_runs_leave_no_temp_file(fake_ffmpeg, tmp_path, monkeypatch):
+    commands, upload_dir = fake_ffmpeg
+    source = tmp_path / "meeting.wav"
+    source.write_bytes(b"\0" * 10000)
+    monkeypatch.setattr(audio_preprocessing.subprocess, "run", lambda command, **kwargs: subprocess.CompletedProcess(command, 1, b"", b"boom"))
+
+    prepared = preprocess_audio(str(source))
+
+    assert prepared["path"] == str(source)
+    assert prepared["metadata"]["reason"] == "ffmpeg failed"
+    assert os.listdir(upload_dir) == []
+
+def test_local_asr_transcribes_the_original(fake_ffmpeg, tmp_path, monkeypatch):
+    commands, upload_dir = fake_ffmpeg
+    source = tmp_path / "meeting.wav"
+    source.write_bytes(b"\0" * 10000)
+    monkeypatch.setattr(audio_preprocessing, "ASR_PROVIDER", "local")
+
+    prepared = preprocess_audio(str(source))
+
+    assert prepared["path"] == str(source)
+    assert prepared["metadata"]["reason"] == "local ASR"
+    assert commands == []
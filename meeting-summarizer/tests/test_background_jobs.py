@@ -0,0 +1,63 @@
+import time
+import uuid
+import pytest
+from app.services import job_service
+
+def _upload(client, **params):
+    # Unique content, so the transcript cache never short-circuits the job
+    content = b"RIFF" + uuid.uuid4().bytes + b"\0" * 4096
+    return client.post("/meeting/summarize", params=params, files={"audio": ("standup.wav", content, "audio/wav")})
+
+def _wait_for(client, status_url: str, timeout: float = 10) -> dict:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = client.get(status_url).json()
+        if job["status"] in ("completed", "failed"):
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f"{status_url} did not finish")
+
+def test_background_upload_is_queued_and_completes(client, fake_assemblyai, fake_gemini):
+    response = _upload(client, background="true")
+
+    assert response.status_code == 202
+    job = response.json()
+    assert job["status_url"] == f"/meeting/jobs/{job['job_id']}"
+    assert _wait_for(client, job["status_url"])["status"] == "completed"
+
+    result = client.get(job["result_url"])
+    assert result.status_code == 200
+    assert result.json()["filename"] == "standup.wav"
+    assert result.json()["summary"]["key_decisions"] == ["Ship version two next Friday"]
+
+def test_result_is_409_until_the_job_completes(client, fake_assemblyai, fake_gemini):
+    fake_assemblyai.state.latency = 1.5
+    job = _upload(client, background="true").json()
+
+    early = client.get(job["result_url"])
+
+    assert early.status_code == 409
+    assert "still" in early.json()["detail"]
+    assert _wait_for(client, job["status_url"])["status"] == "completed"
+    assert client.get(job["result_url"]).status_code == 200
+
+def test_unknown_jobs_are_404(client):
+    job_id = uuid.uuid4()
+
+    assert client.get(f"/meeting/jobs/{job_id}").status_code == 404
+    assert client.get(f"/meeting/jobs/{job_id}/result").status_code == 404
+
+def test_full_queue_is_503(client, monkeypatch):
+    monkeypatch.setattr(job_service, "JOB_MAX_PENDING", 0)
+
+    response = _upload(client, background="true")
+
+    assert response.status_code == 503
+    assert "queue is full" in response.json()["detail"]
+
+def test_openapi_documents_the_202_job_response(client):
+    responses = client.get("/openapi.json").json()["paths"]["/meeting/summarize"]["post"]["responses"]
+
+    assert responses["200"]["content"]["application/json"]["schema"]["$ref"].endswith("/MeetingResponse")
+    assert responses["202"]["content"]["application/json"]["schema"]["$ref"].endswith("/JobResponse")
+    assert "503" in responses
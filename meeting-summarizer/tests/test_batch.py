@@ -0,0 +1,101 @@
+import uuid
+import pytest
+from app.core.db import save_meeting_summaries_bulk, get_meeting_summary, get_db_connection
+from app.models import BatchItemResult
+from app.services import batch_service
+
+pytestmark = pytest.mark.usefixtures("database")
+
+SUMMARY = {"summary": "Standup.", "key_decisions": [], "action_items": []}
+
+def _wav() -> tuple:
+    return ("files", (f"{uuid.uuid4().hex}.wav", uuid.uuid4().bytes, "audio/wav"))
+
+@pytest.fixture
+def import_root(tmp_path, monkeypatch):
+    root = tmp_path / "imports"
+    root.mkdir()
+    (root / "inside.wav").write_bytes(uuid.uuid4().bytes)
+    (tmp_path / "outside.wav").write_bytes(uuid.uuid4().bytes)
+    monkeypatch.setattr(batch_service, "BATCH_IMPORT_ROOT", str(root))
+    return root
+
+def test_valid_and_invalid_uploads_get_a_manifest_entry_each(client, fake_assemblyai, fake_gemini):
+    files = [_wav(), ("files", ("notes.txt", b"not audio", "text/plain")), _wav()]
+
+    response = client.post("/meeting/summarize/batch", files=files)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["total"], body["succeeded"], body["failed"]) == (3, 2, 1)
+    assert [item["filename"] for item in body["items"]] == [file[1][0] for file in files]
+    assert [item["status"] for item in body["items"]] == ["completed", "failed", "completed"]
+    assert "not supported" in body["items"][1]["error"]
+    assert body["items"][1]["meeting_id"] is None
+    for item in body["items"][::2]:
+        assert get_meeting_summary(item["meeting_id"])["filename"] == item["filename"]
+
+def test_manifest_entries_have_the_documented_shape(client, fake_assemblyai, fake_gemini):
+    body = client.post("/meeting/summarize/batch", files=[_wav()]).json()
+
+    item = body["items"][0]
+    assert set(item) == set(BatchItemResult.model_fields)
+    assert item["source"] == "upload"
+    assert item["error"] is None
+    assert item["is_fallback"] is False
+    assert item["elapsed_seconds"] >= 0
+    assert body["elapsed_seconds"] >= item["elapsed_seconds"]
+
+@pytest.mark.parametrize("path", ["../outside.wav", "sub/../../outside.wav"])
+def test_paths_outside_the_import_root_are_rejected(client, fake_assemblyai, fake_gemini, import_root, path):
+    response = client.post("/meeting/summarize/batch", data={"paths": ["inside.wav", path]})
+
+    items = response.json()["items"]
+    assert items[0]["status"] == "completed"
+    assert items[0]["source"] == "path"
+    assert items[1]["status"] == "failed"
+    assert "outside the import root" in items[1]["error"]
+
+def test_absolute_paths_outside_the_import_root_are_rejected(client, import_root):
+    item = client.post("/meeting/summarize/batch", data={"paths": [str(import_root.parent / "outside.wav")]}).json()["items"][0]
+
+    assert item["status"] == "failed"
+    assert "outside the import root" in item["error"]
+
+def test_an_empty_batch_is_400(client):
+    assert client.post("/meeting/summarize/batch").status_code == 400
+
+def test_a_failing_row_does_not_roll_back_the_others():
+    conn = get_db_connection()
+    before = conn.execute("SELECT COUNT(*) FROM meeting_summaries").fetchone()[0]
+
+    meeting_ids = save_meeting_summaries_bulk([
+        ("first.wav", "First transcript.", SUMMARY),
+        ("broken.wav", "Broken transcript.", {"summary": object()}),
+        ("third.wav", "Third transcript.", SUMMARY)
+    ])
+
+    assert meeting_ids[1] is None
+    assert [get_meeting_summary(meeting_id)["filename"] for meeting_id in meeting_ids[::2]] == ["first.wav", "third.wav"]
+    assert conn.execute("SELECT COUNT(*) FROM meeting_summaries").fetchone()[0] == before + 2
+    with conn:
+        conn.execute("INSERT INTO meeting_search (meeting_search) VALUES ('integrity-check')")
+
+def test_a_row_that_cannot_be_saved_fails_only_its_item(client, fake_assemblyai, fake_gemini, monkeypatch):
+    pipeline = batch_service.process_audio_and_generate_summary_async
+
+    async def unsaveable_marked_uploads(path, audio_hash=None):
+        result = await pipeline(path, audio_hash=audio_hash)
+        with open(path, "rb") as audio:
+            if audio.read(6) == b"BROKEN":
+                result["summary"] = {"summary": object()}
+        return result
+
+    monkeypatch.setattr(batch_service, "process_audio_and_generate_summary_async", unsaveable_marked_uploads)
+    broken = ("files", ("broken.wav", b"BROKEN" + uuid.uuid4().bytes, "audio/wav"))
+
+    body = client.post("/meeting/summarize/batch", files=[_wav(), broken, _wav()]).json()
+
+    assert [item["status"] for item in body["items"]] == ["completed", "failed", "completed"]
+    assert body["items"][1]["error"] == "Database save failed"
+    assert all(get_meeting_summary(item["meeting_id"]) is not None for item in body["items"][::2])
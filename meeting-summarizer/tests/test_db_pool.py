@@ -0,0 +1,50 @@
+import asyncio
+import sqlite3
+import threading
+import pytest
+from app.core import db
+from app.core.db import get_db_connection, run_db, close_db_connections
+
+pytestmark = pytest.mark.usefixtures("database")
+
+def _is_closed(conn) -> bool:
+    try:
+        conn.execute("SELECT 1")
+    except sqlite3.ProgrammingError:
+        return True
+    return False
+
+def test_one_connection_per_thread_in_wal_mode():
+    conn = get_db_connection()
+
+    assert get_db_connection() is conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+def test_run_db_is_bounded_by_the_pool_size():
+    async def connections():
+        return await asyncio.gather(*(run_db(lambda: id(get_db_connection())) for _ in range(50)))
+
+    assert len(set(asyncio.run(connections()))) <= db.DB_POOL_SIZE
+
+def test_close_closes_connections_of_every_thread():
+    opened = []
+    threads = [threading.Thread(target=lambda: opened.append(get_db_connection())) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    opened.append(get_db_connection())
+    opened.append(asyncio.run(run_db(get_db_connection)))
+
+    close_db_connections()
+
+    assert all(_is_closed(conn) for conn in opened)
+
+def test_pool_reopens_after_close():
+    before = get_db_connection()
+    close_db_connections()
+
+    after = get_db_connection()
+    assert after is not before
+    assert after.execute("SELECT 1").fetchone()[0] == 1
+    assert asyncio.run(run_db(lambda: get_db_connection().execute("SELECT 2").fetchone()[0])) == 2
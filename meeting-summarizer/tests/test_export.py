@@ -0,0 +1,101 @@
+import io
+import gzip
+import json
+import pytest
+from datetime import datetime
+from app.core.db import save_meeting_summary, get_db_connection
+from app.services import export_service
+
+def _meetings(year: int, count: int = 3) -> list:
+    """Meetings dated Jan 1..count of year, saved newest first so created_at order differs from id order"""
+    conn = get_db_connection()
+    ids = []
+    for day in range(count, 0, -1):
+        meeting_id = save_meeting_summary(
+            f"export-{year}-{day}.wav", f"Transcript of day {day}.",
+            {"summary": f"Day {day}", "key_decisions": [], "action_items": []}
+        )
+        with conn:
+            conn.execute("UPDATE meeting_summaries SET created_at = ? WHERE id = ?", (f"{year}-01-{day:02d} 09:00:00", meeting_id))
+        ids.append(meeting_id)
+    return ids[::-1]
+
+def _year(year: int) -> dict:
+    return {"since": f"{year}-01-01", "until": f"{year + 1}-01-01"}
+
+def _ndjson(response) -> list:
+    return [json.loads(line) for line in response.text.splitlines()]
+
+def test_ndjson_streams_default_fields_oldest_first(client):
+    ids = _meetings(1990)
+
+    response = client.get("/meetings/export", params=_year(1990))
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert 'filename="meetings.ndjson"' in response.headers["content-disposition"]
+    rows = _ndjson(response)
+    assert [row["id"] for row in rows] == ids
+    assert list(rows[0]) == export_service.EXPORT_DEFAULT_FIELDS
+    assert rows[0]["created_at"] == "1990-01-01 09:00:00"
+    assert rows[0]["summary"] == {"summary": "Day 1", "key_decisions": [], "action_items": []}
+    assert rows[0]["is_fallback"] is False
+
+def test_date_bounds_include_since_and_exclude_until(client):
+    ids = _meetings(1991)
+
+    rows = _ndjson(client.get("/meetings/export", params={"since": "1991-01-02", "until": "1991-01-03T09:00:00"}))
+
+    assert [row["id"] for row in rows] == ids[1:2]
+
+def test_selected_fields_include_the_decompressed_transcript(client):
+    ids = _meetings(1992, count=1)
+
+    rows = _ndjson(client.get("/meetings/export", params={"fields": "transcript, id,transcript", **_year(1992)}))
+
+    assert rows == [{"transcript": "Transcript of day 1.", "id": ids[0]}]
+
+def test_gzip_wraps_the_same_stream(client):
+    _meetings(1993)
+    plain = client.get("/meetings/export", params=_year(1993))
+
+    response = client.get("/meetings/export", params={"gzip": "true", **_year(1993)})
+
+    assert response.headers["content-type"] == "application/gzip"
+    assert 'filename="meetings.ndjson.gz"' in response.headers["content-disposition"]
+    assert gzip.decompress(response.content) == plain.content
+
+@pytest.mark.parametrize("output_format", ["parquet", "arrow"])
+def test_columnar_formats_keep_types_across_batches(client, monkeypatch, output_format):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.parquet
+    year = 1994 if output_format == "parquet" else 1995
+    ids = _meetings(year, count=5)
+    monkeypatch.setattr(export_service, "EXPORT_BATCH_ROWS", 2)
+
+    response = client.get("/meetings/export", params={
+        "format": output_format, "fields": "id,created_at,is_fallback", **_year(year)
+    })
+
+    assert response.status_code == 200
+    if output_format == "parquet":
+        parquet_file = pa.parquet.ParquetFile(io.BytesIO(response.content))
+        assert parquet_file.metadata.num_row_groups == 3
+        table = parquet_file.read()
+    else:
+        table = pa.ipc.open_stream(response.content).read_all()
+    assert table.column("id").to_pylist() == ids
+    # Parquet has no second resolution and stores the timestamps in milliseconds
+    assert pa.types.is_timestamp(table.schema.field("created_at").type)
+    assert table.column("created_at").to_pylist()[0] == datetime(year, 1, 1, 9)
+    assert table.column("is_fallback").to_pylist() == [False] * 5
+
+@pytest.mark.parametrize("params", [
+    {"format": "csv"},
+    {"fields": "id,audio"},
+    {"since": "last tuesday"}
+])
+def test_bad_parameters_are_400(client, params):
+    response = client.get("/meetings/export", params=params)
+
+    assert response.status_code == 400
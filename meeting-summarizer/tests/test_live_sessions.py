@@ -0,0 +1,81 @@
+import uuid
+import pytest
+from app.core.db import get_db_connection, get_meeting_transcript, get_meeting_utterances
+
+pytestmark = pytest.mark.usefixtures("database")
+
+def _chunk(client, session_id: str, offset_ms: int = None):
+    data = {} if offset_ms is None else {"offset_ms": str(offset_ms)}
+    files = {"audio": ("chunk.wav", uuid.uuid4().bytes, "audio/wav")}
+    return client.post(f"/meeting/live/{session_id}/chunks", files=files, data=data)
+
+def _meeting_count() -> int:
+    return get_db_connection().execute("SELECT COUNT(*) FROM meeting_summaries").fetchone()[0]
+
+def test_offset_ms_shifts_utterance_times(client, fake_assemblyai, fake_gemini):
+    session_id = client.post("/meeting/live").json()["session_id"]
+
+    first = _chunk(client, session_id).json()
+    second = _chunk(client, session_id, offset_ms=60000).json()
+
+    first_utterances = first["last_chunk"]["utterances"]
+    second_utterances = second["last_chunk"]["utterances"]
+    assert first_utterances[0]["start"] == 0
+    assert [u["start"] - 60000 for u in second_utterances] == [u["start"] for u in first_utterances]
+    assert [u["end"] - 60000 for u in second_utterances] == [u["end"] for u in first_utterances]
+    assert second["duration_ms"] == second_utterances[-1]["end"]
+
+def test_chunks_without_an_offset_follow_the_previous_chunk(client, fake_assemblyai, fake_gemini):
+    session_id = client.post("/meeting/live").json()["session_id"]
+
+    first = _chunk(client, session_id).json()
+    second = _chunk(client, session_id).json()
+
+    assert second["last_chunk"]["utterances"][0]["start"] == first["duration_ms"]
+    assert second["chunks"] == 2
+
+def test_a_chunk_that_fails_transcription_leaves_the_session_unchanged(client, fake_assemblyai, fake_gemini):
+    session_id = client.post("/meeting/live").json()["session_id"]
+    before = _chunk(client, session_id).json()
+    calls = fake_gemini.state.calls
+    fake_assemblyai.state.inject_fault("POST", "/v2/transcript", 500, count=1)
+
+    response = _chunk(client, session_id)
+
+    assert response.status_code == 502
+    assert "resend it" in response.json()["detail"]
+    after = client.get(f"/meeting/live/{session_id}").json()
+    for field in ("chunks", "duration_ms", "transcript_length", "pending_chars", "summary"):
+        assert after[field] == before[field], field
+    assert fake_gemini.state.calls == calls
+
+    # The same chunk can be resent
+    assert _chunk(client, session_id).json()["chunks"] == 2
+
+def test_unknown_sessions_are_404(client):
+    missing = str(uuid.uuid4())
+
+    assert client.get(f"/meeting/live/{missing}").status_code == 404
+    assert _chunk(client, missing).status_code == 404
+    assert client.post(f"/meeting/live/{missing}/finish").status_code == 404
+
+def test_finish_stores_exactly_one_meeting_and_closes_the_session(client, fake_assemblyai, fake_gemini):
+    session_id = client.post("/meeting/live", params={"filename": "standup-live"}).json()["session_id"]
+    _chunk(client, session_id)
+    _chunk(client, session_id)
+    before = _meeting_count()
+
+    response = client.post(f"/meeting/live/{session_id}/finish")
+
+    assert response.status_code == 200
+    meeting = response.json()
+    assert _meeting_count() == before + 1
+    assert meeting["filename"] == "standup-live"
+    assert meeting["metadata"]["live"]["chunks"] == 2
+    assert get_meeting_transcript(meeting["id"]).count("release plan") == 2
+    assert len(get_meeting_utterances(meeting["id"])) == 8
+
+    assert client.get(f"/meeting/live/{session_id}").status_code == 404
+    assert _chunk(client, session_id).status_code == 404
+    assert client.post(f"/meeting/live/{session_id}/finish").status_code == 404
+    assert _meeting_count() == before + 1
@@ -0,0 +1,60 @@
+from types import SimpleNamespace
+import pytest
+from app.services import local_asr
+from app.services.local_asr import find_split_points, FRAME_SECONDS
+
+RATE = 1000
+
+def _speech_with_gaps(seconds: float, gaps: list):
+    """Loud alternating samples with silent (gap_start, gap_end) stretches, in seconds"""
+    np = pytest.importorskip("numpy")
+    samples = np.tile(np.array([0.5, -0.5], dtype=np.float32), int(seconds * RATE) // 2)
+    for gap_start, gap_end in gaps:
+        samples[int(gap_start * RATE):int(gap_end * RATE)] = 0.0
+    return samples
+
+def test_short_recordings_are_not_split():
+    samples = _speech_with_gaps(14, [(5, 6)])
+
+    assert find_split_points(samples, RATE, target_seconds=10) == []
+
+def test_cuts_land_in_the_silence_nearest_each_target():
+    # Gaps near 9s and 21s; the decoy gap at 13s is further from the first 10s target
+    samples = _speech_with_gaps(40, [(8.8, 9.4), (13.0, 13.5), (20.6, 21.2)])
+
+    offsets = find_split_points(samples, RATE, target_seconds=10)
+    cuts = [offset / RATE for offset in offsets]
+
+    assert len(cuts) == 3
+    assert 8.8 <= cuts[0] <= 9.4
+    assert 20.6 <= cuts[1] <= 21.2
+    # No silence near the last target: the cut still falls inside the +/-50% window
+    assert cuts[1] + 4.9 <= cuts[2] <= cuts[1] + 15
+    assert all(offset % int(RATE * FRAME_SECONDS) == 0 for offset in offsets)
+
+def test_worker_results_are_shifted_onto_the_recording_timeline(monkeypatch):
+    class Model:
+        def transcribe(self, samples, **kwargs):
+            # Every slice says two things: one at its start and one at its end
+            length = len(samples) / RATE
+            return [
+                SimpleNamespace(start=0.0, end=0.5, text=f" opens {len(samples)} "),
+                SimpleNamespace(start=length - 0.5, end=length, text="  "),
+                SimpleNamespace(start=length - 0.5, end=length, text=" closes ")
+            ], None
+
+    monkeypatch.setattr(local_asr, "_worker_model", Model())
+    samples = [0.0] * (25 * RATE)
+
+    tasks = local_asr._segment_tasks(samples, [10 * RATE, 18 * RATE], sample_rate=RATE)
+    segments = local_asr._merge_segments(local_asr._transcribe_segment(task) for task in tasks)
+
+    assert [offset for _, offset in tasks] == [0.0, 10.0, 18.0]
+    assert segments == [
+        {"start": 0.0, "end": 0.5, "text": "opens 10000"},
+        {"start": 9.5, "end": 10.0, "text": "closes"},
+        {"start": 10.0, "end": 10.5, "text": "opens 8000"},
+        {"start": 17.5, "end": 18.0, "text": "closes"},
+        {"start": 18.0, "end": 18.5, "text": "opens 7000"},
+        {"start": 24.5, "end": 25.0, "text": "closes"}
+    ]
@@ -0,0 +1,66 @@
+from app.core.db import save_meeting_summaries_bulk, save_meeting_summary, get_service_stats
+
+SUMMARY = {"summary": "Weekly sync.", "key_decisions": [], "action_items": []}
+
+def _save(count: int) -> list:
+    return save_meeting_summaries_bulk([(f"sync-{index}.wav", f"Transcript {index}.", SUMMARY) for index in range(count)])
+
+def _walk(client, limit: int) -> list:
+    meetings, cursor = [], None
+    while True:
+        params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+        page = client.get("/meetings", params=params).json()
+        assert len(page["meetings"]) <= limit
+        meetings.extend(page["meetings"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return meetings
+
+def test_pages_cover_every_meeting_once_newest_first(client):
+    # One bulk save shares a created_at, so ordering relies on the id tie-break
+    new_ids = _save(25)
+
+    meetings = _walk(client, limit=7)
+    ids = [meeting["id"] for meeting in meetings]
+
+    assert len(ids) == len(set(ids)) == client.get("/meetings").json()["total"]
+    assert ids[:25] == sorted(new_ids, reverse=True)
+    keys = [(meeting["created_at"], meeting["id"]) for meeting in meetings]
+    assert keys == sorted(keys, reverse=True)
+
+def test_cursor_is_stable_when_meetings_are_added(client):
+    _save(10)
+    first = client.get("/meetings", params={"limit": 5}).json()
+
+    _save(3)
+    second = client.get("/meetings", params={"limit": 5, "cursor": first["next_cursor"]}).json()
+
+    first_ids = [meeting["id"] for meeting in first["meetings"]]
+    second_ids = [meeting["id"] for meeting in second["meetings"]]
+    assert not set(first_ids) & set(second_ids)
+    assert max(second_ids) < min(first_ids)
+
+def test_listing_omits_transcripts_and_summaries(client):
+    _save(1)
+    meeting = client.get("/meetings", params={"limit": 1}).json()["meetings"][0]
+
+    assert "transcript" not in meeting
+    assert "summary" not in meeting
+    assert meeting["transcript_length"] == len("Transcript 0.")
+
+def test_invalid_cursor_and_limit_are_rejected(client):
+    assert client.get("/meetings", params={"cursor": "not-a-cursor"}).status_code == 400
+    assert client.get("/meetings", params={"limit": 0}).status_code == 422
+    assert client.get("/meetings", params={"limit": 101}).status_code == 422
+
+def test_stats_are_kept_up_to_date(client):
+    before = client.get("/stats").json()["statistics"]
+
+    save_meeting_summary("real.wav", "abcd", SUMMARY)
+    save_meeting_summary("fallback.wav", "[FALLBACK] sample", SUMMARY)
+    stats = client.get("/stats").json()["statistics"]
+
+    assert stats["total_meetings"] == before["total_meetings"] + 2
+    assert stats["fallback_count"] == before["fallback_count"] + 1
+    assert stats["real_transcription_count"] == before["real_transcription_count"] + 1
+    assert stats == get_service_stats()
@@ -0,0 +1,82 @@
+import re
+import uuid
+import pytest
+
+pytestmark = pytest.mark.usefixtures("database")
+
+_SAMPLE = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(\{[^}]*\})? (\S+)$')
+
+def _scrape(client) -> tuple:
+    """(samples keyed by name + label text, {family: type}) of one /metrics scrape"""
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+
+    samples, types, helped = {}, {}, set()
+    for line in response.text.splitlines():
+        if line.startswith("# HELP "):
+            helped.add(line.split(" ")[2])
+        elif line.startswith("# TYPE "):
+            _, _, family, kind = line.split(" ")
+            assert family in helped, f"TYPE before HELP for {family}"
+            types[family] = kind
+        else:
+            match = _SAMPLE.match(line)
+            assert match, f"not a sample line: {line!r}"
+            name, labels, value = match.groups()
+            base = re.sub(r"_(bucket|sum|count)$", "", name)
+            family = base if types.get(base) == "histogram" else name
+            assert family in types, f"sample without TYPE: {line!r}"
+            samples[name + (labels or "")] = float(value)
+    return samples, types
+
+def _value(samples: dict, key: str) -> float:
+    return samples.get(key, 0.0)
+
+def test_every_family_has_help_and_type_lines(client):
+    samples, types = _scrape(client)
+
+    assert types["meeting_asr_seconds"] == "histogram"
+    assert types["meeting_errors_total"] == "counter"
+    assert types["meeting_requests_in_progress"] == "gauge"
+    assert types["meeting_cache_events_total"] == "counter"
+    assert set(types.values()) <= {"counter", "gauge", "histogram"}
+
+def test_histograms_expose_cumulative_buckets_sum_and_count(client, fake_assemblyai, fake_gemini):
+    client.post("/meeting/summarize", files={"audio": ("standup.wav", uuid.uuid4().bytes, "audio/wav")})
+
+    samples, _ = _scrape(client)
+
+    labels = '{provider="AssemblyAI"'
+    buckets = [
+        (key, value) for key, value in samples.items()
+        if key.startswith("meeting_asr_seconds_bucket" + labels)
+    ]
+    bounds = [re.search(r'le="([^"]+)"', key).group(1) for key, _ in buckets]
+    assert bounds[-1] == "+Inf"
+    assert [float(bound) for bound in bounds[:-1]] == sorted(float(bound) for bound in bounds[:-1])
+    counts = [value for _, value in buckets]
+    assert counts == sorted(counts)
+    assert counts[-1] == samples['meeting_asr_seconds_count{provider="AssemblyAI"}']
+    assert samples['meeting_asr_seconds_sum{provider="AssemblyAI"}'] > 0
+
+def test_a_summarize_request_moves_the_stage_and_cache_counters(client, fake_assemblyai, fake_gemini):
+    before, _ = _scrape(client)
+
+    response = client.post("/meeting/summarize", files={"audio": ("standup.wav", uuid.uuid4().bytes, "audio/wav")})
+    assert response.status_code == 200
+
+    after, _ = _scrape(client)
+    def delta(key):
+        return _value(after, key) - _value(before, key)
+
+    assert delta('meeting_upload_seconds_count') == 1
+    assert delta('meeting_asr_seconds_count{provider="AssemblyAI"}') == 1
+    assert delta('meeting_db_write_seconds_count{operation="save"}') == 1
+    assert delta('meeting_upload_bytes_total') == 16
+    assert delta('meeting_cache_events_total{cache="transcript",event="misses"}') == 1
+    assert delta('meeting_cache_events_total{cache="transcript",event="stores"}') == 1
+    # The fake transcript is the same every time, so the summary is a miss once and a hit after
+    summary_lookups = delta('meeting_cache_events_total{cache="summary",event="hits"}') + delta('meeting_cache_events_total{cache="summary",event="misses"}')
+    assert summary_lookups == 1
+    assert delta('meeting_requests_in_progress{endpoint="summarize"}') == 0
@@ -0,0 +1,109 @@
+import os
+import sys
+import time
+import uuid
+import subprocess
+import httpx
+import pytest
+from app.core.db import create_pipeline_job, checkpoint_pipeline_job, get_pipeline_job
+from app.services import pipeline_service, transcription_service
+from app.services.job_service import get_job
+from app.services.pipeline_service import run_pipeline_job, resume_pipeline_jobs, get_pipeline_job_status
+from app.services.transcription_service import TranscriptionTimeoutError
+
+pytestmark = pytest.mark.usefixtures("database")
+
+def _dead_pid() -> int:
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+def _stored_job() -> tuple:
+    job_id = str(uuid.uuid4())
+    os.makedirs(pipeline_service.PIPELINE_AUDIO_DIR, exist_ok=True)
+    audio_path = os.path.join(pipeline_service.PIPELINE_AUDIO_DIR, job_id + ".wav")
+    with open(audio_path, "wb") as audio:
+        audio.write(b"RIFF" + b"\0" * 4096)
+    create_pipeline_job(job_id, "standup.wav", audio_path)
+    return job_id, audio_path
+
+def _submit_transcript(server) -> str:
+    response = httpx.post(
+        f"http://127.0.0.1:{server.server_address[1]}/v2/transcript",
+        json={"audio_url": "https://cdn.example/standup.wav"}, headers={"authorization": "test-key"}
+    )
+    return response.json()["id"]
+
+def _wait_for(job_id: str, timeout: float = 10) -> dict:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = get_job(job_id)
+        if job is not None and job["status"] in ("completed", "failed"):
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f"job {job_id} did not finish")
+
+def test_orphaned_job_reattaches_to_its_transcript(fake_assemblyai, fake_gemini):
+    job_id, audio_path = _stored_job()
+    transcript_id = _submit_transcript(fake_assemblyai)
+    checkpoint_pipeline_job(job_id, "transcribing", asr_transcript_id=transcript_id, owner_pid=_dead_pid())
+    fake_assemblyai.state.requests.clear()
+
+    assert resume_pipeline_jobs() >= 1
+    job = _wait_for(job_id)
+
+    assert job["status"] == "completed"
+    assert job["result"]["metadata"]["resumed"] is True
+    assert ("POST", "/v2/upload") not in fake_assemblyai.state.requests
+    assert ("GET", f"/v2/transcript/{transcript_id}") in fake_assemblyai.state.requests
+    stored = get_pipeline_job(job_id)
+    assert (stored["stage"], stored["attempts"], stored["audio_path"]) == ("completed", 2, None)
+    assert not os.path.exists(audio_path)
+
+def test_job_with_a_transcript_checkpoint_resumes_at_the_summary(fake_assemblyai, fake_gemini):
+    job_id, _ = _stored_job()
+    checkpoint_pipeline_job(job_id, "transcribed", transcript="Ship version two next Friday.", utterances=[], owner_pid=_dead_pid())
+    fake_assemblyai.state.requests.clear()
+
+    resume_pipeline_jobs()
+    job = _wait_for(job_id)
+
+    assert job["status"] == "completed"
+    assert fake_assemblyai.state.requests == []
+    assert fake_gemini.state.calls == 1
+
+def test_jobs_of_live_workers_are_left_alone():
+    job_id, _ = _stored_job()
+    checkpoint_pipeline_job(job_id, "transcribing", owner_pid=os.getppid())
+
+    resume_pipeline_jobs()
+
+    assert get_job(job_id) is None
+    assert get_pipeline_job(job_id)["attempts"] == 1
+    checkpoint_pipeline_job(job_id, "failed", error="test cleanup")
+
+def test_transcription_deadline_fails_the_job_and_retry_reattaches(client, fake_assemblyai, fake_gemini, monkeypatch):
+    job_id, audio_path = _stored_job()
+    fake_assemblyai.state.latency = 30
+    monkeypatch.setattr(transcription_service, "ASSEMBLYAI_DEADLINE_SECONDS", 0.3)
+
+    with pytest.raises(TranscriptionTimeoutError):
+        run_pipeline_job(job_id)
+
+    status = get_pipeline_job_status(job_id)
+    assert status["status"] == "failed"
+    assert status["detail"]["retryable"] is True
+    assert os.path.exists(audio_path)
+
+    fake_assemblyai.state.latency = 0
+    response = client.post(f"/meeting/jobs/{job_id}/retry")
+    assert response.status_code == 202
+    job = _wait_for(job_id)
+
+    assert job["status"] == "completed"
+    assert fake_assemblyai.state.requests.count(("POST", "/v2/upload")) == 1
+    assert not os.path.exists(audio_path)
+    assert client.post(f"/meeting/jobs/{job_id}/retry").status_code == 409
+
+def test_retrying_an_unknown_job_is_404(client):
+    assert client.post(f"/meeting/jobs/{uuid.uuid4()}/retry").status_code == 404
@@ -0,0 +1,174 @@
+import time
+import asyncio
+import threading
+import httpx
+import pytest
+from app.services import rate_limiter
+from app.services.rate_limiter import ProviderLimiter, backoff_delay
+
+def _rate_limited(retry_after: str = None) -> httpx.HTTPStatusError:
+    headers = {"retry-after": retry_after} if retry_after else {}
+    request = httpx.Request("POST", "https://provider.example/v1")
+    response = httpx.Response(429, headers=headers, request=request)
+    return httpx.HTTPStatusError("Too Many Requests", request=request, response=response)
+
+@pytest.fixture(autouse=True)
+def fast_backoff(monkeypatch):
+    monkeypatch.setattr(rate_limiter, "RATE_LIMIT_BACKOFF_BASE_SECONDS", 0.01)
+    monkeypatch.setattr(rate_limiter, "RATE_LIMIT_BACKOFF_MAX_SECONDS", 0.02)
+
+def test_token_bucket_refills_at_the_configured_rate():
+    limiter = ProviderLimiter("test", 4, requests_per_minute=600)
+    limiter.tokens = 0
+    limiter.updated_at = time.monotonic()
+
+    # 10 requests per second: the next token is about 0.1 s away
+    assert 0.05 < limiter._try_take_token() <= 0.1
+    limiter.updated_at -= 0.25
+    assert limiter._try_take_token() == 0
+    assert 1.4 < limiter.tokens < 1.6
+
+def test_token_bucket_never_holds_more_than_its_capacity():
+    limiter = ProviderLimiter("test", 4, requests_per_minute=600)
+    limiter.updated_at -= 3600
+
+    assert limiter.get_stats()["tokens_available"] == limiter.capacity == 4
+
+def test_throttle_waits_for_the_next_token():
+    limiter = ProviderLimiter("test", 1, requests_per_minute=300)
+    limiter.tokens = 0
+    limiter.updated_at = time.monotonic()
+
+    start = time.monotonic()
+    limiter.throttle()
+
+    assert 0.15 < time.monotonic() - start < 1
+
+def test_slots_cap_concurrency_and_are_granted_in_arrival_order():
+    limiter = ProviderLimiter("test", 2, requests_per_minute=6000)
+    lock = threading.Lock()
+    active, peak, order = [0], [0], []
+
+    def worker(name: str):
+        with limiter.slot():
+            with lock:
+                order.append(name)
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+
+    threads = []
+    for index in range(6):
+        thread = threading.Thread(target=worker, args=(index,))
+        thread.start()
+        threads.append(thread)
+        # Let each thread queue before the next one arrives
+        time.sleep(0.01)
+    for thread in threads:
+        thread.join()
+
+    assert peak[0] == 2
+    assert order == list(range(6))
+    stats = limiter.get_stats()
+    assert (stats["in_flight"], stats["queue_depth"], stats["acquired"]) == (0, 0, 6)
+    assert stats["max_queue_depth"] >= 3
+
+def test_async_slots_are_fifo_and_shared_with_threads():
+    limiter = ProviderLimiter("test", 1, requests_per_minute=6000)
+    order = []
+
+    async def task(name: str):
+        async with limiter.slot_async():
+            order.append(name)
+            await asyncio.sleep(0.02)
+
+    async def run():
+        with limiter.slot():
+            tasks = []
+            for index in range(4):
+                tasks.append(asyncio.create_task(task(index)))
+                await asyncio.sleep(0.01)
+            assert order == []
+            assert limiter.get_stats()["queue_depth"] == 4
+        await asyncio.gather(*tasks)
+
+    asyncio.run(run())
+
+    assert order == [0, 1, 2, 3]
+    assert limiter.get_stats()["in_flight"] == 0
+
+def test_a_cancelled_async_waiter_gives_up_its_place():
+    limiter = ProviderLimiter("test", 1, requests_per_minute=6000)
+    order = []
+
+    async def task(name: str):
+        async with limiter.slot_async():
+            order.append(name)
+
+    async def run():
+        with limiter.slot():
+            first = asyncio.create_task(task("cancelled"))
+            second = asyncio.create_task(task("served"))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            await asyncio.sleep(0.01)
+        await second
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    asyncio.run(run())
+
+    assert order == ["served"]
+    assert limiter.get_stats()["in_flight"] == 0
+
+def test_rate_limited_calls_are_retried():
+    limiter = ProviderLimiter("test", 1, requests_per_minute=6000)
+    attempts = []
+
+    def request():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise _rate_limited()
+        return "ok"
+
+    assert limiter.call(request) == "ok"
+    assert len(attempts) == 3
+    assert limiter.get_stats()["rate_limited"] == 2
+
+def test_retry_after_sets_the_minimum_wait():
+    limiter = ProviderLimiter("test", 1, requests_per_minute=6000)
+    attempts = []
+
+    async def request():
+        attempts.append(time.monotonic())
+        if len(attempts) == 1:
+            raise _rate_limited(retry_after="0.3")
+        return "ok"
+
+    assert asyncio.run(limiter.call_async(request)) == "ok"
+    assert attempts[1] - attempts[0] >= 0.3
+    assert backoff_delay(0, retry_after=7) == 7
+
+def test_retries_stop_after_the_limit_and_other_errors_are_not_retried(monkeypatch):
+    monkeypatch.setattr(rate_limiter, "RATE_LIMIT_MAX_RETRIES", 2)
+    limiter = ProviderLimiter("test", 1, requests_per_minute=6000)
+    attempts = []
+
+    def throttled():
+        attempts.append(1)
+        raise _rate_limited()
+
+    with pytest.raises(httpx.HTTPStatusError):
+        limiter.call(throttled)
+    assert len(attempts) == 3
+    assert limiter.get_stats()["retries_exhausted"] == 1
+
+    def broken():
+        attempts.append(1)
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        limiter.call(broken)
+    assert len(attempts) == 4
@@ -0,0 +1,129 @@
+import uuid
+import sqlite3
+import pytest
+from app.core import db
+from app.core.db import save_meeting_summary, search_meetings, get_db_connection, register_sql_functions
+
+pytestmark = pytest.mark.usefixtures("database")
+
+def _term() -> str:
+    # Letters only, so the tokenizer and the porter stemmer keep it as one stable token
+    return "zq" + "".join(chr(ord("a") + int(char, 16) % 26) for char in uuid.uuid4().hex[:10])
+
+def _summary(summary: str = "Weekly sync.", decisions: list = None) -> dict:
+    return {"summary": summary, "key_decisions": decisions or [], "action_items": []}
+
+def test_decision_and_summary_matches_outrank_transcript_mentions():
+    term = _term()
+    in_transcript = save_meeting_summary("transcript.wav", f"Someone mentioned {term} in passing.", _summary())
+    in_decision = save_meeting_summary("decision.wav", "Nothing relevant was said.", _summary(decisions=[f"Adopt {term}"]))
+    in_summary = save_meeting_summary("summary.wav", "Nothing relevant was said.", _summary(f"Discussed {term}."))
+
+    ids = [result["id"] for result in search_meetings(term)]
+
+    assert set(ids[:2]) == {in_decision, in_summary}
+    assert ids[2] == in_transcript
+
+def test_results_carry_highlighted_snippets_and_configured_scores():
+    term = _term()
+    meeting_id = save_meeting_summary("snippet.wav", f"We agreed the {term} rollout starts Monday.", _summary())
+
+    result = search_meetings(term)[0]
+
+    assert result["id"] == meeting_id
+    assert f"<mark>{term}</mark>" in result["snippet"]
+    score = get_db_connection().execute(
+        "SELECT bm25(meeting_search, 1.0, 4.0, 6.0, 6.0, 0.0, 0.0) FROM meeting_search WHERE meeting_search MATCH ? AND rowid = ?",
+        (f'"{term}"', meeting_id)
+    ).fetchone()[0]
+    assert result["score"] == pytest.approx(score)
+
+def test_every_word_must_match_and_star_keeps_prefix_search():
+    first, second = _term(), _term()
+    both = save_meeting_summary("both.wav", f"{first} and {second}", _summary())
+    save_meeting_summary("one.wav", f"only {first}", _summary())
+
+    assert [result["id"] for result in search_meetings(f"{first} {second}")] == [both]
+    assert len(search_meetings(first[:-3] + "*")) == 2
+    assert search_meetings(first[:-3]) == []
+
+def test_punctuation_only_queries_return_nothing():
+    assert search_meetings('"*:()') == []
+
+def test_common_terms_are_ranked_among_the_newest_candidates(monkeypatch):
+    term = _term()
+    ids = [save_meeting_summary(f"common-{index}.wav", f"{term} " * (index + 1), _summary()) for index in range(6)]
+    monkeypatch.setattr(db, "SEARCH_MAX_CANDIDATES", 3)
+
+    found = [result["id"] for result in search_meetings(term)]
+
+    assert sorted(found) == ids[3:]
+    # Rarer terms below the cap still rank every match
+    monkeypatch.setattr(db, "SEARCH_MAX_CANDIDATES", 10)
+    assert sorted(result["id"] for result in search_meetings(term)) == ids
+
+def test_pagination_and_route(client):
+    term = _term()
+    ids = {save_meeting_summary(f"page-{index}.wav", f"{term} number {index}", _summary()) for index in range(5)}
+
+    first = client.get("/meeting/search", params={"q": term, "limit": 3}).json()["results"]
+    rest = client.get("/meeting/search", params={"q": term, "limit": 3, "offset": 3}).json()["results"]
+
+    assert {result["id"] for result in first + rest} == ids
+    assert len(first) == 3
+
+def test_index_keeps_no_copy_of_the_text():
+    conn = get_db_connection()
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+
+    assert "meeting_search_content" not in tables
+    conn.execute("INSERT INTO meeting_search (meeting_search) VALUES ('integrity-check')")
+
+def test_deleted_meetings_leave_the_index():
+    term = _term()
+    meeting_id = save_meeting_summary("deleted.wav", f"Talked about {term}.", _summary(decisions=[f"Drop {term}"]))
+    conn = get_db_connection()
+
+    with conn:
+        conn.execute("DELETE FROM meeting_summaries WHERE id = ?", (meeting_id,))
+
+    assert search_meetings(term) == []
+    conn.execute("INSERT INTO meeting_search (meeting_search) VALUES ('integrity-check')")
+
+def test_external_connections_need_the_sql_functions_to_delete():
+    term = _term()
+    meeting_id = save_meeting_summary("external.wav", f"Talked about {term}.", _summary())
+    conn = sqlite3.connect(db.DB_PATH)
+
+    try:
+        with pytest.raises(sqlite3.OperationalError, match="no such function"):
+            with conn:
+                conn.execute("DELETE FROM meeting_summaries WHERE id = ?", (meeting_id,))
+
+        register_sql_functions(conn)
+        with conn:
+            conn.execute("DELETE FROM meeting_summaries WHERE id = ?", (meeting_id,))
+    finally:
+        conn.close()
+
+    assert search_meetings(term) == []
+
+def test_plaintext_index_is_replaced_on_startup():
+    term = _term()
+    meeting_id = save_meeting_summary("legacy.wav", f"Before the upgrade we said {term}.", _summary())
+    conn = get_db_connection()
+    with conn:
+        conn.execute("DROP TRIGGER trg_meeting_search_delete")
+        conn.execute("DROP TABLE meeting_search")
+        conn.execute('''
+            CREATE VIRTUAL TABLE meeting_search USING fts5(
+                transcript, summary, decisions, action_items,
+                filename UNINDEXED, created_at UNINDEXED,
+                tokenize = 'porter unicode61'
+            )
+        ''')
+
+    db.init_database()
+
+    assert "meeting_search_source" in conn.execute("SELECT sql FROM sqlite_master WHERE name = 'meeting_search'").fetchone()[0]
+    assert [result["id"] for result in search_meetings(term)] == [meeting_id]
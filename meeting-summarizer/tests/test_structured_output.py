@@ -0,0 +1,97 @@
+import json
+import uuid
+import pytest
+from app.core.cache import transcript_fingerprint, get_cached_summary
+from app.models import SummaryResponse
+from app.services import gemini_service
+from app.services.structured_output import StructuredOutputError, extract_json, gemini_schema, parse_summary
+
+pytestmark = pytest.mark.usefixtures("database")
+
+SUMMARY = {
+    "summary": "Release planning.",
+    "key_decisions": ["Ship on Friday"],
+    "action_items": [{"task": "Write the notes", "assignee": None, "deadline": "Monday"}]
+}
+
+def _script(fake_gemini, replies: list) -> list:
+    """Make the fake model answer with replies in order; returns the prompts it receives"""
+    prompts = []
+    def answer(prompt):
+        prompts.append(prompt)
+        return replies[len(prompts) - 1]
+    fake_gemini.state.answer = answer
+    return prompts
+
+def _transcript() -> str:
+    # Unique text, so the summary cache never answers for the model
+    return f"Speaker A: Let's plan the release {uuid.uuid4().hex}.\nSpeaker B: Friday works."
+
+def test_fenced_json_is_extracted():
+    text = "```json\n" + json.dumps(SUMMARY) + "\n```"
+
+    assert extract_json(text) == SUMMARY
+
+def test_prose_around_the_object_is_ignored():
+    text = "Here is the summary you asked for:\n" + json.dumps(SUMMARY) + "\nLet me know if {anything} changes."
+
+    assert extract_json(text) == SUMMARY
+
+def test_braces_inside_strings_do_not_end_the_object():
+    data = {"summary": "Use {braces} and \"quotes\" }", "key_decisions": [], "action_items": []}
+
+    assert extract_json("Result: " + json.dumps(data) + " done") == data
+
+def test_truncated_json_is_closed():
+    text = json.dumps(SUMMARY)
+    cut = text[:text.index('"Monday"') + 4]
+
+    data = extract_json(cut)
+
+    assert data["key_decisions"] == ["Ship on Friday"]
+    assert data["action_items"][0]["deadline"] == "Mon"
+
+def test_output_without_an_object_is_an_error():
+    with pytest.raises(StructuredOutputError):
+        extract_json("I could not summarize this meeting.")
+    with pytest.raises(StructuredOutputError):
+        extract_json('{"summary": "x"]')
+
+def test_parse_summary_fills_missing_owners_and_rejects_missing_fields():
+    assert parse_summary(json.dumps(SUMMARY))["action_items"][0]["assignee"] == "TBD"
+
+    with pytest.raises(StructuredOutputError, match="SummaryResponse"):
+        parse_summary(json.dumps({"summary": "No lists."}))
+
+def test_gemini_schema_has_no_refs_or_any_of():
+    schema = gemini_schema(SummaryResponse)
+    text = json.dumps(schema)
+
+    assert "$ref" not in text
+    assert "anyOf" not in text
+    assert "$defs" not in text
+    assert schema["properties"]["action_items"]["items"]["properties"]["assignee"]["nullable"] is True
+
+def test_a_missing_field_is_fixed_by_one_repair_call(fake_gemini):
+    prompts = _script(fake_gemini, [json.dumps({"summary": "Release planning."}), json.dumps(SUMMARY)])
+
+    summary = gemini_service.generate_summary(_transcript())
+
+    assert len(prompts) == 2
+    assert "could not be used" in prompts[1]
+    assert '{"summary": "Release planning."}' in prompts[1]
+    assert summary["key_decisions"] == ["Ship on Friday"]
+    assert summary["action_items"][0]["assignee"] == "TBD"
+
+def test_a_failed_repair_falls_back_to_an_error_summary_that_is_not_cached(fake_gemini):
+    transcript = _transcript()
+    prompts = _script(fake_gemini, ["No JSON here.", "Still no JSON."])
+
+    summary = gemini_service.generate_summary(transcript)
+
+    assert len(prompts) == 2
+    assert summary["summary"].startswith("Summary generation failed")
+    assert summary["failed"] is True
+    assert summary["action_items"] == []
+    fingerprint = transcript_fingerprint(transcript)
+    assert get_cached_summary(fingerprint, gemini_service.SUMMARY_MODEL, gemini_service.PROMPT_VERSION) is None
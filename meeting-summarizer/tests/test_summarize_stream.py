@@ -0,0 +1,51 @@
+import json
+import uuid
+import pytest
+from app.services import transcription_service
+
+pytestmark = pytest.mark.usefixtures("database")
+
+def _events(response) -> list:
+    """(event, data) pairs of an SSE body, skipping keep-alive comments"""
+    events = []
+    for block in response.text.split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if line and not line.startswith(":"))
+        if fields:
+            events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+def _stream(client):
+    return client.post("/meeting/summarize/stream", files={"audio": ("standup.wav", uuid.uuid4().bytes, "audio/wav")})
+
+def test_stage_events_arrive_in_order_before_the_result(client, fake_assemblyai, fake_gemini):
+    response = _stream(client)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _events(response)
+    names = [event for event, _ in events]
+    assert names[0] == "upload_received"
+    assert events[0][1] == {"filename": "standup.wav", "size": 16}
+    assert names[-1] == "result"
+    stages = [name for name in names if name != "summary_token"]
+    assert stages.index("asr_uploading") < stages.index("asr_completed") < stages.index("summarizing") < stages.index("saved")
+    assert stages.index("saved") == len(stages) - 2
+    # Tokens stream only between summarizing and saving (none at all when the summary is cached)
+    tokens = [index for index, name in enumerate(names) if name == "summary_token"]
+    assert all(names.index("summarizing") < index < names.index("saving") for index in tokens)
+    result = events[-1][1]
+    assert result["id"] == events[names.index("saved")][1]["meeting_id"]
+    assert result["summary"]["key_decisions"] == ["Ship version two next Friday"]
+
+def test_failures_end_the_stream_with_an_error_event(client, fake_assemblyai, fake_gemini, monkeypatch):
+    fake_assemblyai.state.latency = 60
+    monkeypatch.setattr(transcription_service, "ASSEMBLYAI_DEADLINE_SECONDS", 0.3)
+
+    events = _events(_stream(client))
+
+    names = [event for event, _ in events]
+    assert names[0] == "upload_received"
+    assert names[-1] == "error"
+    assert "result" not in names and "saved" not in names
+    assert "AssemblyAI timeout" in events[-1][1]["detail"]
+    assert fake_gemini.state.calls == 0
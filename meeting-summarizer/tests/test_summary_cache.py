@@ -0,0 +1,56 @@
+import uuid
+import pytest
+from app.services import gemini_service
+from app.services.gemini_service import generate_summary, SUMMARY_MODEL
+from app.core.cache import get_cached_summary, transcript_fingerprint
+
+pytestmark = pytest.mark.usefixtures("database")
+
+def _transcript() -> str:
+    return f"Speaker A: We agreed to ship on Friday. Speaker B: I'll update the docs ({uuid.uuid4().hex})."
+
+def test_repeated_transcript_is_summarized_once(fake_gemini):
+    transcript = _transcript()
+
+    first = generate_summary(transcript)
+    second = generate_summary(transcript)
+
+    assert fake_gemini.state.calls == 1
+    assert second == first
+    assert first["key_decisions"] == ["Ship version two next Friday"]
+
+def test_whitespace_changes_still_hit(fake_gemini):
+    transcript = _transcript()
+
+    generate_summary(transcript)
+    generate_summary("  " + transcript.replace(" ", "\n  ") + "\n")
+
+    assert fake_gemini.state.calls == 1
+
+def test_different_transcripts_miss(fake_gemini):
+    generate_summary(_transcript())
+    generate_summary(_transcript())
+
+    assert fake_gemini.state.calls == 2
+
+def test_new_prompt_version_misses_and_drops_old_entries(fake_gemini, monkeypatch):
+    transcript = _transcript()
+    generate_summary(transcript)
+    old_version = gemini_service.PROMPT_VERSION
+
+    monkeypatch.setattr(gemini_service, "PROMPT_VERSION", "next-version")
+    generate_summary(transcript)
+
+    assert fake_gemini.state.calls == 2
+    assert get_cached_summary(transcript_fingerprint(transcript), SUMMARY_MODEL, old_version) is None
+
+def test_chunk_size_is_part_of_the_prompt_version():
+    assert gemini_service.PROMPT_VERSION == gemini_service._prompt_version(gemini_service.SUMMARY_CHUNK_CHARS)
+    assert gemini_service._prompt_version(12000) != gemini_service._prompt_version(24000)
+
+def test_fallback_transcripts_are_not_sent_or_cached(fake_gemini):
+    summary = generate_summary("[FALLBACK] This is a sample transcript.")
+
+    assert fake_gemini.state.calls == 0
+    assert summary["key_decisions"] == ["Service temporarily unavailable"]
+    assert get_cached_summary(transcript_fingerprint("[FALLBACK] This is a sample transcript."), SUMMARY_MODEL, gemini_service.PROMPT_VERSION) is None
@@ -0,0 +1,72 @@
+from app.services.summary_chunking import split_transcript, merge_partial_summaries
+
+def _lines(count: int) -> list:
+    return [f"Speaker {'AB'[i % 2]}: Point number {i:02d} about the release." for i in range(count)]
+
+def test_short_transcripts_are_a_single_chunk():
+    transcript = "Speaker A: Ship on Friday.\nSpeaker B: Agreed."
+
+    assert split_transcript(transcript, max_chars=100) == [transcript]
+
+def test_chunks_end_on_utterance_boundaries_without_overlap():
+    lines = _lines(10)
+
+    chunks = split_transcript("\n".join(lines), max_chars=100)
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 100 for chunk in chunks)
+    # Every utterance lands whole in exactly one chunk, in the original order
+    assert [line for chunk in chunks for line in chunk.split("\n")] == lines
+
+def test_inline_speaker_turns_are_split_like_lines():
+    lines = _lines(6)
+
+    chunks = split_transcript(" ".join(lines), max_chars=100)
+
+    assert [line for chunk in chunks for line in chunk.split("\n")] == lines
+
+def test_an_oversized_utterance_is_cut_at_sentences_then_words():
+    long_sentence = " ".join(["word"] * 40)
+    transcript = "Speaker A: Short opener.\nSpeaker B: First sentence here. " + long_sentence + "."
+
+    chunks = split_transcript(transcript, max_chars=60)
+
+    assert all(len(chunk) <= 60 for chunk in chunks)
+    # The short pieces still pack together; the long sentence spills over word by word
+    assert chunks[0] == "Speaker A: Short opener.\nSpeaker B: First sentence here."
+    assert len(chunks) > 2
+    assert " ".join(" ".join(chunks[1:]).split()) == long_sentence + "."
+
+def test_merge_keeps_order_and_drops_duplicates():
+    partials = [
+        {
+            "summary": "Release planning.",
+            "key_decisions": ["Ship on Friday", "Freeze the API"],
+            "action_items": [{"task": "Update the docs", "assignee": "TBD", "deadline": "TBD"}]
+        },
+        {
+            "summary": "Follow-ups.",
+            "key_decisions": ["ship on friday!", "Hire a designer"],
+            "action_items": [
+                {"task": "update the docs.", "assignee": "Dana", "deadline": "Thursday"},
+                {"task": "Book the venue", "assignee": "Lee", "deadline": "Monday"}
+            ]
+        }
+    ]
+
+    merged = merge_partial_summaries(partials)
+
+    assert merged["summary"] == "Release planning. Follow-ups."
+    assert merged["key_decisions"] == ["Ship on Friday", "Freeze the API", "Hire a designer"]
+    assert merged["action_items"] == [
+        {"task": "Update the docs", "assignee": "Dana", "deadline": "Thursday"},
+        {"task": "Book the venue", "assignee": "Lee", "deadline": "Monday"}
+    ]
+
+def test_merge_keeps_a_known_owner_over_a_later_unknown_one():
+    partials = [
+        {"summary": "", "key_decisions": [], "action_items": [{"task": "Book the venue", "assignee": "Lee", "deadline": "Monday"}]},
+        {"summary": "", "key_decisions": [], "action_items": [{"task": "Book the venue", "assignee": "unknown", "deadline": "Friday"}]}
+    ]
+
+    assert merge_partial_summaries(partials)["action_items"] == [{"task": "Book the venue", "assignee": "Lee", "deadline": "Monday"}]
@@ -0,0 +1,141 @@
+import os
+import uuid
+import time
+import asyncio
+import threading
+import pytest
+from app.core import cache
+from app.services import ai_service
+from app.core.cache import get_cached_transcript, save_cached_transcript, get_cache_stats
+from app.core.db import get_db_connection, init_database
+
+pytestmark = pytest.mark.usefixtures("database")
+
+MODEL = "AssemblyAI"
+
+UTTERANCES = [
+    {"speaker": "A", "start": 0, "end": 1200, "text": "Let's ship on Friday."},
+    {"speaker": "B", "start": 1500, "end": 2600, "text": "I'll update the docs."}
+]
+
+def _hash() -> str:
+    return uuid.uuid4().hex
+
+def _upload(client, content: bytes):
+    return client.post("/meeting/summarize", files={"audio": ("standup.wav", content, "audio/wav")})
+
+def test_round_trip_keeps_text_and_utterances():
+    audio_hash = _hash()
+    save_cached_transcript(audio_hash, MODEL, "Let's ship on Friday. I'll update the docs.", 1024, UTTERANCES)
+
+    cached = get_cached_transcript(audio_hash, MODEL)
+
+    assert cached["text"] == "Let's ship on Friday. I'll update the docs."
+    assert cached["utterances"] == UTTERANCES
+
+def test_transcripts_are_stored_compressed():
+    audio_hash = _hash()
+    save_cached_transcript(audio_hash, MODEL, "Let's ship on Friday. " * 50, 1024)
+
+    stored = get_db_connection().execute(
+        "SELECT typeof(transcript), length(transcript) FROM transcript_cache WHERE audio_hash = ?", (audio_hash,)
+    ).fetchone()
+
+    assert stored[0] == "blob"
+    assert stored[1] < len("Let's ship on Friday. " * 50) // 4
+
+def test_the_same_audio_from_another_engine_is_a_miss():
+    audio_hash = _hash()
+    save_cached_transcript(audio_hash, "faster-whisper/base", "Lets ship on friday.", 1024)
+
+    assert get_cached_transcript(audio_hash, MODEL) is None
+    save_cached_transcript(audio_hash, MODEL, "Let's ship on Friday.", 1024)
+    assert get_cached_transcript(audio_hash, "faster-whisper/base")["text"] == "Lets ship on friday."
+    assert get_cached_transcript(audio_hash, MODEL)["text"] == "Let's ship on Friday."
+
+def test_entries_without_an_engine_are_dropped_on_upgrade():
+    conn = get_db_connection()
+    with conn:
+        conn.execute("DROP TABLE transcript_cache")
+        conn.execute('''
+            CREATE TABLE transcript_cache (
+                audio_hash TEXT PRIMARY KEY, transcript TEXT NOT NULL, audio_size INTEGER NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL, last_used_at REAL NOT NULL, hit_count INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        conn.execute(
+            "INSERT INTO transcript_cache (audio_hash, transcript, created_at, last_used_at) VALUES (?, ?, ?, ?)",
+            ("legacy", "Transcribed by an unknown engine.", time.time(), time.time())
+        )
+
+    init_database()
+
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(transcript_cache)")]
+    assert "asr_model" in columns
+    assert get_cached_transcript("legacy", MODEL) is None
+
+def test_unknown_hash_is_a_miss():
+    misses = get_cache_stats()["transcript_cache"]["misses"]
+
+    assert get_cached_transcript(_hash(), MODEL) is None
+    assert get_cache_stats()["transcript_cache"]["misses"] == misses + 1
+
+def test_expired_entries_are_not_served(monkeypatch):
+    audio_hash = _hash()
+    save_cached_transcript(audio_hash, MODEL, "Old meeting.", 10)
+    conn = get_db_connection()
+    with conn:
+        conn.execute("UPDATE transcript_cache SET created_at = ? WHERE audio_hash = ?", (time.time() - 2 * 86400, audio_hash))
+    monkeypatch.setattr(cache, "TRANSCRIPT_CACHE_MAX_AGE_DAYS", 1)
+
+    assert get_cached_transcript(audio_hash, MODEL) is None
+
+def test_least_recently_used_entries_are_evicted(monkeypatch):
+    conn = get_db_connection()
+    with conn:
+        conn.execute("DELETE FROM transcript_cache")
+    monkeypatch.setattr(cache, "TRANSCRIPT_CACHE_MAX_ENTRIES", 2)
+
+    first, second, third = _hash(), _hash(), _hash()
+    save_cached_transcript(first, MODEL, "First.", 1)
+    save_cached_transcript(second, MODEL, "Second.", 1)
+    time.sleep(0.01)
+    assert get_cached_transcript(first, MODEL) is not None
+    save_cached_transcript(third, MODEL, "Third.", 1)
+
+    assert get_cached_transcript(second, MODEL) is None
+    assert get_cached_transcript(first, MODEL) is not None
+    assert get_cached_transcript(third, MODEL) is not None
+
+def test_same_audio_is_transcribed_once(client, fake_assemblyai, fake_gemini):
+    content = os.urandom(2048)
+
+    first = _upload(client, content)
+    second = _upload(client, content)
+
+    assert first.status_code == second.status_code == 200
+    assert sum(1 for method, path in fake_assemblyai.state.requests if path == "/v2/upload") == 1
+    # The second meeting gets the cached speaker turns too
+    first_turns = client.get(f"/meeting/{first.json()['id']}/utterances").json()["utterances"]
+    second_turns = client.get(f"/meeting/{second.json()['id']}/utterances").json()["utterances"]
+    assert second_turns == first_turns
+    assert len(first_turns) == 4
+
+def test_different_audio_is_not_served_from_cache(client, fake_assemblyai, fake_gemini):
+    _upload(client, os.urandom(2048))
+    _upload(client, os.urandom(2048))
+
+    assert sum(1 for method, path in fake_assemblyai.state.requests if path == "/v2/upload") == 2
+
+def test_pipeline_lookups_run_on_the_database_pool(monkeypatch, fake_gemini, audio_file):
+    threads = []
+
+    def lookup(audio_hash, asr_model):
+        threads.append(threading.current_thread().name)
+        return {"text": "Speaker A: We agreed to ship on Friday.", "utterances": []}
+
+    monkeypatch.setattr(ai_service, "get_cached_transcript", lookup)
+    result = asyncio.run(ai_service.process_audio_and_generate_summary_async(audio_file, audio_hash=_hash()))
+
+    assert result["transcript_cached"] is True
+    assert threads[0].startswith("sqlite")
@@ -0,0 +1,60 @@
+from app.services.transcript_compaction import compact_transcript, speaker_lines
+
+UTTERANCES = [
+    {"speaker": "A", "start": 0, "end": 1500, "text": "Um, we should ship on Friday."},
+    {"speaker": "A", "start": 1600, "end": 2400, "text": "The docs are ready."},
+    {"speaker": "B", "start": 2600, "end": 3000, "text": "Okay."},
+    {"speaker": "B", "start": 3100, "end": 4200, "text": "I I will update the changelog."}
+]
+
+def test_grammatical_repeats_are_kept():
+    text = "I had had enough of it. He said that that was fine."
+
+    compacted, report = compact_transcript(text, level=1)
+
+    assert compacted == text
+    assert report["removed"]["stutters"] == 0
+
+def test_single_letter_and_filler_repeats_collapse():
+    compacted, report = compact_transcript("I I think we should, so so we ship it.", level=1)
+
+    assert compacted == "I think we should, so we ship it."
+    assert report["removed"]["stutters"] == 2
+
+def test_utterances_are_compacted_as_speaker_lines():
+    compacted, report = compact_transcript(
+        "Um, we should ship on Friday. The docs are ready. Okay. I I will update the changelog.", level=2, utterances=UTTERANCES
+    )
+
+    assert compacted == (
+        "Speaker A: We should ship on Friday. The docs are ready.\n"
+        "Speaker B: I will update the changelog."
+    )
+    assert report["removed"]["merged_turns"] == 1
+    assert report["removed"]["backchannels"] == 1
+
+def test_utterances_without_speakers_become_plain_lines():
+    utterances = [
+        {"speaker": None, "start": 0, "end": 900, "text": "First segment."},
+        {"speaker": None, "start": 900, "end": 1800, "text": ""},
+        {"speaker": None, "start": 1800, "end": 2700, "text": "Second segment."}
+    ]
+
+    assert speaker_lines(utterances) == "First segment.\nSecond segment."
+
+def test_fallback_transcripts_are_left_alone():
+    text = "[FALLBACK] um um sample transcript"
+
+    assert compact_transcript(text, level=2)[0] == text
+
+def test_tokens_before_are_measured_on_the_transcript_argument():
+    transcript = "Um, we should ship on Friday. The docs are ready. Okay. I I will update the changelog."
+
+    _, report = compact_transcript(transcript, level=0, utterances=UTTERANCES)
+
+    assert report["chars_before"] == len(transcript)
+    assert report["estimated_tokens_before"] == -(-len(transcript) // 4)
+    labelled = speaker_lines(UTTERANCES)
+    assert report["estimated_tokens_labelled"] == report["estimated_tokens_after"] == -(-len(labelled) // 4)
+    assert report["reduction"] < 0
+    assert "estimated_tokens_labelled" not in compact_transcript(transcript, level=0)[1]
@@ -0,0 +1,130 @@
+import time
+import uuid
+import asyncio
+import httpx
+import pytest
+from app.services import transcription_service
+from app.services.rate_limiter import assemblyai_limiter
+from app.services.transcription_service import (
+    transcribe_audio_async, close_assemblyai_client, TranscriptionCancelledError, TranscriptionTimeoutError
+)
+
+def transcribe(audio_file, **kwargs) -> dict:
+    async def run():
+        try:
+            return await transcribe_audio_async(audio_file, **kwargs)
+        finally:
+            await close_assemblyai_client()
+    return asyncio.run(run())
+
+def count(server, method: str, path_prefix: str) -> int:
+    return sum(1 for m, path in server.state.requests if m == method and path.startswith(path_prefix))
+
+def test_transcribes_with_speaker_turns(fake_assemblyai, audio_file):
+    result = transcribe(audio_file)
+
+    assert "release plan" in result["text"]
+    assert [u["speaker"] for u in result["utterances"]] == ["A", "B", "A", "B"]
+    assert result["utterances"][1]["start"] > result["utterances"][0]["end"]
+    assert count(fake_assemblyai, "POST", "/v2/upload") == 1
+
+def test_rate_limited_submit_is_retried(fake_assemblyai, audio_file):
+    fake_assemblyai.state.inject_fault("POST", "/v2/transcript", 429, count=2, retry_after=0)
+    rate_limited = assemblyai_limiter.stats["rate_limited"]
+
+    result = transcribe(audio_file)
+
+    assert "release plan" in result["text"]
+    assert count(fake_assemblyai, "POST", "/v2/transcript") == 3
+    assert assemblyai_limiter.stats["rate_limited"] == rate_limited + 2
+
+def test_retry_after_is_honoured(fake_assemblyai, audio_file):
+    fake_assemblyai.state.inject_fault("GET", "/v2/transcript/", 429, count=1, retry_after=1)
+
+    start = time.monotonic()
+    transcribe(audio_file)
+
+    assert time.monotonic() - start >= 1
+
+@pytest.mark.parametrize("method, path", [("POST", "/v2/upload"), ("GET", "/v2/transcript/")])
+def test_server_errors_on_idempotent_requests_are_retried(fake_assemblyai, audio_file, method, path):
+    fake_assemblyai.state.inject_fault(method, path, 503, count=2)
+
+    result = transcribe(audio_file)
+
+    assert "release plan" in result["text"]
+    assert count(fake_assemblyai, method, path) >= 3
+
+def test_persistent_server_errors_give_up(fake_assemblyai, audio_file):
+    fake_assemblyai.state.inject_fault("GET", "/v2/transcript/", 500, count=100)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        transcribe(audio_file)
+    assert count(fake_assemblyai, "GET", "/v2/transcript/") == transcription_service.ASSEMBLYAI_TRANSIENT_RETRIES + 1
+
+def test_submit_is_not_retried_on_server_error(fake_assemblyai, audio_file):
+    fake_assemblyai.state.inject_fault("POST", "/v2/transcript", 500, count=1)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        transcribe(audio_file)
+    assert count(fake_assemblyai, "POST", "/v2/transcript") == 1
+
+def test_deadline_argument_stops_polling(fake_assemblyai, audio_file):
+    fake_assemblyai.state.latency = 60
+
+    start = time.monotonic()
+    with pytest.raises(TranscriptionTimeoutError) as raised:
+        transcribe(audio_file, deadline_seconds=0.3)
+    assert time.monotonic() - start < 2
+    # The job keeps running at AssemblyAI; its id is what a retry re-attaches to
+    assert ("GET", f"/v2/transcript/{raised.value.transcript_id}") in fake_assemblyai.state.requests
+
+def test_configured_deadline_applies_by_default(fake_assemblyai, audio_file, monkeypatch):
+    fake_assemblyai.state.latency = 60
+    monkeypatch.setattr(transcription_service, "ASSEMBLYAI_DEADLINE_SECONDS", 0.3)
+
+    with pytest.raises(TranscriptionTimeoutError):
+        transcribe(audio_file)
+
+def test_deadline_falls_back_to_sample_transcript_when_enabled(fake_assemblyai, audio_file, monkeypatch):
+    fake_assemblyai.state.latency = 60
+    monkeypatch.setattr(transcription_service, "ASR_FALLBACK_ENABLED", True)
+
+    result = transcribe(audio_file, deadline_seconds=0.3)
+
+    assert result["text"].startswith("[FALLBACK]")
+    assert result["utterances"] == []
+
+def test_summarize_reports_a_deadline_as_504_without_fallback(client, fake_assemblyai, fake_gemini, monkeypatch):
+    fake_assemblyai.state.latency = 60
+    monkeypatch.setattr(transcription_service, "ASSEMBLYAI_DEADLINE_SECONDS", 0.3)
+    before = client.get("/meetings", params={"limit": 1}).json()
+
+    response = client.post("/meeting/summarize", files={"audio": ("standup.wav", uuid.uuid4().bytes, "audio/wav")})
+
+    assert response.status_code == 504
+    assert "at the deadline" in response.json()["detail"]
+    assert client.get("/meetings", params={"limit": 1}).json() == before
+    assert fake_gemini.state.calls == 0
+
+def test_disconnect_cancels_polling(fake_assemblyai, audio_file):
+    fake_assemblyai.state.latency = 60
+    checks = []
+
+    async def is_disconnected():
+        checks.append(1)
+        return len(checks) >= 2
+
+    start = time.monotonic()
+    with pytest.raises(TranscriptionCancelledError):
+        transcribe(audio_file, is_disconnected=is_disconnected)
+    assert len(checks) == 2
+    assert time.monotonic() - start < 2
+
+def test_progress_reports_status_changes(fake_assemblyai, audio_file):
+    stages = []
+    transcribe(audio_file, progress=lambda stage, **info: stages.append(stage))
+
+    assert stages[0] == "asr_uploading"
+    assert stages[-1] == "asr_completed"
+    assert len(stages) == len(set(stages))
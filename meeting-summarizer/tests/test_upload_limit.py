@@ -0,0 +1,62 @@
+import asyncio
+import main
+
+LIMIT = 1024 * 1024
+
+def _limit(monkeypatch):
+    monkeypatch.setattr(main, "MAX_UPLOAD_BYTES", LIMIT)
+    monkeypatch.setattr(main, "UPLOAD_FORM_OVERHEAD", 1024)
+
+def _chunked(total: int, chunk: int = 64 * 1024):
+    # A generator body is sent without a Content-Length header
+    sent = 0
+    while sent < total:
+        yield b"x" * min(chunk, total - sent)
+        sent += chunk
+
+def test_declared_content_length_over_limit_is_rejected(client, monkeypatch):
+    _limit(monkeypatch)
+    response = client.post("/meeting/summarize", content=b"x" * (LIMIT + 4096), headers={"content-type": "application/octet-stream"})
+    assert response.status_code == 413
+    assert "1 MB" in response.json()["detail"]
+
+def test_chunked_body_over_limit_is_rejected(client, monkeypatch):
+    _limit(monkeypatch)
+    response = client.post(
+        "/meeting/summarize",
+        content=_chunked(LIMIT + 4096),
+        headers={"content-type": "multipart/form-data; boundary=xyz"}
+    )
+    assert response.status_code == 413
+
+def test_chunked_body_under_limit_reaches_the_route(client, monkeypatch):
+    _limit(monkeypatch)
+    response = client.post(
+        "/meeting/summarize",
+        content=_chunked(1024),
+        headers={"content-type": "multipart/form-data; boundary=xyz"}
+    )
+    assert response.status_code != 413
+
+def test_body_stops_being_read_once_over_limit(monkeypatch):
+    _limit(monkeypatch)
+    reads = []
+
+    async def receive():
+        reads.append(1)
+        return {"type": "http.request", "body": b"x" * 256 * 1024, "more_body": True}
+
+    async def reading_app(scope, receive, send):
+        while True:
+            await receive()
+
+    messages = []
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "path": "/meeting/summarize", "headers": [(b"transfer-encoding", b"chunked")]}
+    asyncio.run(main.RequestSizeLimitMiddleware(reading_app)(scope, receive, send))
+
+    assert len(reads) == 5
+    assert messages[0]["type"] == "http.response.start"
+    assert messages[0]["status"] == 413
@@ -0,0 +1,184 @@
+"""Local stand-in for the AssemblyAI v2 REST API.
+
+Point the backend at it with ASSEMBLYAI_BASE_URL=http://127.0.0.1:8900 and any
+ASSEMBLYAI_API_KEY. Transcripts stay "queued"/"processing" for --latency seconds
+and then complete (or fail, with probability --failure-rate). With --unique, every
+transcript ends with its own id so downstream caches do not short-circuit benchmarks.
+Tests can make upcoming requests fail with server.state.inject_fault(...).
+
+    python tools/fake_assemblyai.py --port 8900 --latency 3
+"""
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SAMPLE_UTTERANCES = [
+    ("A", "Thanks everyone for joining, let's go through the release plan."),
+    ("B", "The API changes are done, I still need to update the docs."),
+    ("A", "Okay, we decided to ship version two next Friday."),
+    ("B", "I'll finish the docs by Wednesday."),
+]
+
+class FakeAssemblyAI:
+    def __init__(self, latency: float, failure_rate: float, unique: bool = False):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.unique = unique
+        self.uploads = {}
+        self.transcripts = {}
+        self.faults = []
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def inject_fault(self, method: str, path_prefix: str, status: int, count: int = 1, retry_after: float = None):
+        """Answer the next count requests matching method and path prefix with an error status"""
+        with self.lock:
+            self.faults.append({"method": method, "path": path_prefix, "status": status, "count": count, "retry_after": retry_after})
+
+    def take_fault(self, method: str, path: str):
+        with self.lock:
+            self.requests.append((method, path))
+            for fault in self.faults:
+                if fault["method"] == method and path.startswith(fault["path"]) and fault["count"] > 0:
+                    fault["count"] -= 1
+                    return fault
+        return None
+
+    def transcript_payload(self, transcript_id: str):
+        with self.lock:
+            record = self.transcripts.get(transcript_id)
+        if record is None:
+            return None
+
+        elapsed = time.time() - record["created_at"]
+        if elapsed < self.latency / 4:
+            status = "queued"
+        elif elapsed < self.latency:
+            status = "processing"
+        else:
+            status = "error" if record["fails"] else "completed"
+
+        payload = {"id": transcript_id, "status": status, "audio_url": record["audio_url"], "text": None, "utterances": None}
+        if status == "error":
+            payload["error"] = "Simulated transcription failure"
+        if status == "completed":
+            utterances = []
+            offset = 0
+            sample = SAMPLE_UTTERANCES + ([("A", f"Reference {transcript_id}.")] if self.unique else [])
+            for speaker, text in sample:
+                duration = 250 * len(text.split())
+                utterances.append({"speaker": speaker, "start": offset, "end": offset + duration, "text": text, "confidence": 0.95, "words": []})
+                offset += duration + 300
+            payload["utterances"] = utterances
+            payload["text"] = " ".join(text for _, text in sample)
+            payload["audio_duration"] = offset // 1000
+        return payload
+
+def make_handler(state: FakeAssemblyAI):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send_json(self, status: int, payload: dict, headers: dict = None):
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _read_body(self) -> bytes:
+            if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+                data = bytearray()
+                while True:
+                    size = int(self.rfile.readline().strip() or b"0", 16)
+                    if size == 0:
+                        self.rfile.readline()
+                        return bytes(data)
+                    data.extend(self.rfile.read(size))
+                    self.rfile.readline()
+            return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+        def _send_fault(self, method: str) -> bool:
+            fault = state.take_fault(method, self.path)
+            if fault is None:
+                return False
+            headers = {} if fault["retry_after"] is None else {"Retry-After": str(fault["retry_after"])}
+            self._send_json(fault["status"], {"error": f"Injected {fault['status']}"}, headers)
+            return True
+
+        def do_POST(self):
+            if not self.headers.get("authorization"):
+                self._send_json(401, {"error": "Authentication error, API token missing/invalid"})
+                return
+
+            body = self._read_body()
+            if self._send_fault("POST"):
+                return
+            if self.path == "/v2/upload":
+                upload_id = str(uuid.uuid4())
+                with state.lock:
+                    state.uploads[upload_id] = len(body)
+                self._send_json(200, {"upload_url": f"https://cdn.fake-assemblyai.local/upload/{upload_id}"})
+                return
+
+            if self.path == "/v2/transcript":
+                request = json.loads(body or b"{}")
+                transcript_id = str(uuid.uuid4())
+                with state.lock:
+                    state.transcripts[transcript_id] = {
+                        "audio_url": request.get("audio_url"),
+                        "created_at": time.time(),
+                        "fails": random.random() < state.failure_rate,
+                    }
+                self._send_json(200, state.transcript_payload(transcript_id))
+                return
+
+            self._send_json(404, {"error": f"Unknown path {self.path}"})
+
+        def do_GET(self):
+            if self._send_fault("GET"):
+                return
+            if self.path.startswith("/v2/transcript/"):
+                payload = state.transcript_payload(self.path.rsplit("/", 1)[1])
+                if payload is None:
+                    self._send_json(404, {"error": "Transcript not found"})
+                else:
+                    self._send_json(200, payload)
+                return
+
+            self._send_json(404, {"error": f"Unknown path {self.path}"})
+
+    return Handler
+
+def serve(port: int = 8900, latency: float = 3.0, failure_rate: float = 0.0, unique: bool = False):
+    """Start the fake server in a background thread and return it (call .shutdown() to stop)
+
+    port=0 picks a free port (see server.server_address); server.state is the FakeAssemblyAI.
+    """
+    state = FakeAssemblyAI(latency, failure_rate, unique)
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(state))
+    server.state = state
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency", type=float, default=3.0, help="seconds before a transcript completes")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="fraction of transcripts that end in error")
+    parser.add_argument("--unique", action="store_true", help="append the transcript id so every transcript differs")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), make_handler(FakeAssemblyAI(args.latency, args.failure_rate, args.unique)))
+    print(f"Fake AssemblyAI listening on http://127.0.0.1:{args.port}")
+    print("Press Ctrl+C to stop the server")
+    server.serve_forever()
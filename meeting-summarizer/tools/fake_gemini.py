@@ -0,0 +1,134 @@
+"""Local stand-in for the Gemini generateContent REST API.
+
+Point the backend at it with GEMINI_API_ENDPOINT=http://127.0.0.1:8901 and any
+GEMINI_API_KEY. Every call waits --latency seconds, then fails with HTTP 500
+(probability --failure-rate), answers 429 (probability --throttle-rate) or returns
+a summary JSON / plain text answer shaped like the real model's output.
+Streaming calls return the text in several chunks.
+
+    python tools/fake_gemini.py --port 8901 --latency 1.5
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+STREAM_CHUNKS = 4
+
+class FakeGemini:
+    def __init__(self, latency: float, failure_rate: float, throttle_rate: float):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.throttle_rate = throttle_rate
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def answer(self, prompt: str) -> str:
+        """Summary JSON for summary prompts, a short sentence for merge and chat prompts"""
+        words = re.findall(r"\w+", prompt)
+        if "valid JSON object" in prompt:
+            transcript = prompt.split("Transcript:", 1)[-1]
+            speakers = sorted(set(re.findall(r"Speaker ([A-Z0-9]+):", transcript))) or ["A"]
+            return json.dumps({
+                "summary": f"Discussion of {len(transcript.split())} words between {len(speakers)} speakers.",
+                "key_decisions": ["Ship version two next Friday"],
+                "action_items": [
+                    {"task": "Finish the docs", "assignee": f"Speaker {speakers[-1]}", "deadline": "Wednesday"}
+                ]
+            })
+        return f"Stub answer based on {len(words)} words of context."
+
+    @staticmethod
+    def payload(text: str, prompt_tokens: int, response_tokens: int) -> dict:
+        return {
+            "candidates": [{"content": {"parts": [{"text": text}], "role": "model"}, "finishReason": "STOP", "index": 0}],
+            "usageMetadata": {
+                "promptTokenCount": prompt_tokens,
+                "candidatesTokenCount": response_tokens,
+                "totalTokenCount": prompt_tokens + response_tokens
+            }
+        }
+
+def make_handler(state: FakeGemini):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send_json(self, status: int, payload):
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            path = self.path.split("?", 1)[0]
+            if not (path.endswith(":generateContent") or path.endswith(":streamGenerateContent")):
+                self._send_json(404, {"error": {"code": 404, "message": f"Unknown path {self.path}", "status": "NOT_FOUND"}})
+                return
+
+            with state.lock:
+                state.calls += 1
+            time.sleep(state.latency)
+
+            roll = random.random()
+            if roll < state.failure_rate:
+                self._send_json(500, {"error": {"code": 500, "message": "Simulated internal error", "status": "INTERNAL"}})
+                return
+            if roll < state.failure_rate + state.throttle_rate:
+                self._send_json(429, {"error": {"code": 429, "message": "Resource has been exhausted (simulated)", "status": "RESOURCE_EXHAUSTED"}})
+                return
+
+            request = json.loads(body or b"{}")
+            prompt = "".join(
+                part.get("text", "") for content in request.get("contents", []) for part in content.get("parts", [])
+            )
+            text = state.answer(prompt)
+            prompt_tokens = max(1, len(prompt) // 4)
+            response_tokens = max(1, len(text) // 4)
+
+            if path.endswith(":generateContent"):
+                self._send_json(200, FakeGemini.payload(text, prompt_tokens, response_tokens))
+                return
+
+            # streamGenerateContent over REST: one JSON array whose elements are partial responses
+            size = -(-len(text) // STREAM_CHUNKS)
+            pieces = [text[index:index + size] for index in range(0, len(text), size)]
+            chunks = [
+                FakeGemini.payload(piece, prompt_tokens, response_tokens if index == len(pieces) - 1 else 0)
+                for index, piece in enumerate(pieces)
+            ]
+            self._send_json(200, chunks)
+
+    return Handler
+
+def serve(port: int = 8901, latency: float = 1.0, failure_rate: float = 0.0, throttle_rate: float = 0.0):
+    """Start the fake server in a background thread and return it (call .shutdown() to stop)
+
+    port=0 picks a free port (see server.server_address); server.state.calls counts model calls.
+    """
+    state = FakeGemini(latency, failure_rate, throttle_rate)
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(state))
+    server.state = state
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8901)
+    parser.add_argument("--latency", type=float, default=1.0, help="seconds before each response")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="fraction of calls answered with HTTP 500")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="fraction of calls answered with HTTP 429")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), make_handler(FakeGemini(args.latency, args.failure_rate, args.throttle_rate)))
+    print(f"Fake Gemini listening on http://127.0.0.1:{args.port}")
+    print("Press Ctrl+C to stop the server")
+    server.serve_forever()